@@ -7,6 +7,8 @@ from flask import Flask, render_template
 from backend.routes.api import api_bp
 from backend.config import Config
 from config.logging import setup_logging
+from config.job_events import job_events, load_recorded_jobs
+from config.job_store import get_job_store
 
 app = Flask(__name__, template_folder="../templates", static_folder="../static")
 app.config.from_object(Config)
@@ -14,9 +16,34 @@ app.config.from_object(Config)
 # Initialize directories
 Config.init_dirs()
 
+# Make the jobs of earlier runs known to /api/status and /api/events
+load_recorded_jobs()
+
+# With a separate job runner process, receive its job events through the job store
+if Config.JOB_RUNNER_MODE == "process":
+    job_events.attach_store(get_job_store())
+
 # Register API blueprint
 app.register_blueprint(api_bp, url_prefix="/api")
 
+_driver_pools_started = False
+
+@app.before_request
+def start_driver_pools():
+    """
+    In thread mode, jobs run in this process: pre-warm its driver pools when it serves its first request.
+    Doing it here instead of at import keeps selenium out of the app's start-up, and the reloader's
+    watcher process, which never serves requests, does not open the LinkedIn profile.
+    In process mode the job runner pre-warms its own pools.
+    """
+    global _driver_pools_started
+    if _driver_pools_started or Config.JOB_RUNNER_MODE != "thread":
+        return
+    _driver_pools_started = True
+    from backend.scripts.selenium.driver_pool import prewarm_driver_pools
+
+    prewarm_driver_pools()
+
 @app.route("/")
 def index():
     return render_template("index.html")
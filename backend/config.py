@@ -11,6 +11,7 @@ class Config:
     LOG_PREFIX = "Log_File"
     SCRIPTS_PATH = os.path.join(BASE_DIR, "scripts")
     TEMP_PATH = os.path.join(BASE_DIR, "temp")  # New temp folder
+    CACHE_PATH = os.path.join(BASE_DIR, "data", "cache")  # Persistent result caches shared by all campaigns
 
     # Agent Prompts Path
     AGENT_PROMPTS_PATH = os.path.join(SCRIPTS_PATH, "openai", "agent_prompts.json")
@@ -24,6 +25,21 @@ class Config:
     VERIFIED_EMAILS_PATH = os.path.join(DATA_CSV_PATH, "verified")
     ICEBREAKERS_PATH = os.path.join(DATA_CSV_PATH, "icebreakers")
 
+    # Format of intermediate stage checkpoints: "csv", "parquet" (zstd) or "arrow" (IPC, memory-mapped reads).
+    # Final stage outputs are always exported as CSV as well.
+    STAGE_FILE_FORMAT = os.getenv("STAGE_FILE_FORMAT", "csv").lower()
+
+    # Persistent result caches (config/cache.py)
+    CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", os.path.join(CACHE_PATH, "enrichment_cache.sqlite"))
+    COMPANY_CACHE_TTL_DAYS = float(os.getenv("COMPANY_CACHE_TTL_DAYS", "90"))   # Days before a company's About page is re-fetched
+    EMAIL_FINDER_CACHE_TTL_DAYS = float(os.getenv("EMAIL_FINDER_CACHE_TTL_DAYS", "180"))    # Days a found email is reused
+    EMAIL_FINDER_NEGATIVE_TTL_DAYS = float(os.getenv("EMAIL_FINDER_NEGATIVE_TTL_DAYS", "30"))  # Days a "no_result" is reused
+    VERIFY_CACHE_VALID_TTL_DAYS = float(os.getenv("VERIFY_CACHE_VALID_TTL_DAYS", "60"))       # Days a "Valid" verification is reused
+    VERIFY_CACHE_INVALID_TTL_DAYS = float(os.getenv("VERIFY_CACHE_INVALID_TTL_DAYS", "180"))  # Days an "Invalid" verification is reused
+    VERIFY_CACHE_CATCH_ALL_TTL_DAYS = float(os.getenv("VERIFY_CACHE_CATCH_ALL_TTL_DAYS", "90"))  # Days a "Catch-All" verification is reused
+    CATCH_ALL_DOMAIN_TTL_DAYS = float(os.getenv("CATCH_ALL_DOMAIN_TTL_DAYS", "90"))          # Days a domain is known to be catch-all
+    PRECHECK_SKIP = [label.strip() for label in os.getenv("PRECHECK_SKIP", "invalid_syntax,disposable,role").split(",") if label.strip()]  # Pre-check labels not sent to the verifier
+
     # Tor configuration
     TOR_BASE_PATH = os.path.join(ROOT_DIR, "config", "tor")
     OS_TYPE = platform.system().lower()
@@ -55,6 +71,77 @@ class Config:
     CHROMEDRIVER_PATH = None # os.getenv("CHROMEDRIVER_PATH", CHROMEDRIVER_PATH)
     GECKODRIVER_PATH = None # os.getenv("GECKODRIVER_PATH", GECKODRIVER_PATH)
     
+    # WebDriver pool (backend/scripts/selenium/driver_pool.py)
+    DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))                  # Max browsers per pool kind ("linkedin" is always 1)
+    DRIVER_POOL_MAX_AGE = int(os.getenv("DRIVER_POOL_MAX_AGE", "1800"))         # Seconds before a browser is recycled
+    DRIVER_POOL_MAX_USES = int(os.getenv("DRIVER_POOL_MAX_USES", "50"))         # Leases before a browser is recycled
+    DRIVER_POOL_LEASE_TIMEOUT = int(os.getenv("DRIVER_POOL_LEASE_TIMEOUT", "600"))  # Seconds a job waits for a free browser
+    DRIVER_POOL_HEADLESS = os.getenv("DRIVER_POOL_HEADLESS", "false").lower() == "true"
+    DRIVER_POOL_PREWARM = [kind.strip() for kind in os.getenv("DRIVER_POOL_PREWARM", "linkedin").split(",") if kind.strip()]  # Pools started at app start
+    DRIVER_LEAN_PROFILE = os.getenv("DRIVER_LEAN_PROFILE", "false").lower() == "true"  # Block images/media/fonts and load pages eagerly
+
+    # Browser-free HTTP redirect resolver (backend/scripts/sales_navigator_scrape/company_url_resolver.py)
+    COMPANY_URL_HTTP_RESOLVER = os.getenv("COMPANY_URL_HTTP_RESOLVER", "true").lower() == "true"  # Step 4 resolves redirects over HTTP first
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "4"))                      # Kept-alive connections per host
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))                       # Seconds per HTTP request
+
+    # Email verifier backends for Step 7 (backend/scripts/sales_navigator_scrape/verify_emails.py)
+    VERIFIER_BACKEND = os.getenv("VERIFIER_BACKEND", "browser")                 # Default backend: "browser", "api" or "smtp"
+    VERIFIER_CONCURRENCY = int(os.getenv("VERIFIER_CONCURRENCY", "20"))         # Addresses checked at the same time by verify_many
+    VERIFIER_API_URL = os.getenv("VERIFIER_API_URL", "https://api.neverbounce.com/v4/single/check")  # NeverBounce-style single-check endpoint
+    VERIFIER_API_KEY = os.getenv("VERIFIER_API_KEY", "")
+    VERIFIER_API_RATE_LIMIT = float(os.getenv("VERIFIER_API_RATE_LIMIT", "10"))  # API requests per second (0 = unlimited)
+    VERIFY_CHECKPOINT_ROWS = int(os.getenv("VERIFY_CHECKPOINT_ROWS", "100"))    # Concurrent Step 7 saves after this many results...
+    VERIFY_CHECKPOINT_SECONDS = float(os.getenv("VERIFY_CHECKPOINT_SECONDS", "10"))  # ...or after this many seconds
+    SMTP_PORT = int(os.getenv("SMTP_PORT", "25"))                               # Port of the mail servers probed by the SMTP backend
+    SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "10"))                       # Seconds per SMTP connection and reply
+    SMTP_HELO_HOST = os.getenv("SMTP_HELO_HOST", "localhost")                   # Name sent with EHLO; use a host name that resolves to your IP
+    SMTP_MAIL_FROM = os.getenv("SMTP_MAIL_FROM", f"verify@{SMTP_HELO_HOST}")    # Envelope sender of the probes
+    SMTP_RATE_LIMIT = float(os.getenv("SMTP_RATE_LIMIT", "5"))                  # SMTP probes started per second (0 = unlimited)
+
+    # Logging (config/logging.py) and log reads (/api/logs)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()                          # DEBUG also logs Step 8 prompts and generated icebreakers
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024)))       # Size that rolls a log file over (0 = no size limit)
+    LOG_ROTATE_SECONDS = float(os.getenv("LOG_ROTATE_SECONDS", "86400"))        # Age that rolls a log file over (0 = no age limit)
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "10"))                 # Gzipped rolled-over files kept per log
+    LOG_RETENTION_DAYS = float(os.getenv("LOG_RETENTION_DAYS", "30"))           # Logs not written for this long are deleted at start-up (0 = keep)
+    LOG_TAIL_MAX_LINES = int(os.getenv("LOG_TAIL_MAX_LINES", "5000"))           # Largest accepted tail of /api/logs/<name>
+    LOG_TAIL_MAX_SCAN_BYTES = int(os.getenv("LOG_TAIL_MAX_SCAN_BYTES", str(512 * 1024 * 1024)))  # Bytes searched backwards for matching lines
+
+    # Uploads (/api/upload)
+    UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))   # Bytes read from the request body at once
+
+    # File listings and previews (/api/files)
+    FILES_PAGE_SIZE = int(os.getenv("FILES_PAGE_SIZE", "100"))                   # Files per page when per_page is not given
+    FILES_MAX_PAGE_SIZE = int(os.getenv("FILES_MAX_PAGE_SIZE", "1000"))          # Largest accepted per_page
+    PREVIEW_INDEX_STRIDE = int(os.getenv("PREVIEW_INDEX_STRIDE", "1000"))        # Data rows between two offsets of a preview row index
+    PREVIEW_MAX_ROWS = int(os.getenv("PREVIEW_MAX_ROWS", "500"))                 # Largest accepted preview limit
+
+    # Job history (/api/jobs) and response compression
+    JOBS_PAGE_SIZE = int(os.getenv("JOBS_PAGE_SIZE", "50"))                     # Jobs per page of /api/jobs when per_page is not given
+    JOBS_RETAINED = int(os.getenv("JOBS_RETAINED", "200"))                      # Job records kept per step; older finished ones are archived
+    JOBS_LOCK_TIMEOUT = float(os.getenv("JOBS_LOCK_TIMEOUT", "30"))             # Seconds to wait for the lock of a jobs_stepX.json file
+    COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))           # Smaller responses are sent uncompressed
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))            # gzip level (1 fastest - 9 smallest)
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))    # brotli quality (0 fastest - 11 smallest), if brotli is installed
+
+    # Job event stream (/api/events) and status snapshot (/api/status)
+    SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))     # Keep-alive comment interval while nothing changes
+    SSE_MAX_TRACKED_JOBS = int(os.getenv("SSE_MAX_TRACKED_JOBS", "200"))        # Jobs whose latest state is kept for new subscribers
+    STATUS_RECENT_JOBS = int(os.getenv("STATUS_RECENT_JOBS", "10"))             # Finished jobs per step listed by /api/status
+
+    # Production serving (backend/wsgi.py) and the job runner process (backend/job_runner.py)
+    JOB_RUNNER_MODE = os.getenv("JOB_RUNNER_MODE", "thread").lower()            # "thread": steps 5-8 run in the web process; "process": queued for the job runner
+    JOB_DB_PATH = os.getenv("JOB_DB_PATH", os.path.join(TEMP_PATH, "job_store.sqlite"))  # Job queue and cross-process job events
+    JOB_RUNNER_MAX_JOBS = int(os.getenv("JOB_RUNNER_MAX_JOBS", "4"))            # Jobs the runner executes at once
+    JOB_RUNNER_POLL_SECONDS = float(os.getenv("JOB_RUNNER_POLL_SECONDS", "1"))  # Seconds between checks of the job queue
+    JOB_EVENT_POLL_SECONDS = float(os.getenv("JOB_EVENT_POLL_SECONDS", "0.5"))  # Seconds between reads of other processes' job events
+    JOB_EVENT_MAX_AGE = int(os.getenv("JOB_EVENT_MAX_AGE", "86400"))            # Seconds stored job events are kept
+    JOB_EVENT_PURGE_SECONDS = int(os.getenv("JOB_EVENT_PURGE_SECONDS", "3600")) # Seconds between purges of old job events by the job runner
+    WSGI_BIND = os.getenv("WSGI_BIND", "0.0.0.0:5000")                          # Address of the production server
+    WSGI_WORKERS = int(os.getenv("WSGI_WORKERS", "2"))                          # gunicorn worker processes
+    WSGI_THREADS = int(os.getenv("WSGI_THREADS", "16"))                         # Threads per worker (each open /api/events stream holds one)
+
     # Flask settings
     SECRET_KEY = os.urandom(24)
     
@@ -65,6 +152,7 @@ class Config:
             Config.DATA_CSV_PATH,
             Config.LOG_PATH,
             Config.TEMP_PATH,
+            Config.CACHE_PATH,
             Config.FILTERED_URL_PATH,
             Config.UPDATED_NAME_PATH,
             Config.UPDATED_URL_PATH,
@@ -0,0 +1,20 @@
+# gunicorn settings for the production server: gunicorn -c backend/gunicorn.conf.py backend.wsgi:app
+import os
+
+os.environ.setdefault("JOB_RUNNER_MODE", "process")
+
+from backend.config import Config
+
+bind = Config.WSGI_BIND
+workers = Config.WSGI_WORKERS
+# Threaded workers: every open /api/events stream holds a thread, not a whole worker
+worker_class = "gthread"
+threads = Config.WSGI_THREADS
+timeout = 60
+# No preload_app: each worker imports the app itself and starts its own job event replay thread
+
+
+def post_worker_init(worker):
+    from config.logging import setup_logging
+
+    setup_logging()
@@ -0,0 +1,137 @@
+"""
+Execution of the background steps 5-8.
+
+`start_job` is called by the API once a job is recorded. How the job runs depends on Config.JOB_RUNNER_MODE:
+- "thread" (default, development server): in a daemon thread of the web process.
+- "process" (production, see backend/wsgi.py): the job is queued in the JobStore and executed by a
+  separate job runner process, so pandas and browser work never share an interpreter with request handling:
+
+    python -m backend.job_runner
+
+The runner claims queued jobs, runs up to Config.JOB_RUNNER_MAX_JOBS at once and publishes their progress
+through the job store, from which every web worker replays it into `/api/events` and `/api/status`.
+"""
+import os
+import sys
+import socket
+import threading
+import time
+import logging
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.config import Config
+from config.job_events import job_events
+from config.job_functions import update_job_status
+from config.job_store import get_job_store
+from backend.step_registry import get_step_handler
+
+def mark_job_failed(step, job_id):
+    """
+    Marks a job as failed in the jobs_stepX.json file and on the job event stream.
+
+    Parameters:
+        step (int): Step number (5, 6, 7, or 8).
+        job_id (str): UUID of the job.
+    """
+    update_job_status(f"step{step}", job_id, "failed")
+    job_events.publish(f"step{step}", job_id, {"status": "failed", "progress": "Failed"})
+
+def execute_job(step, job_id, params):
+    """
+    Runs one step job and records a failure if the step returns None or raises.
+
+    Parameters:
+        step (int): Step number (5, 6, 7, or 8).
+        job_id (str): UUID of the job.
+        params (dict): Keyword arguments of the step's processing function (without job_id).
+
+    Returns:
+        str: 'finished' or 'failed'.
+    """
+    try:
+        result_df = get_step_handler(step)(**params, job_id=job_id)
+        if result_df is None:
+            mark_job_failed(step, job_id)
+            with open(os.path.join(Config.TEMP_PATH, f"step{step}_error_{job_id}.txt"), "w") as f:
+                f.write(f"Step {step} execution failed, Job Id: {job_id}")
+            return "failed"
+        return "finished"
+    except Exception as e:
+        mark_job_failed(step, job_id)
+        logging.error(f"Exception in Step {step} background job {job_id}: {e}")
+        print(f"Exception in Step {step} background job {job_id}: {e}")
+        return "failed"
+
+def start_job(step, job_id, params):
+    """
+    Starts a recorded step job in a background thread, or queues it for the job runner process
+    when Config.JOB_RUNNER_MODE is "process".
+
+    Parameters:
+        step (int): Step number (5, 6, 7, or 8).
+        job_id (str): UUID of the job.
+        params (dict): JSON-serializable keyword arguments of the step's processing function.
+    """
+    if Config.JOB_RUNNER_MODE == "process":
+        get_job_store().enqueue(step, job_id, params)
+        logging.info(f"Queued Step {step} job {job_id} for the job runner")
+    else:
+        threading.Thread(target=execute_job, args=(step, job_id, params), daemon=True).start()
+
+def run_job_runner(worker_id=None, max_jobs=None, poll_interval=None):
+    """
+    Executes the queued step jobs until the process is stopped.
+    Jobs this runner had claimed before a restart are queued again and resume from their checkpoints.
+
+    Parameters:
+        worker_id (str, optional): Name of this runner in the queue. Defaults to "<host>-runner".
+        max_jobs (int, optional): Jobs run at once. Defaults to Config.JOB_RUNNER_MAX_JOBS.
+        poll_interval (float, optional): Seconds between queue checks. Defaults to Config.JOB_RUNNER_POLL_SECONDS.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-runner"
+    max_jobs = max_jobs or Config.JOB_RUNNER_MAX_JOBS
+    poll_interval = poll_interval or Config.JOB_RUNNER_POLL_SECONDS
+    job_store = get_job_store()
+    job_events.attach_store(job_store)
+    # The runner executes the jobs, so it holds the warm browsers
+    from backend.scripts.selenium.driver_pool import prewarm_driver_pools
+    prewarm_driver_pools()
+
+    requeued = job_store.requeue_claimed(worker_id)
+    job_store.purge_events(Config.JOB_EVENT_MAX_AGE)
+    last_purge = time.monotonic()
+    logging.info(f"Job runner {worker_id} started ({max_jobs} jobs at once, {requeued} interrupted jobs requeued)")
+    print(f"Job runner {worker_id} waiting for jobs in {job_store.db_path}")
+
+    slots = threading.Semaphore(max_jobs)
+
+    def run_claimed(step, job_id, params):
+        try:
+            job_store.finish(job_id, execute_job(step, job_id, params))
+        finally:
+            slots.release()
+
+    while True:
+        # Every progress update adds a job event, so old ones are purged while the runner stays up
+        if time.monotonic() - last_purge >= Config.JOB_EVENT_PURGE_SECONDS:
+            purged = job_store.purge_events(Config.JOB_EVENT_MAX_AGE)
+            last_purge = time.monotonic()
+            logging.info(f"Purged {purged} job events older than {Config.JOB_EVENT_MAX_AGE} seconds")
+        slots.acquire()
+        claimed = job_store.claim_next(worker_id)
+        if claimed is None:
+            slots.release()
+            time.sleep(poll_interval)
+            continue
+        step, job_id, params = claimed
+        logging.info(f"Job runner {worker_id} starts Step {step} job {job_id}")
+        threading.Thread(target=run_claimed, args=(step, job_id, params), daemon=True).start()
+
+if __name__ == "__main__":
+    from config.logging import setup_logging
+
+    setup_logging()
+    Config.init_dirs()
+    run_job_runner()
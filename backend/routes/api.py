@@ -1,470 +1,117 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, send_file
 import os
 import json
-import threading
+import hashlib
 import uuid
 from backend.config import Config
-from backend.scripts.sales_navigator_scrape.navigators_scrape_companyID import parse_sales_navigator
-from backend.scripts.sales_navigator_scrape.remove_empty_companyurl import remove_empty_company_rows
-from backend.scripts.openai.correctname_finder import process_csv
-from backend.scripts.sales_navigator_scrape.extract_company_about_website import process_csv_and_extract_info
-from backend.scripts.sales_navigator_scrape.email_finder import process_csv_and_find_emails
-from backend.scripts.sales_navigator_scrape.verify_emails import process_csv_and_verify_emails
-from backend.scripts.openai.icebreaker_generator import process_csv_and_generate_icebreaker
+from config.job_events import job_events
+from config.job_functions import format_progress_message, create_job, find_job, read_progress, read_jobs, edit_jobs
+from config.csv_upload import receive_csv_upload
+from config.file_metadata import read_metadata, file_stats
+from config.csv_preview import preview_csv, window_checkpoint_for
+from config.log_reader import read_log_tail
+from config.compression import choose_encoding, compress_chunks, compress_response
+from backend.step_registry import STEPS, SYNC, async_steps, get_step_handler, input_columns_for_folder, processed_markers
+from backend.job_runner import start_job
 
 api_bp = Blueprint("api", __name__)
 
-def update_job_status(step, job_id, status):
+@api_bp.after_request
+def compress(response):
+    """Compresses JSON, CSV and text responses for clients that accept gzip or brotli (see config/compression.py)."""
+    return compress_response(response, request.accept_encodings)
+
+def data_folder_path(folder):
     """
-    Updates the status of a job in the jobs_stepX.json file.
-    
+    Resolves a folder name of the API ('csv' for the root data CSV path, otherwise a subfolder of it).
+
     Parameters:
-        step (int): Step number (5, 6, 7, or 8).
-        job_id (str): UUID of the job.
-        status (str): New status ('running', 'completed', or 'stopped').
-    """
-    # Construct the path to the JSON file that stores job information for this step.
-    jobs_file = os.path.join(Config.TEMP_PATH, f"jobs_step{step}.json")
-    try:
-        # Ensure the temporary directory for job files exists.
-        os.makedirs(Config.TEMP_PATH, exist_ok=True)
+        folder (str): Folder name from the request.
 
-        # Load existing jobs if the file exists, otherwise start with an empty list.
-        if os.path.exists(jobs_file):
-            with open(jobs_file, "r") as f:
-                jobs = json.load(f)
-        else:
-            jobs = []
-
-        # Find the job by its ID and update its status.
-        for job in jobs:
-            if job["job_id"] == job_id:
-                job["status"] = status
-                job_found = True
-                break
-      
-        # If a new job (not yet in the list) is being marked (e.g. as 'failed' immediately),
-        # it might not be found. This path is less common as jobs are usually added first.
-        # However, to be robust, one might consider adding it if not found and status is 'failed' or 'completed'.
-        # For now, it only updates existing jobs.
-
-        # Write the updated list of jobs back to the JSON file.
-        with open(jobs_file, "w") as f:
-            json.dump(jobs, f, indent=2)
-    except Exception as e:
-        # Log any errors encountered during the status update.
-        print(f"Error updating job status for step {step}, job {job_id}: {e}")
+    Returns:
+        str or None: Absolute folder path, or None if it points outside the data directory.
+    """
+    root = os.path.abspath(Config.DATA_CSV_PATH)
+    folder_path = root if folder in (None, "", "csv") else os.path.abspath(os.path.join(root, folder))
+    if folder_path != root and not folder_path.startswith(root + os.sep):
+        return None
+    return folder_path
 
 @api_bp.route("/upload", methods=["POST"])
 def upload_file():
     """
-    Handles file uploads. Expects a file in the 'file' part of a multipart/form-data request.
-    Saves the uploaded file to the directory specified by Config.DATA_CSV_PATH.
+    Streams an uploaded CSV to disk in chunks (see config/csv_upload.py). Accepts a multipart/form-data
+    request with the file in the 'file' part, or the raw file as the body with a 'filename' query parameter.
+    The optional 'folder' query parameter selects the destination ('csv', the default, or a subfolder);
+    the header must contain the columns of the steps that read from that folder.
+    Returns the file's metadata: row count, columns, size and SHA-256.
     """
-    # Check if a file was included in the request.
-    if "file" not in request.files:
-        return jsonify({"error": "No file provided"}), 400
+    folder = request.args.get("folder", "csv")
+    folder_path = data_folder_path(folder)
+    if folder_path is None or not os.path.isdir(folder_path):
+        return jsonify({"error": f"Unknown upload folder '{folder}'"}), 400
 
-    file = request.files["file"]
-
-    # Check if a filename was provided (i.e., a file was actually selected).
-    if file.filename == "":
-        return jsonify({"error": "No file selected"}), 400
-
-    # Construct the full path to save the file.
-    file_path = os.path.join(Config.DATA_CSV_PATH, file.filename)
-    # Save the file to the designated path.
-    file.save(file_path)
+    try:
+        metadata = receive_csv_upload(
+            request.stream,
+            request.mimetype,
+            request.mimetype_params,
+            folder_path,
+            filename=request.args.get("filename"),
+            required_columns=input_columns_for_folder(folder_path),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": f"Upload failed: {str(e)}"}), 500
 
-    return jsonify({"message": f"File {file.filename} uploaded successfully", "path": file_path}), 200
+    file_path = os.path.join(folder_path, metadata["file"])
+    return jsonify({"message": f"File {metadata['file']} uploaded successfully", "path": file_path, "metadata": metadata}), 200
 
 @api_bp.route("/steps/<int:step>", methods=["POST"])
 def run_step(step):
     """
-    Main endpoint to trigger various data processing steps.
-    The behavior depends on the 'step' number provided in the URL.
-    Steps 1, 2, 3 are synchronous.
-    Steps 5, 6, 7, 8 are asynchronous, run in background threads, and their status can be tracked.
+    Runs a pipeline step declared in backend/step_registry.py.
+    The request body is validated against the step's definition. Sync steps (1-3) run in the request
+    and return the number of rows processed; async steps (5-8) are recorded as a job, started in the
+    background (see backend/job_runner.py) and return the job ID for progress tracking.
     """
+    definition = STEPS.get(step)
+    if definition is None:
+        return jsonify({"error": "Invalid step number provided"}), 400
     try:
-        # Step 1: Parse Sales Navigator HTML content to extract company IDs.
-        if step == 1:
-            # Expect JSON with HTML content and output filename
-            data = request.get_json()
-            if not data or "html_content" not in data or "output_file" not in data:
-                return jsonify({"error": "Missing html_content or output_file"}), 400
-            
-            # Temporarily save the HTML content from the request to a file.
-            temp_file = os.path.join(Config.TEMP_PATH, "Sales_Navigator.txt")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(data["html_content"])
-            
-            # Run the script
-            output_path = Config.DATA_CSV_PATH # Base path for output CSVs
-            # Call the script to parse the HTML and generate a CSV.
-            result_df = parse_sales_navigator(temp_file, data["output_file"], output_path)
-            
+        data = request.get_json(silent=True)
+        error = definition.check_request(data)
+        if error:
+            return jsonify({"error": error}), 400
+        args, kwargs, output_path = definition.build_call(data)
+
+        # Known input metadata (from the upload) lets a job fail fast instead of in the background
+        if definition.mode != SYNC and definition.input_columns:
+            metadata = read_metadata(kwargs["input_csv"])
+            missing = [column for column in definition.input_columns if metadata and column not in metadata["columns"]]
+            if missing:
+                return jsonify({"error": f"Input file is missing required columns for Step {step}: {', '.join(missing)}"}), 400
+
+        if definition.mode == SYNC:
+            result_df = get_step_handler(step)(*args, **kwargs)
             if result_df is None: # Script indicates failure if it returns None
-                return jsonify({"error": "Script execution failed for Step 1", "status": "failed"}), 500
-            
+                return jsonify({"error": f"Step {step} execution failed", "status": "failed"}), 500
             return jsonify({
-                "message": f"Step 1 completed. Output saved to {os.path.join(output_path, data['output_file'])}",
+                "message": f"Step {step} completed. {definition.output_label} saved to {output_path}",
                 "status": "success",
                 "rows_processed": len(result_df)
             }), 200
-        
-        # Step 2: Remove rows with empty company URLs from a CSV.
-        elif step == 2:
-            # Expect JSON with input CSV filename
-            data = request.get_json()
-            if not data or "input_csv" not in data:
-                return jsonify({"error": "Missing input_csv for Step 2"}), 400
-            
-            input_csv = data["input_csv"]
-            # Define output filename and call the processing script.
-            output_csv = f"Filtered_{input_csv}"
-            result_df = remove_empty_company_rows(input_csv, output_csv)
-            
-            if result_df is None:
-                return jsonify({"error": "Step 2 execution failed", "status": "failed"}), 500
-            
-            # Output is saved in a 'filtered_url' subdirectory.            
-            return jsonify({
-                "message": f"Step 2 completed. Filtered CSV saved to {os.path.join(Config.DATA_CSV_PATH, 'filtered_url', output_csv)}",
-                "status": "success",
-                "rows_processed": len(result_df)
-            }), 200
-        
-        # Step 3: Process CSV to correct/update names (likely using OpenAI).
-        elif step == 3:
-            # Expect JSON with input CSV filename
-            data = request.get_json()
-            if not data or "input_csv" not in data:
-                return jsonify({"error": "Missing input_csv for Step 3"}), 400
-            
-            input_csv = data["input_csv"]
-            # Define output filename and call the processing script.
-            output_csv = f"Updated_Name_{input_csv}"
-            result_df = process_csv(input_csv, output_csv) # Script from openai.correctname_finder
-            
-            if result_df is None:
-                return jsonify({"error": "Step 3 execution failed", "status": "failed"}), 500
-            
-            # Output is saved in an 'updated_name' subdirectory.
-            return jsonify({
-                "message": f"Step 3 completed. Updated CSV saved to {os.path.join(Config.DATA_CSV_PATH, 'updated_name', output_csv)}",
-                "status": "success",
-                "rows_processed": len(result_df)
-            }), 200
-
-        # Step 4: (Currently Commented Out) Intended for updating company URLs.        
-        # elif step == 4:
-        #     # Expect JSON with input CSV filename
-        #     data = request.get_json()
-        #     if not data or "input_csv" not in data:
-        #         return jsonify({"error": "Missing input_csv"}), 400
-        #     
-        #     input_csv = data["input_csv"]
-        #     max_rows = data.get("max_rows", 2000)
-        #     batch_size = data.get("batch_size", 10)
-        #     output_csv = f"Updated_URL_{input_csv}"
-        #     input_path = os.path.join(Config.UPDATED_NAME_PATH, input_csv)
-        #     output_path = os.path.join(Config.UPDATED_URL_PATH, output_csv)
-        #     # Remove stop signal if it exists
-        #     stop_file = os.path.join(Config.TEMP_PATH, "stop_step4.txt")
-        #     if os.path.exists(stop_file):
-        #         os.remove(stop_file)
-        #     result_df = process_csv_and_update_urls(input_path, output_path, max_rows=max_rows, batch_size=batch_size)
-        #     if result_df is None:
-        #         return jsonify({"error": "Step 4 execution failed", "status": "failed"}), 500
-        #     
-        #     return jsonify({
-        #         "message": f"Step 4 completed. Updated CSV saved to {output_path}",
-        #         "status": "success",
-        #         "rows_processed": len(result_df)
-        #     }), 200
-        
-        # Step 5: Extract company domain and about information (Asynchronous).
-        elif step == 5:
-            data = request.get_json()
-            if not data or "input_csv" not in data:
-                return jsonify({"error": "Missing input_csv for Step 5"}), 400
-
-            # Extract parameters from the request.
-            input_csv = data["input_csv"]
-            max_rows = data.get("max_rows", 2000)                           # Default max rows to process
-            batch_size = data.get("batch_size", 100)                        # Default batch size for processing
-            delete_no_website = data.get("delete_no_website", False)         # Option to delete rows without websites
-            offset = data.get("offset", 0)                                  # Row offset to start processing from
-
-            output_csv = f"DomainAbout_{input_csv}"
-            # Construct full paths for input and output files.
-            input_path = os.path.join(Config.UPDATED_NAME_PATH, input_csv)      # Input from 'updated_name' folder
-            output_path = os.path.join(Config.DOMAIN_ABOUT_PATH, output_csv)    # Output to 'domain_about' folder
-
-            job_id = str(uuid.uuid4()) # Generate a unique ID for this job.
-
-            # Remove any pre-existing stop signal file for this step.
-            stop_file = os.path.join(Config.TEMP_PATH, "stop_step5.txt")
-            if os.path.exists(stop_file):
-                os.remove(stop_file)
-
-            # Record job metadata in jobs_step5.json.
-            jobs_file = os.path.join(Config.TEMP_PATH, "jobs_step5.json")
-            os.makedirs(Config.TEMP_PATH, exist_ok=True)
-            jobs = []
-            if os.path.exists(jobs_file):
-                with open(jobs_file, "r") as f:
-                    jobs = json.load(f)
-            jobs.append({
-                "job_id": job_id,
-                "input_csv": input_csv,
-                "output_csv": output_csv,
-                "status": "running" # Initial status
-            })
-            with open(jobs_file, "w") as f:
-                json.dump(jobs, f, indent=2)
-
-            # Define the function to be executed in a separate thread.            
-            def run_step5_async():
-                try:
-                    result_df = process_csv_and_extract_info(
-                        input_csv=input_path,
-                        output_csv=output_path,
-                        max_rows=max_rows,
-                        batch_size=batch_size,
-                        delete_no_website=delete_no_website,
-                        offset=offset,
-                        job_id=job_id # Pass job_id for progress tracking/logging by the script
-                    )
-                    # If script indicates failure, update job status and log error.
-                    if result_df is None:
-                        update_job_status(5, job_id, "failed")
-                        # Optionally, write more detailed error to a specific file.
-                        with open(os.path.join(Config.TEMP_PATH, f"step5_error_{job_id}.txt"), "w") as f:
-                            f.write(f"Step 5 execution failed, Job Id: {job_id}")
-                except Exception as e:
-                    update_job_status(5, job_id, "failed")
-                    print(f"Exception in Step 5 background job {job_id}: {e}")
-
-            # Start the background thread.            
-            threading.Thread(target=run_step5_async, daemon=True).start()
-            # Return an immediate response indicating the job has started.
-            return jsonify({
-                "message": f"Step 5 (Extract Domain/About) started. Output will be saved to {output_path}",
-                "status": "started",
-                "job_id": job_id
-            }), 200
-        
-        # Step 6: Find emails for companies (Asynchronous).
-        elif step == 6:
-            data = request.get_json()
-            if not data or "input_csv" not in data:
-                return jsonify({"error": "Missing input_csv for Step 6"}), 400
-            
-            # Extract parameters.
-            input_csv = data["input_csv"]
-            max_rows = data.get("max_rows", 2000)
-            batch_size = data.get("batch_size", 50)
-            delete_no_email = data.get("delete_no_email", False)
-            offset = data.get("offset", 0)
-            tor_restart_interval = data.get("tor_restart_interval", 30) # Parameter for Tor network usage
-
-            output_csv = f"Emails_{input_csv}"
-            # Input from 'domain_about' folder, output to 'emails' folder.
-            input_path = os.path.join(Config.DOMAIN_ABOUT_PATH, input_csv)
-            output_path = os.path.join(Config.EMAILS_PATH, output_csv)
-            job_id = str(uuid.uuid4())
-
-            stop_file = os.path.join(Config.TEMP_PATH, "stop_step6.txt")
-            if os.path.exists(stop_file):
-                os.remove(stop_file)
-
-            # Record job metadata in jobs_step6.json.
-            jobs_file = os.path.join(Config.TEMP_PATH, "jobs_step6.json")
-            os.makedirs(Config.TEMP_PATH, exist_ok=True)
-            jobs = []
-            if os.path.exists(jobs_file):
-                with open(jobs_file, "r") as f:
-                    jobs = json.load(f)
-            jobs.append({
-                "job_id": job_id,
-                "input_csv": input_csv,
-                "output_csv": output_csv,
-                "status": "running"
-            })
-            with open(jobs_file, "w") as f:
-                json.dump(jobs, f, indent=2)
-            
-            # Define the threaded function.
-            def run_step6_async():
-                try:
-                    result_df = process_csv_and_find_emails(
-                        input_csv=input_path,
-                        output_csv=output_path,
-                        max_rows=max_rows,
-                        batch_size=batch_size,
-                        tor_restart_interval=tor_restart_interval,
-                        offset=offset,
-                        delete_no_email=delete_no_email,
-                        job_id=job_id
-                    )
-                    if result_df is None:
-                        update_job_status(6, job_id, "failed")
-                        with open(os.path.join(Config.TEMP_PATH, f"step6_error_{job_id}.txt"), "w") as f:
-                            f.write(f"Step 6 execution failed, Job Id: {job_id}")
-                except Exception as e:
-                    update_job_status(6, job_id, "failed")
-                    print(f"Exception in Step 6 background job {job_id}: {e}")
-            
-            threading.Thread(target=run_step6_async, daemon=True).start()
-            return jsonify({
-                "message": f"Step 6 (Find Emails) started. Output will be saved to {output_path}",
-                "status": "started",
-                "job_id": job_id
-            }), 200
-        
-        # Step 7: Verify found emails (Asynchronous).
-        elif step == 7:
-            data = request.get_json()
-            if not data or "input_csv" not in data:
-                return jsonify({"error": "Missing input_csv for Step 7"}), 400
-            
-            # Extract parameters.
-            input_csv = data["input_csv"]
-            max_rows = data.get("max_rows", 2000)
-            batch_size = data.get("batch_size", 50)
-            delete_invalid = data.get("delete_invalid", False) # Option to delete invalid emails
-            offset = data.get("offset", 0)
-            tor_restart_interval = data.get("tor_restart_interval", 30)
-
-            output_csv = f"Verified_{input_csv}"
-            # Input from 'emails' folder, output to 'verified_emails' folder.
-            input_path = os.path.join(Config.EMAILS_PATH, input_csv)
-            output_path = os.path.join(Config.VERIFIED_EMAILS_PATH, output_csv)
-            job_id = str(uuid.uuid4())
-
-            stop_file = os.path.join(Config.TEMP_PATH, "stop_step7.txt")
-            if os.path.exists(stop_file):
-                os.remove(stop_file)
-
-            jobs_file = os.path.join(Config.TEMP_PATH, "jobs_step7.json")
-            os.makedirs(Config.TEMP_PATH, exist_ok=True)
-            jobs = []
-            if os.path.exists(jobs_file):
-                with open(jobs_file, "r") as f:
-                    jobs = json.load(f)
-            jobs.append({
-                "job_id": job_id,
-                "input_csv": input_csv,
-                "output_csv": output_csv,
-                "status": "running"
-            })
-            with open(jobs_file, "w") as f:
-                json.dump(jobs, f, indent=2)
-            
-            # Define the threaded function.
-            def run_step7_async():
-                try:
-                    result_df = process_csv_and_verify_emails(
-                        input_csv=input_path,
-                        output_csv=output_path,
-                        max_rows=max_rows,
-                        batch_size=batch_size,
-                        tor_restart_interval=tor_restart_interval,
-                        offset=offset,
-                        delete_invalid=delete_invalid,
-                        job_id=job_id,
-                        step_id='step7'
-                    )
-                    if result_df is None:
-                        update_job_status(7, job_id, "failed")
-                        with open(os.path.join(Config.TEMP_PATH, f"step7_error_{job_id}.txt"), "w") as f:
-                            f.write(f"Step 7 execution failed, Job Id: {job_id}")
-                except Exception as e:
-                    update_job_status(7, job_id, "failed")
-                    print(f"Error in Step 7 job {job_id}: {e}")
-            
-            threading.Thread(target=run_step7_async, daemon=True).start()
-            return jsonify({
-                "message": f"Step 7 (Verify Emails) started. Output will be saved to {output_path}",
-                "status": "started",
-                "job_id": job_id
-            }), 200
 
-        # Step 8: Generate personalized icebreakers (Asynchronous).
-        elif step == 8:
-            data = request.get_json()
-            if not data or "input_csv" not in data:
-                return jsonify({"error": "Missing input_csv for Step 8"}), 400
-
-            # Extract parameters.
-            input_csv = data["input_csv"]
-            max_rows = data.get("max_rows", 2000)
-            batch_size = data.get("batch_size", 50)
-            agent_prompt = data.get("agent_prompt", "default_agent")
-            delete_no_icebreaker = data.get("delete_no_icebreaker", False)
-            offset = data.get("offset", 0)
-
-            output_csv = f"Icebreaker_{input_csv}"
-            # Input from 'verified_emails' folder, output to 'icebreakers' folder.
-            input_path = os.path.join(Config.VERIFIED_EMAILS_PATH, input_csv)
-            output_path = os.path.join(Config.ICEBREAKERS_PATH, output_csv)
-            job_id = str(uuid.uuid4())
-
-            stop_file = os.path.join(Config.TEMP_PATH, "stop_step8.txt")
-            if os.path.exists(stop_file):
-                os.remove(stop_file)
-
-            # Record job metadata in jobs_step8.json.
-            jobs_file = os.path.join(Config.TEMP_PATH, "jobs_step8.json")
-            os.makedirs(Config.TEMP_PATH, exist_ok=True)
-            jobs = []
-            if os.path.exists(jobs_file):
-                with open(jobs_file, "r") as f:
-                    jobs = json.load(f)
-            jobs.append({
-                "job_id": job_id,
-                "input_csv": input_csv,
-                "output_csv": output_csv,
-                "status": "running"
-            })
-            with open(jobs_file, "w") as f:
-                json.dump(jobs, f, indent=2)
-            
-            # Define the threaded function.
-            def run_step8_async():
-                try:
-                    result_df = process_csv_and_generate_icebreaker(
-                        input_csv=input_path,
-                        output_csv=output_path,
-                        max_rows=max_rows,
-                        batch_size=batch_size,
-                        agent_prompt=agent_prompt,
-                        delete_no_icebreaker=delete_no_icebreaker,
-                        offset=offset,
-                        job_id=job_id,
-                        step_id='step8'
-                    )
-                    if result_df is None:
-                        update_job_status(8, job_id, "failed")
-                        with open(os.path.join(Config.TEMP_PATH, f"step8_error_{job_id}.txt"), "w") as f:
-                            f.write(f"Step 8 execution failed, Job Id: {job_id}")
-
-                except Exception as e:
-                    update_job_status(8, job_id, "failed")
-                    print(f"Error in Step 8 job {job_id}: {e}")
-            
-            threading.Thread(target=run_step8_async, daemon=True).start()
-            return jsonify({
-                "message": f"Step 8 (Generate Icebreakers) started. Output will be saved to {output_path}",
-                "status": "started",
-                "job_id": job_id
-            }), 200
-        
-        else:
-            # Handle invalid step numbers.
-            return jsonify({"error": "Invalid step number provided"}), 400
+        # Record the job, then run it in the background (thread or job runner process).
+        job_id = str(uuid.uuid4())
+        create_job(definition.step_id, job_id, input_csv=data["input_csv"], output_csv=os.path.basename(output_path))
+        start_job(step, job_id, kwargs)
+        return jsonify({
+            "message": f"Step {step} ({definition.title}) started. Output will be saved to {output_path}",
+            "status": "started",
+            "job_id": job_id
+        }), 200
     except Exception as e:
         # Catch-all for any other unexpected errors during step processing.
         return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
@@ -476,12 +123,11 @@ def stop_step(step):
     It creates a 'stop_stepX.txt' signal file that the background script should check.
     It also updates the job's status in the jobs_stepX.json and progress files.
     """
-    # Define the stop signal file and the jobs metadata file.    
+    # Define the stop signal file.
     stop_file = os.path.join(Config.TEMP_PATH, f"stop_step{step}.txt")
-    jobs_file = os.path.join(Config.TEMP_PATH, f"jobs_step{step}.json")
 
     # Check if the step number is valid for stoppable jobs.
-    if step not in [5, 6, 7, 8]:
+    if step not in async_steps():
         return jsonify({"error": f"Step {step} cannot be stopped or is not a valid stoppable step."}), 400
         
     try:
@@ -491,10 +137,7 @@ def stop_step(step):
         
         # Update the status of the 'running' job to 'stopped' in the jobs JSON file.
         job_stopped_id = None
-        if os.path.exists(jobs_file):
-            with open(jobs_file, "r") as f:
-                jobs = json.load(f)
-
+        with edit_jobs(f"step{step}") as jobs:
             for job in jobs:
                 if job["status"] == "running": # Find the currently running job for this step
                     job["status"] = "stopped"
@@ -512,10 +155,9 @@ def stop_step(step):
                             print(f"Warning: Could not update progress file {progress_file} for job {job_stopped_id}: {e}")
                     else:
                         print(f"Warning: Progress file {progress_file} not found for job {job_stopped_id} during stop operation.")
-            with open(jobs_file, "w") as f:
-                json.dump(jobs, f, indent=2)
 
         if job_stopped_id:
+            job_events.publish(f"step{step}", job_stopped_id, {"status": "stopped", "progress": "Stopped"})
             return jsonify({"message": f"Stop signal sent for Step {step}, Job ID {job_stopped_id}. Status updated to 'stopped'."}), 200
         else:
             return jsonify({"message": f"Stop signal sent for Step {step}. No actively running job found to mark as 'stopped'."}), 200
@@ -532,7 +174,7 @@ def get_progress(step):
     """
     job_id = request.args.get("job_id") # Get job_id from query parameters.
 
-    if step not in [5, 6, 7, 8]:
+    if step not in async_steps():
         return jsonify({
             "step": step, 
             "job_id": job_id or "N/A", 
@@ -547,10 +189,8 @@ def get_progress(step):
         # This part might need more sophisticated logic if multiple jobs can exist per step.
         # For now, it implies a primary progress file or requires job_id for specific tracking.
         # A simple fallback if job_id is missing for steps that usually require it.
-        jobs_file = os.path.join(Config.TEMP_PATH, f"jobs_step{step}.json")
-        if os.path.exists(jobs_file):
-            with open(jobs_file, "r") as f:
-                jobs_data = json.load(f)
+        jobs_data = read_jobs(f"step{step}")
+        if jobs_data:
             # Attempt to find the last 'running' or most recent job if no ID is given
             running_jobs = [j for j in jobs_data if j.get("status") == "running"]
             if running_jobs:
@@ -576,17 +216,19 @@ def get_progress(step):
             with open(progress_file, "r") as f:
                 progress = json.load(f)
 
-            # Format progress message based on status.
-            progress_message = f"Processing row {progress.get('current_row', 0)}/{progress.get('total_rows', 0)}" \
-                               if progress.get("status") == "running" else progress.get("status", "N/A").capitalize()    
-            return jsonify({
+            response = {
                 "step": step,
                 "job_id": progress.get("job_id", job_id), # Use job_id from file if available
-                "progress": progress_message,
+                "progress": format_progress_message(progress),
                 "current_row": progress.get("current_row", 0),
                 "total_rows": progress.get("total_rows", 0),
                 "status": progress.get("status", "unknown")
-            })
+            }
+            # Extra counters written by some steps (e.g. Step 5 reports companies as well as rows)
+            for key in ("current_company", "total_companies"):
+                if key in progress:
+                    response[key] = progress[key]
+            return jsonify(response)
         else:
             # If progress file doesn't exist, the job might not have started or reported progress.
             return jsonify({
@@ -600,53 +242,238 @@ def get_progress(step):
     except Exception as e:
         return jsonify({"error": f"Error retrieving progress for step {step}, job {job_id}: {str(e)}"}), 500
 
+@api_bp.route("/events", methods=["GET"])
+def stream_events():
+    """
+    Server-Sent Events stream of job state for all steps, fed by `write_progress`.
+    Each `job` event carries the same fields as /api/progress plus `step` and `step_id`; its id is
+    the event sequence number. New connections first receive the latest state of every known job,
+    reconnecting clients (Last-Event-ID header) only what changed since. While no job changes, the
+    server only sends a comment line every Config.SSE_HEARTBEAT_SECONDS to keep the connection open.
+    """
+    try:
+        last_sequence = int(request.headers.get("Last-Event-ID") or request.args.get("since") or 0)
+    except ValueError:
+        last_sequence = 0
+
+    def generate():
+        sequence, changes = job_events.changes_since(last_sequence)
+        yield "retry: 3000\n\n"
+        while True:
+            for event_sequence, state in changes:
+                yield f"id: {event_sequence}\nevent: job\ndata: {json.dumps(state)}\n\n"
+            if not changes:
+                yield ": keepalive\n\n"
+            sequence, changes = job_events.wait_for_changes(sequence, timeout=Config.SSE_HEARTBEAT_SECONDS)
+
+    return Response(generate(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no", # Disable response buffering in nginx-style proxies
+    })
+
+@api_bp.route("/status", methods=["GET"])
+def get_status():
+    """
+    Returns the running jobs and the most recent finished jobs (Config.STATUS_RECENT_JOBS per step)
+    of steps 5-8 with their progress, in one response served from the in-memory job state.
+    The ETag is a hash of the body, so it only changes when a job does and is the same on every web
+    worker; a poll with a matching If-None-Match gets 304 with no body.
+    """
+    global _status_body
+    sequence = job_events.sequence
+    cached_sequence, etag, body = _status_body
+    if cached_sequence != sequence:
+        sequence, jobs = job_events.snapshot(recent_per_step=Config.STATUS_RECENT_JOBS)
+        body = json.dumps({
+            "active": sum(1 for job in jobs if job.get("status") == "running"),
+            "jobs": jobs,
+        }, sort_keys=True)
+        etag = hashlib.sha1(body.encode()).hexdigest()[:20]
+        _status_body = (sequence, etag, body)
+    # Weak ETag: the same for the gzip, brotli and uncompressed body
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+_status_body = (None, None, None) # (bus sequence, etag, serialized snapshot) of the last /api/status response
+
 @api_bp.route("/jobs/<int:step>", methods=["GET"])
 def get_jobs(step):
     """
-    Lists all recorded jobs and their statuses for a specific asynchronous step (5, 6, or 7).
-    Reads data from the corresponding 'jobs_stepX.json' file.
+    Lists the recorded jobs and their statuses for a specific asynchronous step (5, 6, 7 or 8), newest first.
+    Reads data from the corresponding 'jobs_stepX.json' file, which keeps the last Config.JOBS_RETAINED
+    jobs (older finished jobs are archived, see config/job_functions.py).
+    Query parameters: 'page' (from 1), 'per_page' (default Config.JOBS_PAGE_SIZE) and 'status'.
     """
-    if step not in [5, 6, 7, 8]:
+    if step not in async_steps():
         return jsonify({"step": step, "jobs": [], "message": "Job tracking only available for steps 5, 6, 7, 8."}), 400
+    try:
+        page = max(int(request.args.get("page", 1)), 1)
+        per_page = min(max(int(request.args.get("per_page", Config.JOBS_PAGE_SIZE)), 1), Config.JOBS_RETAINED)
+    except ValueError:
+        return jsonify({"error": "page and per_page must be integers"}), 400
 
-    jobs_file = os.path.join(Config.TEMP_PATH, f"jobs_step{step}.json")
     try:
-        if os.path.exists(jobs_file):
-            with open(jobs_file, "r") as f:
-                jobs_data = json.load(f)
-            return jsonify({"step": step, "jobs": jobs_data})
-        else:
-            # If no jobs file exists, it means no jobs have been run for this step yet.
-            return jsonify({"step": step, "jobs": []})
+        # If no jobs file exists, it means no jobs have been run for this step yet.
+        jobs_data = read_jobs(f"step{step}")
+        status = request.args.get("status")
+        if status:
+            jobs_data = [job for job in jobs_data if job.get("status") == status]
+        jobs_data.reverse()
+        return jsonify({
+            "step": step,
+            "jobs": jobs_data[(page - 1) * per_page:page * per_page],
+            "total": len(jobs_data),
+            "page": page,
+            "per_page": per_page,
+            "pages": (len(jobs_data) + per_page - 1) // per_page,
+        })
     except Exception as e:
         return jsonify({"error": f"Error retrieving jobs for step {step}: {str(e)}"}), 500
 
+# Sort keys of /api/files: those after "name" need the file's stats, not just os.stat
+FILE_SORT_KEYS = ("name", "mtime", "size", "rows")
+
 @api_bp.route("/files/<path:folder>", methods=["GET"])
 def list_files(folder):
     """
-    Lists all CSV files in a specified folder within the data directory.
+    Lists the CSV files in a specified folder within the data directory, with their row count, columns,
+    size, mtime and the rows each step has processed ('processed', e.g. {"step7": 120}).
     The 'folder' path parameter can be a subfolder name or 'csv' for the root data CSV path.
+
+    Query parameters: 'sort' (name, mtime, size or rows; default name), 'order' (asc or desc),
+    'page' (from 1) and 'per_page' (default Config.FILES_PAGE_SIZE). Stats are only read for the
+    files of the requested page (all files when sorting by rows) and come from the metadata cache
+    (config/file_metadata.py), so only files changed since the last listing are read.
     """
     try:
-        # Determine the target folder path based on the 'folder' argument.
-        if folder == "csv": # Special case: "csv" refers to the root data CSV directory.
-            folder_path = Config.DATA_CSV_PATH
-        else: # Otherwise, it's a subfolder within DATA_CSV_PATH.
-            folder_path = os.path.join(Config.DATA_CSV_PATH, folder)
+        # "csv" refers to the root data CSV directory, anything else to a subfolder within it.
+        folder_path = data_folder_path(folder)
 
-        if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
+        if folder_path is None or not os.path.isdir(folder_path):
             return jsonify({"error":  "Folder not found or is not a directory", "path_checked": folder_path}), 404
-        
+
+        sort = request.args.get("sort", "name")
+        order = request.args.get("order", "asc")
+        if sort not in FILE_SORT_KEYS or order not in ("asc", "desc"):
+            return jsonify({"error": f"sort must be one of {', '.join(FILE_SORT_KEYS)} and order asc or desc"}), 400
+        try:
+            page = max(int(request.args.get("page", 1)), 1)
+            per_page = min(max(int(request.args.get("per_page", Config.FILES_PAGE_SIZE)), 1), Config.FILES_MAX_PAGE_SIZE)
+        except ValueError:
+            return jsonify({"error": "page and per_page must be integers"}), 400
+
         # List files in the directory, filtering for those ending with '.csv'.
-        csv_files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f)) and f.endswith(".csv")]
-        return jsonify({"files": csv_files}), 200
+        with os.scandir(folder_path) as scan:
+            entries = [entry for entry in scan if entry.is_file() and entry.name.endswith(".csv")]
+        markers = processed_markers()
+
+        def stats_of(entry):
+            try:
+                return file_stats(entry.path, markers, stat=entry.stat())
+            except OSError as e: # Deleted or unreadable since the listing
+                return {"file": entry.name, "error": str(e)}
+
+        if sort == "rows":
+            items = [stats_of(entry) for entry in entries]
+            items.sort(key=lambda item: (item.get("rows", -1), item["file"]), reverse=order == "desc")
+            items = items[(page - 1) * per_page:page * per_page]
+        else:
+            if sort == "name":
+                entries.sort(key=lambda entry: entry.name, reverse=order == "desc")
+            else:
+                entries.sort(key=lambda entry: (getattr(entry.stat(), f"st_{sort}"), entry.name), reverse=order == "desc")
+            items = [stats_of(entry) for entry in entries[(page - 1) * per_page:page * per_page]]
+
+        items = [{key: value for key, value in item.items() if key not in ("written_at", "row_index")} for item in items]
+        return jsonify({
+            "files": [item["file"] for item in items],
+            "items": items,
+            "total": len(entries),
+            "page": page,
+            "per_page": per_page,
+            "pages": (len(entries) + per_page - 1) // per_page,
+        }), 200
     except Exception as e:
         return jsonify({"error": f"Error listing files in folder '{folder}': {str(e)}"}), 500
 
+@api_bp.route("/files/<path:folder>/<name>/preview", methods=["GET"])
+def preview_file(folder, name):
+    """
+    Returns a range of rows of a CSV file as JSON without loading the file (see config/csv_preview.py).
+
+    Query parameters: 'offset' (first row, 0-based; negative counts from the end) and 'limit'
+    (default 50, at most Config.PREVIEW_MAX_ROWS). With 'job_id' of a job writing this file, the
+    'limit' rows before the job's current row are returned instead, read from the job's window
+    checkpoint for windowed runs. Rows are lists of values in the order of 'columns'.
+    """
+    folder_path = data_folder_path(folder)
+    file_path = os.path.join(folder_path, name) if folder_path else None
+    if not file_path or not name.endswith(".csv") or not os.path.isfile(file_path):
+        return jsonify({"error": f"File '{name}' not found in folder '{folder}'"}), 404
+    try:
+        offset = int(request.args.get("offset", 0))
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return jsonify({"error": "offset and limit must be integers"}), 400
+    if limit < 1:
+        return jsonify({"error": "limit must be at least 1"}), 400
+
+    try:
+        job_id = request.args.get("job_id")
+        if not job_id:
+            return jsonify(preview_csv(file_path, offset=offset, limit=limit)), 200
+
+        step, job = find_job(job_id, async_steps())
+        if job is None:
+            return jsonify({"error": f"Job {job_id} not found"}), 404
+        if job.get("output_csv") != name:
+            return jsonify({"error": f"Job {job_id} writes {job.get('output_csv')}, not {name}"}), 400
+        progress = read_progress(f"step{step}", job_id) or {}
+        current_row = progress.get("current_row", 0)
+        checkpoint, window_start = window_checkpoint_for(file_path, current_row)
+        if checkpoint:
+            preview = preview_csv(checkpoint, limit=limit, stop=current_row - window_start)
+        else:
+            preview = preview_csv(file_path, limit=limit, stop=current_row)
+        preview["job"] = {"job_id": job_id, "step": step, "status": progress.get("status", job.get("status")), "current_row": current_row}
+        return jsonify(preview), 200
+    except Exception as e:
+        return jsonify({"error": f"Error previewing '{name}': {str(e)}"}), 500
+
+@api_bp.route("/files/<path:folder>/<name>/download", methods=["GET"])
+def download_file(folder, name):
+    """
+    Downloads a CSV file of a data folder. For clients that accept gzip or brotli, the file is
+    compressed while it is streamed; otherwise it is sent as is (with Range and conditional request support).
+    """
+    folder_path = data_folder_path(folder)
+    file_path = os.path.join(folder_path, name) if folder_path else None
+    if not file_path or not name.endswith(".csv") or not os.path.isfile(file_path):
+        return jsonify({"error": f"File '{name}' not found in folder '{folder}'"}), 404
+
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return send_file(file_path, mimetype="text/csv", as_attachment=True, download_name=name, conditional=True)
+
+    def generate():
+        with open(file_path, "rb") as f:
+            yield from compress_chunks(iter(lambda: f.read(256 * 1024), b""), encoding)
+
+    return Response(generate(), mimetype="text/csv", headers={
+        "Content-Encoding": encoding,
+        "Content-Disposition": f"attachment; filename=\"{name}\"",
+        "Vary": "Accept-Encoding",
+    })
+
 @api_bp.route("/logs", methods=["GET"])
 def get_logs():
     """
-    Lists all log files (ending with '.log') from the configured log directory.
+    Lists all log files (ending with '.log', and their gzipped rolled-over files) from the configured log directory.
     """
     log_dir = Config.LOG_PATH
 
@@ -654,8 +481,36 @@ def get_logs():
         if not os.path.exists(log_dir) or not os.path.isdir(log_dir):
             return jsonify({"error": "Log directory not found or is not a directory", "log_path_checked": log_dir}), 404
 
-        # List files in the log directory, filtering for those ending with '.log'.
-        log_files = [f for f in os.listdir(log_dir) if os.path.isfile(os.path.join(log_dir, f)) and f.endswith(".log")]
+        # List files in the log directory, filtering for logs and rolled-over logs ('.log.1.gz').
+        log_files = [f for f in os.listdir(log_dir) if os.path.isfile(os.path.join(log_dir, f)) and is_log_file(f)]
         return jsonify({"logs": log_files, "log_directory": log_dir})
     except Exception as e:
-        return jsonify({"error": f"Error listing log files: {str(e)}"}), 500
\ No newline at end of file
+        return jsonify({"error": f"Error listing log files: {str(e)}"}), 500
+
+def is_log_file(name):
+    """Returns True for log file names: '<name>.log' and rolled-over '<name>.log.<n>.gz'."""
+    return name.endswith(".log") or (name.endswith(".gz") and ".log." in name)
+
+@api_bp.route("/logs/<name>", methods=["GET"])
+def read_log(name):
+    """
+    Returns the last lines of a log file, read backwards from its end (see config/log_reader.py).
+
+    Query parameters: 'tail' (number of lines, default 100, at most Config.LOG_TAIL_MAX_LINES),
+    'grep' (only lines containing this text) and 'job_id' (only lines mentioning this job).
+    'complete' is false if the search stopped after Config.LOG_TAIL_MAX_SCAN_BYTES without finding 'tail' lines.
+    """
+    log_path = os.path.join(Config.LOG_PATH, name)
+    if name != os.path.basename(name) or not is_log_file(name) or not os.path.isfile(log_path):
+        return jsonify({"error": f"Log file '{name}' not found"}), 404
+    try:
+        tail = int(request.args.get("tail", 100))
+    except ValueError:
+        return jsonify({"error": "tail must be an integer"}), 400
+    if not 1 <= tail <= Config.LOG_TAIL_MAX_LINES:
+        return jsonify({"error": f"tail must be between 1 and {Config.LOG_TAIL_MAX_LINES}"}), 400
+
+    try:
+        return jsonify(read_log_tail(log_path, tail=tail, grep=request.args.get("grep"), job_id=request.args.get("job_id"))), 200
+    except Exception as e:
+        return jsonify({"error": f"Error reading log file '{name}': {str(e)}"}), 500
@@ -0,0 +1,137 @@
+"""
+Load test of the web API's request latency while a background step job is running.
+
+Several client threads request cheap endpoints (/api/status, /api/jobs/N, /api/files/csv) as fast as
+they can, first with no job running, then right after starting a step job. The script prints the
+p50/p95/p99/max latency and throughput of both phases, so the development server (jobs in the web
+process) can be compared with the production mode (jobs in the job runner process):
+
+    python backend/app.py
+    python -m backend.scripts.benchmarks.api_load_test http://127.0.0.1:5000 10 8 7 '{"input_csv": "Emails_leads.csv", "verifier": "api"}'
+
+    python -m backend.job_runner  &  python -m backend.wsgi
+    python -m backend.scripts.benchmarks.api_load_test http://127.0.0.1:5000 10 8 7 '{"input_csv": "Emails_leads.csv", "verifier": "api"}'
+
+The job is stopped at the end of the run. Without a step argument only the idle phase is measured.
+"""
+import json
+import sys
+import threading
+import time
+import httpx
+import pandas as pd
+
+DEFAULT_PATHS = ("/api/status", "/api/jobs/7", "/api/files/csv")
+
+
+def measure_latency(base_url, seconds, clients, paths=DEFAULT_PATHS):
+    """
+    Sends requests from several client threads for a fixed time.
+
+    Parameters:
+        base_url (str): URL of the running server.
+        seconds (float): Duration of the measurement.
+        clients (int): Concurrent client threads.
+        paths (tuple): Endpoints requested in turn by every client.
+
+    Returns:
+        tuple: (list of latencies in ms, number of failed requests).
+    """
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def client(index):
+        with httpx.Client(base_url=base_url, timeout=30) as http:
+            request_number = index
+            while time.perf_counter() < deadline:
+                path = paths[request_number % len(paths)]
+                request_number += 1
+                start = time.perf_counter()
+                try:
+                    ok = http.get(path).status_code < 500
+                except httpx.HTTPError:
+                    ok = False
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with lock:
+                    (latencies if ok else errors).append(elapsed_ms)
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, len(errors)
+
+
+def summarize(phase, latencies, errors, seconds):
+    """
+    Summarizes the latencies of one phase.
+
+    Parameters:
+        phase (str): Name of the phase.
+        latencies (list): Request latencies in ms.
+        errors (int): Number of failed requests.
+        seconds (float): Duration of the phase.
+
+    Returns:
+        dict: Requests, throughput, percentiles and maximum.
+    """
+    series = pd.Series(latencies, dtype=float)
+    return {
+        "phase": phase,
+        "requests": len(series),
+        "errors": errors,
+        "req_per_s": round(len(series) / seconds, 1),
+        "p50_ms": round(series.quantile(0.50), 1) if len(series) else None,
+        "p95_ms": round(series.quantile(0.95), 1) if len(series) else None,
+        "p99_ms": round(series.quantile(0.99), 1) if len(series) else None,
+        "max_ms": round(series.max(), 1) if len(series) else None,
+    }
+
+
+def run_load_test(base_url="http://127.0.0.1:5000", seconds=10, clients=8, step=None, payload=None):
+    """
+    Measures request latency with no job running and, if a step is given, while a job of that step runs.
+
+    Parameters:
+        base_url (str): URL of the running server.
+        seconds (float): Duration of each phase.
+        clients (int): Concurrent client threads.
+        step (int, optional): Step (5-8) of the job started for the second phase.
+        payload (dict, optional): Request body for POST /api/steps/<step>.
+
+    Returns:
+        list: One summary dict per phase.
+    """
+    results = [summarize("idle", *measure_latency(base_url, seconds, clients), seconds)]
+
+    if step is not None:
+        with httpx.Client(base_url=base_url, timeout=30) as http:
+            started = http.post(f"/api/steps/{step}", json=payload or {})
+            if started.status_code != 200:
+                print(f"Could not start the Step {step} job: {started.text}")
+            else:
+                job_id = started.json().get("job_id")
+                try:
+                    results.append(summarize(f"step {step} running", *measure_latency(base_url, seconds, clients), seconds))
+                    status = next((job for job in http.get("/api/status").json()["jobs"] if job["job_id"] == job_id), {})
+                    if status.get("status") != "running":
+                        print(f"Note: the job was '{status.get('status')}' at the end of the phase; use a larger input for a full run.")
+                finally:
+                    http.post(f"/api/stop/{step}")
+
+    print(f"API latency under load ({clients} clients, {seconds}s per phase, {base_url})")
+    print(pd.DataFrame(results).to_string(index=False))
+    return results
+
+
+if __name__ == "__main__":
+    run_load_test(
+        base_url=sys.argv[1] if len(sys.argv) > 1 else "http://127.0.0.1:5000",
+        seconds=float(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        clients=int(sys.argv[3]) if len(sys.argv) > 3 else 8,
+        step=int(sys.argv[4]) if len(sys.argv) > 4 else None,
+        payload=json.loads(sys.argv[5]) if len(sys.argv) > 5 else None,
+    )
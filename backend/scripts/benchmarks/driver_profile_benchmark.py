@@ -0,0 +1,187 @@
+"""
+Benchmark for the lean (resource-blocking) WebDriver profile.
+
+Serves local HTML fixtures from a throwaway HTTP server on 127.0.0.1 and loads every page with the
+standard and the lean Chrome profile. For each profile it reports the browser start-up time, the
+average page-ready time (driver.get until the target element is present) and the resident memory
+(RSS) of the browser and all of its child processes.
+
+Use pages saved from the real sites ("Save page as... > Webpage, Complete") as fixtures for realistic
+numbers. Without a fixture directory a synthetic LinkedIn "About"-style page with images, web fonts
+and a video is generated.
+
+Run from the project root:
+    python -m backend.scripts.benchmarks.driver_profile_benchmark [fixture_dir] [loads_per_page]
+"""
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+import psutil
+import pandas as pd
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from selenium.webdriver.common.by import By
+from backend.scripts.selenium.driver_setup_for_scrape import setup_driver
+from backend.scripts.selenium.wait_helpers import wait_for_element
+
+# Element the benchmark waits for: the "About" text of a company page, or <body> for saved pages without one
+READY_LOCATOR = (By.XPATH, '//section[contains(@class, "org-about-module")]//p | //body')
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request to stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def write_synthetic_fixture(fixture_dir, images=40, fonts=4):
+    """
+    Writes a synthetic company "About" page that references many images, web fonts and a video.
+    The referenced files exist (filled with random bytes) so the standard profile actually downloads them.
+
+    Parameters:
+        fixture_dir (str): Directory to write the fixture to.
+        images (int): Number of images on the page.
+        fonts (int): Number of web fonts on the page.
+
+    Returns:
+        str: Path of the written HTML file.
+    """
+    assets_dir = os.path.join(fixture_dir, "assets")
+    os.makedirs(assets_dir, exist_ok=True)
+    for i in range(images):
+        with open(os.path.join(assets_dir, f"image_{i}.jpg"), "wb") as f:
+            f.write(os.urandom(200_000))
+    for i in range(fonts):
+        with open(os.path.join(assets_dir, f"font_{i}.woff2"), "wb") as f:
+            f.write(os.urandom(100_000))
+    with open(os.path.join(assets_dir, "intro.mp4"), "wb") as f:
+        f.write(os.urandom(2_000_000))
+
+    font_faces = "\n".join(
+        f"@font-face {{ font-family: f{i}; src: url(assets/font_{i}.woff2) format('woff2'); }} .f{i} {{ font-family: f{i}; }}"
+        for i in range(fonts)
+    )
+    image_tags = "\n".join(f'<img src="assets/image_{i}.jpg" width="200" height="200">' for i in range(images))
+    font_paragraphs = "\n".join(f'<p class="f{i}">Sample text in font {i}</p>' for i in range(fonts))
+    html = f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Example Hotels | About</title><style>{font_faces}</style></head>
+<body>
+<section class="org-about-module__margin-bottom">
+  <p class="break-words">Example Hotels runs boutique hotels across Europe with a focus on local experiences.</p>
+  <dl><dt>Website</dt><dd><a href="https://www.example.com">example.com</a></dd></dl>
+</section>
+{font_paragraphs}
+<video src="assets/intro.mp4" autoplay muted></video>
+{image_tags}
+</body>
+</html>"""
+    path = os.path.join(fixture_dir, "company_about.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return path
+
+
+def browser_rss_mb(driver):
+    """
+    Returns the resident memory of the browser started by a WebDriver, including all child processes
+    (renderers, GPU and network services), in MB.
+
+    Parameters:
+        driver (WebDriver): WebDriver instance.
+
+    Returns:
+        float: RSS in MB, or 0.0 if the processes cannot be read.
+    """
+    try:
+        service_process = psutil.Process(driver.service.process.pid)
+        processes = [service_process] + service_process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes if p.is_running()) / 1_048_576
+    except Exception:
+        return 0.0
+
+
+def benchmark_profile(lean, urls, loads_per_page=3, headless=True):
+    """
+    Starts one browser with the given profile and times loading every fixture URL.
+
+    Parameters:
+        lean (bool): Use the lean resource-blocking profile.
+        urls (list): Fixture URLs to load.
+        loads_per_page (int): How often each URL is loaded.
+        headless (bool): Run the browser headless.
+
+    Returns:
+        dict: Start-up seconds, average and maximum page-ready seconds and RSS in MB.
+    """
+    start = time.perf_counter()
+    driver = setup_driver(headless=headless, lean=lean)
+    startup_seconds = time.perf_counter() - start
+    ready_times = []
+    try:
+        for _ in range(loads_per_page):
+            for url in urls:
+                start = time.perf_counter()
+                driver.get(url)
+                wait_for_element(driver, READY_LOCATOR, timeout=30)
+                ready_times.append(time.perf_counter() - start)
+        rss_mb = browser_rss_mb(driver)
+    finally:
+        driver.quit()
+
+    return {
+        "profile": "lean" if lean else "standard",
+        "startup_s": round(startup_seconds, 2),
+        "avg_ready_s": round(sum(ready_times) / len(ready_times), 3),
+        "max_ready_s": round(max(ready_times), 3),
+        "rss_mb": round(rss_mb, 1),
+        "loads": len(ready_times),
+    }
+
+
+def run_benchmark(fixture_dir=None, loads_per_page=3, headless=True):
+    """
+    Serves the fixtures over HTTP, benchmarks the standard and the lean profile and prints a summary table.
+
+    Parameters:
+        fixture_dir (str, optional): Directory with saved .html pages. A synthetic fixture is used if omitted.
+        loads_per_page (int): How often each page is loaded per profile.
+        headless (bool): Run the browsers headless.
+
+    Returns:
+        list: One dict per profile.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if fixture_dir is None:
+            fixture_dir = temp_dir
+            write_synthetic_fixture(fixture_dir)
+        pages = sorted(name for name in os.listdir(fixture_dir) if name.lower().endswith((".html", ".htm")))
+        if not pages:
+            print(f"No .html fixtures found in {fixture_dir}")
+            return []
+
+        handler = functools.partial(_QuietHandler, directory=fixture_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            urls = [f"{base_url}/{page}" for page in pages]
+            results = [benchmark_profile(lean, urls, loads_per_page, headless) for lean in (False, True)]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print(f"Driver profile benchmark ({len(urls)} page(s) x {loads_per_page} loads)")
+    print(pd.DataFrame(results).to_string(index=False))
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        fixture_dir=sys.argv[1] if len(sys.argv) > 1 else None,
+        loads_per_page=int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
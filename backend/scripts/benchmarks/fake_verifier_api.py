@@ -0,0 +1,79 @@
+"""
+Local stand-in for a NeverBounce-style email verifier API, used by the Step 7 benchmark
+(verifier_benchmark.py) and the tests of `ApiVerifier`.
+
+`start_fake_verifier_api` answers every check from a dict, optionally after a delay (to imitate the
+latency of a real service) or with the service's throttle error after a number of requests.
+"""
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+class _FakeVerifierApiServer(ThreadingHTTPServer):
+    """HTTP server with a listen backlog large enough for many concurrent clients."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class _FakeVerifierApiHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET ?email=... with {"status": "success", "result": results.get(email, "invalid")}, or with
+    {"status": "throttle_triggered"} once more than `throttle_after` requests were made.
+    """
+
+    results = {}
+    delay = 0.0
+    throttle_after = None
+    requests_seen = None # [count], shared by the handler threads of one server
+    lock = None
+
+    def do_GET(self):
+        email = parse_qs(urlparse(self.path).query).get("email", [""])[0].lower()
+        if self.delay:
+            time.sleep(self.delay)
+        with self.lock:
+            self.requests_seen[0] += 1
+            throttled = self.throttle_after is not None and self.requests_seen[0] > self.throttle_after
+        if throttled:
+            payload = {"status": "throttle_triggered", "message": "Too many requests"}
+        else:
+            payload = {"status": "success", "result": self.results.get(email, "invalid")}
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_verifier_api(results, delay=0.0, throttle_after=None):
+    """
+    Starts a local HTTP server that imitates a NeverBounce-style single-check API.
+
+    Parameters:
+        results (dict): Maps an address to the API result ("valid", "invalid", "catchall", ...).
+                        Unknown addresses are "invalid".
+        delay (float): Seconds each answer takes, to imitate the latency of a real service.
+        throttle_after (int, optional): Answer every request after this many with the service's
+                                        "throttle_triggered" error.
+
+    Returns:
+        tuple: (server, url). Call `server.shutdown()` when done.
+    """
+    handler = type("FakeVerifierApiHandler", (_FakeVerifierApiHandler,), {
+        "results": {address.lower(): result for address, result in results.items()},
+        "delay": delay,
+        "throttle_after": throttle_after,
+        "requests_seen": [0],
+        "lock": threading.Lock(),
+    })
+    server = _FakeVerifierApiServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v4/single/check"
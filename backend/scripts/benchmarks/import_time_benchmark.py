@@ -0,0 +1,107 @@
+"""
+Import-time benchmark of the web app.
+
+Runs `python -X importtime -c "import backend.app"` in fresh interpreters, reports the median
+cumulative import time of the app and its slowest imports, and checks that none of the heavy step
+dependencies (HEAVY_MODULES) is imported at start-up: the steps load them lazily through
+`backend/step_registry.py`. Exits with status 1 if one of them is imported, so it can guard changes:
+
+    python -m backend.scripts.benchmarks.import_time_benchmark [runs] [top]
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from backend.config import Config
+
+# Top-level packages that must only be imported when a step runs
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "selenium", "openai", "tldextract", "fake_useragent", "psutil", "httpx")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def profile_import(module="backend.app"):
+    """
+    Imports a module in a fresh interpreter with `-X importtime`.
+
+    Parameters:
+        module (str): Module to import.
+
+    Returns:
+        list: (module name, self microseconds, cumulative microseconds, nesting level) per imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Config.ROOT_DIR, capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=Config.ROOT_DIR),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return imports
+
+
+def direct_imports(imports, module):
+    """
+    Returns the imports made directly by a module (its children in the `-X importtime` tree).
+
+    Parameters:
+        imports (list): Output of `profile_import`.
+        module (str): Module name.
+
+    Returns:
+        list: The entries of `imports` one level below the module.
+    """
+    position = next(index for index, entry in enumerate(imports) if entry[0] == module)
+    level = imports[position][3]
+    children = []
+    # importtime prints a module after everything it imported, one level deeper
+    for entry in reversed(imports[:position]):
+        if entry[3] <= level:
+            break
+        if entry[3] == level + 1:
+            children.append(entry)
+    return children
+
+
+def run_benchmark(runs=5, top=15, module="backend.app"):
+    """
+    Profiles the app import several times and prints the median time, slowest imports and heavy modules found.
+
+    Parameters:
+        runs (int): Number of fresh interpreters (the median is reported).
+        top (int): Number of slowest top-level imports listed.
+        module (str): Module to import.
+
+    Returns:
+        dict: Median cumulative import time in ms and the heavy modules that were imported.
+    """
+    profiles = [profile_import(module) for _ in range(runs)]
+    totals_ms = [next(cumulative for name, _, cumulative, _ in imports if name == module) / 1000 for imports in profiles]
+    last = profiles[-1]
+    heavy = sorted({name.split(".")[0] for name, _, _, _ in last if name.split(".")[0] in HEAVY_MODULES})
+
+    print(f"import {module}: median {statistics.median(totals_ms):.0f} ms over {runs} runs (min {min(totals_ms):.0f} ms)")
+    print(f"Slowest imports of {module} (cumulative ms):")
+    direct = sorted(direct_imports(last, module), key=lambda entry: -entry[2])[:top]
+    for name, _, cumulative, _ in direct:
+        print(f"  {cumulative / 1000:8.1f}  {name}")
+    if heavy:
+        print(f"Heavy modules imported at start-up: {', '.join(heavy)}")
+    else:
+        print("No heavy step dependencies imported at start-up.")
+    return {"median_ms": round(statistics.median(totals_ms), 1), "heavy_modules": heavy}
+
+
+if __name__ == "__main__":
+    summary = run_benchmark(
+        runs=int(sys.argv[1]) if len(sys.argv) > 1 else 5,
+        top=int(sys.argv[2]) if len(sys.argv) > 2 else 15,
+    )
+    sys.exit(1 if summary["heavy_modules"] else 0)
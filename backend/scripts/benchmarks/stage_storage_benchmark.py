@@ -0,0 +1,89 @@
+"""
+Benchmark for intermediate stage storage formats.
+
+Builds a synthetic lead table (default 50k rows) with long 'About_Text' and 'Summary' columns,
+then times `save_stage_file` and `load_csv` for CSV, Parquet (zstd) and Arrow IPC, and reports
+the size of each file on disk.
+
+Run from the project root:
+    python -m backend.scripts.benchmarks.stage_storage_benchmark [rows]
+"""
+import os
+import sys
+import random
+import string
+import tempfile
+import time
+import pandas as pd
+from config.utils import STAGE_FILE_EXTENSIONS, save_stage_file, load_csv
+
+
+def build_sample_dataframe(rows):
+    """
+    Builds a DataFrame shaped like a Step 5 output (domain_about) with random text.
+
+    Parameters:
+        rows (int): Number of rows to generate.
+
+    Returns:
+        pd.DataFrame: Synthetic lead data.
+    """
+    rng = random.Random(42)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(2000)]
+
+    def paragraph(min_words, max_words):
+        return " ".join(rng.choices(words, k=rng.randint(min_words, max_words)))
+
+    return pd.DataFrame({
+        "Full Name": [paragraph(2, 3).title() for _ in range(rows)],
+        "First Name": [rng.choice(words).title() for _ in range(rows)],
+        "Company Id": [str(rng.randint(10_000, 9_999_999)) for _ in range(rows)],
+        "Regular Company Url": [f"https://www.linkedin.com/company/{rng.choice(words)}" for _ in range(rows)],
+        "Summary": [paragraph(20, 80) for _ in range(rows)],
+        "Industry": [rng.choice(["Hospitality", "Hotels and Motels", "Travel Arrangements"]) for _ in range(rows)],
+        "Website": [f"{rng.choice(words)}.com" for _ in range(rows)],
+        "About_Text": [paragraph(80, 250) for _ in range(rows)],
+        "Processed_About_Website": [rng.random() < 0.5 for _ in range(rows)],
+    })
+
+
+def run_benchmark(rows=50_000):
+    """
+    Times saving and loading the sample data in every stage format and prints a summary table.
+
+    Parameters:
+        rows (int): Number of rows to benchmark with.
+
+    Returns:
+        list: One dict per format with save/load seconds and file size in MB.
+    """
+    df = build_sample_dataframe(rows)
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for file_format in STAGE_FILE_EXTENSIONS:
+            output_csv = os.path.join(temp_dir, file_format, "DomainAbout_benchmark.csv")
+            os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+
+            start = time.perf_counter()
+            path = save_stage_file(df, output_csv, file_format=file_format)
+            save_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded_df, _ = load_csv(input_csv=output_csv, output_csv=output_csv)
+            load_seconds = time.perf_counter() - start
+
+            results.append({
+                "format": file_format,
+                "save_s": round(save_seconds, 3),
+                "load_s": round(load_seconds, 3),
+                "size_mb": round(os.path.getsize(path) / 1_048_576, 2),
+                "rows": len(loaded_df),
+            })
+
+    print(f"Stage storage benchmark ({rows} rows)")
+    print(pd.DataFrame(results).to_string(index=False))
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,118 @@
+"""
+Benchmark for Step 7 over the API verifier backend.
+
+Starts a local mock of a NeverBounce-style API (`start_fake_verifier_api`, see fake_verifier_api.py)
+that answers every request after a configurable latency, then runs `process_csv_and_verify_emails` on
+a synthetic file twice: row by row (concurrency=1, one checkpoint per row) and with the concurrent
+pipeline (`verify_rows_concurrently`). It reports wall time and addresses per second for each mode.
+
+Every run uses addresses on a fresh domain so the verification cache never answers for the mock.
+The cache database, the job records and the progress files go to throwaway locations, not to the
+real cache and temp folder. The API rate limit is disabled unless given, so the numbers show the
+loop's own overhead; pass a rate to see the pipeline settle at the quota.
+
+Run from the project root:
+    python -m backend.scripts.benchmarks.verifier_benchmark [rows] [latency_seconds] [concurrency] [rate_limit]
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+import pandas as pd
+
+# Keep the benchmark's verification results out of the real cache
+os.environ.setdefault("CACHE_DB_PATH", os.path.join(tempfile.gettempdir(), f"verifier_benchmark_{uuid.uuid4().hex}.sqlite"))
+
+from backend.config import Config
+
+# Keep the benchmark's job records and progress files out of the real temp folder
+Config.TEMP_PATH = tempfile.mkdtemp(prefix="verifier_benchmark_")
+
+from backend.scripts.sales_navigator_scrape.verify_emails import ApiVerifier, process_csv_and_verify_emails
+from backend.scripts.benchmarks.fake_verifier_api import start_fake_verifier_api
+
+
+def write_sample_csv(path, rows):
+    """
+    Writes a Step 6 style CSV with unique addresses on a domain that is new for every call.
+
+    Parameters:
+        path (str): Output path.
+        rows (int): Number of addresses.
+
+    Returns:
+        list: The addresses written.
+    """
+    domain = f"bench-{uuid.uuid4().hex[:8]}.test"
+    emails = [f"lead{i}@{domain}" for i in range(rows)]
+    pd.DataFrame({"Full Name": [f"Lead {i}" for i in range(rows)], "Email": emails}).to_csv(path, index=False)
+    return emails
+
+
+def benchmark_mode(temp_dir, api_url, rows, concurrency, rate_limit):
+    """
+    Times one Step 7 run against the mock API.
+
+    Parameters:
+        temp_dir (str): Directory for the input and output files.
+        api_url (str): URL of the mock API.
+        rows (int): Number of addresses.
+        concurrency (int): Checks in flight (1 runs the row-by-row loop).
+        rate_limit (float): Requests per second allowed by the backend (0 for unlimited).
+
+    Returns:
+        dict: Mode, wall time, throughput and number of verified rows.
+    """
+    input_csv = os.path.join(temp_dir, f"Emails_{concurrency}.csv")
+    output_csv = os.path.join(temp_dir, f"Verified_Emails_{concurrency}.csv")
+    write_sample_csv(input_csv, rows)
+    verifier = ApiVerifier(api_url=api_url, api_key="benchmark", rate_limit=rate_limit)
+
+    start = time.perf_counter()
+    df = process_csv_and_verify_emails(
+        input_csv, output_csv, max_rows=rows, delete_invalid=False, step_id="benchmark_step7",
+        verifier=verifier, concurrency=concurrency,
+    )
+    seconds = time.perf_counter() - start
+    return {
+        "mode": "row by row" if concurrency == 1 else f"concurrent x{concurrency}",
+        "seconds": round(seconds, 2),
+        "emails_per_s": round(rows / seconds, 1),
+        "verified": int(df["Email_Processed"].sum()) if df is not None else 0,
+    }
+
+
+def run_benchmark(rows=500, latency=0.2, concurrency=50, rate_limit=0):
+    """
+    Benchmarks the row-by-row loop against the concurrent pipeline and prints a summary table.
+
+    Parameters:
+        rows (int): Addresses per run.
+        latency (float): Seconds the mock API takes per answer.
+        concurrency (int): Checks in flight for the concurrent run.
+        rate_limit (float): Requests per second allowed by the backend (0 for unlimited).
+
+    Returns:
+        list: One dict per mode.
+    """
+    server, api_url = start_fake_verifier_api({}, delay=latency)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results = [benchmark_mode(temp_dir, api_url, rows, mode_concurrency, rate_limit) for mode_concurrency in (1, concurrency)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"Step 7 API verifier benchmark ({rows} emails, {latency}s latency, rate limit {rate_limit or 'none'})")
+    print(pd.DataFrame(results).to_string(index=False))
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        rows=int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        latency=float(sys.argv[2]) if len(sys.argv) > 2 else 0.2,
+        concurrency=int(sys.argv[3]) if len(sys.argv) > 3 else 50,
+        rate_limit=float(sys.argv[4]) if len(sys.argv) > 4 else 0,
+    )
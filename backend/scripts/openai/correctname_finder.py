@@ -9,6 +9,7 @@ import time
 import openai
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from backend.config import Config
+from config.utils import load_csv, save_stage_file, export_csv
 
 def find_the_correct_name(lead_name, temperature=0.7, org_id=None, max_retries=3, initial_delay=1):
     """
@@ -170,20 +171,14 @@ def process_csv(input_csv, output_csv=None, input_path=os.path.join(Config.DATA_
         load_dotenv()
         org_id = os.getenv("OPENAI_ORG_ID")
 
-        # Check if output file exists and use it as input if available
-        if os.path.exists(output_file):
-            logging.info(f"Output file '{output_file}' exists, using it as input")
-            input_file = output_file
-        else:
-            logging.info(f"No output file found, using input file '{input_file}'")
-
-        # Read the CSV file
-        logging.info(f"Reading CSV: {input_file}")
-        df = pd.read_csv(input_file, dtype=str, keep_default_na=False)
-
-        # Check if Full Name column exists
-        if 'Full Name' not in df.columns:
-            raise ValueError("CSV file must contain a 'Full Name' column.")
+        # Load the output file (or a newer stage checkpoint) if available, otherwise the input file
+        df, input_file = load_csv(
+            input_csv=input_file,
+            output_csv=output_file,
+            required_columns=['Full Name']
+        )
+        if df is None:
+            return None
 
         # Initialize Processed_Name column only for rows where it's missing
         if 'Processed_Name' not in df.columns:
@@ -239,9 +234,10 @@ def process_csv(input_csv, output_csv=None, input_path=os.path.join(Config.DATA_
                         df.at[idx, 'Processed_Name'] = False
 
             # Save progress after each batch
-            df.to_csv(output_file, index=False)
+            save_stage_file(df, output_file)
             logging.info(f"Saved batch {start_idx}-{end_idx} to {output_file}")
 
+        export_csv(df, output_file)
         print(f"Updated CSV saved to {output_file}")
         return df
 
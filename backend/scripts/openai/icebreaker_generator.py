@@ -7,8 +7,11 @@ from dotenv import load_dotenv
 from openai import OpenAI
 import pandas as pd
 from backend.config import Config
-from config.job_functions import check_stop_signal, write_progress
-from config.utils import load_csv
+from config.job_functions import check_stop_signal, write_progress, record_job_metrics
+from config.utils import load_csv, save_stage_file, export_csv, dataframe_memory_mb
+
+# Columns loaded when the step runs in windowed mode
+WINDOW_COLUMNS = ['First Name', 'Summary', 'About_Text', 'Icebreaker', 'Processed_Icebreaker']
 
 def generate_icebreaker(cleaned_text, openAI_client, system_message, user_message_role, user_message_content, temperature=0.7):
     """
@@ -45,14 +48,14 @@ def generate_icebreaker(cleaned_text, openAI_client, system_message, user_messag
 
         # Extract the generated icebreaker
         icebreaker = response.choices[0].message.content.strip()
-        logging.info(icebreaker)
+        logging.debug(icebreaker)
         return icebreaker
 
     except Exception as e:
         logging.error(f"Error generating icebreaker: {e}", exc_info=True)
         return None
 
-def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, batch_size=50, agent_prompt='default_agent', delete_no_icebreaker=False, offset=0, job_id=None, step_id='step8'):
+def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, batch_size=50, agent_prompt='default_agent', delete_no_icebreaker=False, offset=0, job_id=None, step_id='step8', windowed=False):
     """
     Processes a CSV file containing LinkedIn profile data, generates personalized icebreakers using OpenAI, and saves the enriched data to an output CSV.
 
@@ -69,6 +72,8 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
     offset (int): Number of rows to skip from the beginning of the input CSV.
     job_id (str): A unique identifier for the current processing job (for external tracking).
     step_id (str): Identifier for the current step in a larger job pipeline (for external tracking).
+    windowed (bool): If True, only rows [offset, offset + max_rows) and the columns this step uses are loaded;
+                     the processed rows are merged back into the full output at the end.
 
     Returns:
     --------
@@ -79,16 +84,16 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
         with open(os.path.join(Config.AGENT_PROMPTS_PATH), 'r', encoding='utf-8') as f:
             agents = json.load(f)
 
-        logging.info(f"Agents: {agents}")
+        logging.debug(f"Agents: {agents}")
         # Define system and user messages from .json file
         system_message = agents.get(agent_prompt).get("system_message")
-        logging.info(f"System Message: {system_message}")
+        logging.debug(f"System Message: {system_message}")
 
         user_message_role = agents.get(agent_prompt).get("user_message").get("role")
-        logging.info(f"User Message Role: {user_message_role}")
+        logging.debug(f"User Message Role: {user_message_role}")
 
         user_message_content = agents.get(agent_prompt).get("user_message").get("content")
-        logging.info(f"User Message Content: {user_message_content}")
+        logging.debug(f"User Message Content: {user_message_content}")
 
         # Load the input CSV file using a utility function.
         # Needs Summary and About_Text columns to exists
@@ -96,10 +101,18 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
         df, resolved_input_csv = load_csv(
             input_csv=input_csv,
             output_csv=output_csv,
-            required_columns=required_columns
+            required_columns=required_columns,
+            offset=offset,
+            max_rows=max_rows if windowed else None,
+            columns=WINDOW_COLUMNS
         )
         if df is None: # load_csv returns None on failure (e.g., file not found)
             return None
+        window = df.attrs.get("window") # Set by load_csv in windowed mode
+        # Absolute row count up to the end of the loaded rows (the window end in windowed mode)
+        row_count = df.index[-1] + 1 if not df.empty else 0
+        # Report the in-memory footprint of the loaded (compact) DataFrame with the job
+        record_job_metrics(step_id, job_id, rows_loaded=len(df), memory_mb=dataframe_memory_mb(df))
 
         # Load OpenAI API key and optional organization ID from .env file
         load_dotenv()
@@ -132,12 +145,12 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
         if offset < 0:
             logging.error("Offset cannot be negative.")
             raise ValueError("Offset cannot be negative")
-        if offset >= len(df):
-            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {len(df)}. No rows to process.")
+        if offset >= row_count:
+            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {row_count}. No rows to process.")
             return df # Return the original DataFrame as no processing is needed.
 
         # Calculate the total number of rows to actually process, considering offset and max_rows.
-        total_rows_to_process_after_offset = min(len(df) - offset, max_rows)
+        total_rows_to_process_after_offset = min(row_count - offset, max_rows)
         if total_rows_to_process_after_offset <= 0:
             logging.info(f"No rows to process after applying offset {offset} and max_rows {max_rows}.")
             return df
@@ -154,12 +167,12 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
                     logging.info("Stop signal detected. Terminating processing.")
                     # Report current progress before stopping.
                     write_progress(batch_start_idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id, stop_call=True)
-                    df.to_csv(output_csv, index=False)
+                    save_stage_file(df, output_csv, window=window)
                     stopped = True
                     break # Exit the batch processing loop.
 
                 batch_end_idx = min(batch_start_idx + batch_size, offset + total_rows_to_process_after_offset)
-                current_batch_df_slice = df.iloc[batch_start_idx:batch_end_idx]
+                current_batch_df_slice = df.loc[batch_start_idx:batch_end_idx - 1]
                 
                 # Identify rows within the current batch that haven't been processed yet.
                 unprocessed_mask = ~current_batch_df_slice['Processed_Icebreaker']
@@ -178,7 +191,7 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
                         if check_stop_signal(step_id):
                             logging.info(f"Stop signal detected during row processing at index {idx + 1}. Terminating.")
                             write_progress(idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id, stop_call=True)
-                            df.to_csv(output_csv, index=False) # Save progress.
+                            save_stage_file(df, output_csv, window=window) # Save progress.
                             stopped = True
                             break # Exit the inner loop (row processing).
 
@@ -207,7 +220,7 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
                         df.at[idx, 'Processed_Icebreaker'] = generated_icebreaker != "None"
 
                         # Save progress to the output CSV file after processing each row.
-                        df.to_csv(output_csv, index=False)
+                        save_stage_file(df, output_csv, window=window)
                         logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
                         # Report progress for this row.
                         write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id)
@@ -244,11 +257,13 @@ def process_csv_and_generate_icebreaker(input_csv, output_csv, max_rows=2000, ba
                 deleted_rows_count = initial_row_count - len(df)
                 if deleted_rows_count > 0:
                     logging.info(f"Deleted {deleted_rows_count} rows where Icebreaker was 'None'.")
-                    df.to_csv(output_csv, index=False)
+                    save_stage_file(df, output_csv, window=window)
                     logging.info(f"Saved final DataFrame after deleting rows to {output_csv}")
                 else:
                     logging.info("No rows with Icebreaker 'None' found to delete.")
 
+        # Export the final state as CSV (the format shared between steps)
+        export_csv(df, output_csv, window=window)
         logging.info(f"Final row count in DataFrame after processing: {len(df)}")
         return df
 
@@ -0,0 +1,147 @@
+"""
+Browser-free resolver for LinkedIn company ID URLs (Step 4).
+
+LinkedIn redirects an ID-based company URL (https://www.linkedin.com/company/12345) to the name-based
+URL (https://www.linkedin.com/company/example-hotels) with a plain HTTP redirect. Instead of loading the
+whole page in Chrome, the resolver follows the `Location` headers with a pooled `requests` session that
+carries the cookies of the logged-in LinkedIn browser. Response bodies are never downloaded.
+
+The browser is only needed when the redirect cannot be followed over HTTP: `resolve_redirect` reports a
+login wall or bot check with `needs_browser=True`, and a final URL that is still ID-based
+(`is_company_id_url`) means the redirect is done in JavaScript.
+
+The resolver works against any host; tests/test_company_url_resolver.py checks it against a local stub server.
+"""
+import logging
+import re
+from urllib.parse import urljoin, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from backend.config import Config
+
+# HTTP status codes that are followed as redirects
+REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+
+# URL path fragments that mean LinkedIn wants a real browser (login wall or bot check)
+BROWSER_REQUIRED_PATHS = ("/login", "/authwall", "/checkpoint", "/uas/")
+
+# Status codes LinkedIn returns to clients it treats as bots (999 is LinkedIn specific)
+BLOCKED_STATUS_CODES = {401, 403, 429, 999}
+
+# ID-based company URL path, e.g. /company/12345 or /company/12345/about/
+COMPANY_ID_PATH = re.compile(r"/company/\d+(/about)?/?$")
+
+def create_http_session(cookies=None, user_agent=None, pool_size=Config.HTTP_POOL_SIZE):
+    """
+    Creates a `requests` session with a pooled, retrying connection adapter.
+
+    Parameters:
+        cookies (list, optional): Selenium-style cookie dicts (name, value, domain, path) to load.
+        user_agent (str, optional): User agent to send. Use the browser's user agent so the cookies stay valid.
+        pool_size (int): Maximum number of kept-alive connections per host.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504], allowed_methods=["GET", "HEAD"], redirect=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+    for cookie in cookies or []:
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+    return session
+
+def session_from_driver(driver, pool_size=Config.HTTP_POOL_SIZE):
+    """
+    Creates a pooled HTTP session that reuses the cookies and user agent of a logged-in browser.
+
+    Parameters:
+        driver (WebDriver): Browser with an authenticated LinkedIn session.
+        pool_size (int): Maximum number of kept-alive connections per host.
+
+    Returns:
+        requests.Session: The configured session, or None if the cookies could not be read.
+    """
+    try:
+        try:
+            # All cookies of the browser profile, not only those of the page that happens to be open
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except Exception:
+            driver.get("https://www.linkedin.com/feed/")
+            cookies = driver.get_cookies()
+        user_agent = driver.execute_script("return navigator.userAgent")
+    except Exception as e:
+        logging.error(f"Could not read cookies from the browser: {e}")
+        return None
+    logging.info(f"Created HTTP session with {len(cookies)} cookies from the browser")
+    return create_http_session(cookies=cookies, user_agent=user_agent, pool_size=pool_size)
+
+def is_company_id_url(url):
+    """
+    Checks whether a URL is still an ID-based company URL (i.e. the redirect to the name-based URL did not happen).
+
+    Parameters:
+        url (str): URL to check.
+
+    Returns:
+        bool: True for URLs like https://www.linkedin.com/company/12345.
+    """
+    return bool(COMPANY_ID_PATH.search(urlparse(url).path))
+
+def _requires_browser(url):
+    """Returns True if the URL is a LinkedIn login wall or bot check page."""
+    path = urlparse(url).path.lower()
+    return any(path.startswith(fragment) for fragment in BROWSER_REQUIRED_PATHS)
+
+def resolve_redirect(url, session, max_redirects=10, timeout=Config.HTTP_TIMEOUT):
+    """
+    Follows the redirects of a URL by reading only the `Location` headers.
+
+    Parameters:
+        url (str): URL to resolve.
+        session (requests.Session): Session used for the requests (see `create_http_session`).
+        max_redirects (int): Maximum number of redirects to follow.
+        timeout (float): Seconds to wait for each response.
+
+    Returns:
+        tuple: (final_url, needs_browser). needs_browser is True when the redirect could not be resolved
+               over HTTP and a browser has to be used instead; final_url is then the last URL reached.
+               A page that answers 200 without a redirect is returned with needs_browser=False; use
+               `is_company_id_url` to detect company pages that redirect in JavaScript.
+    """
+    current_url = url
+    for _ in range(max_redirects + 1):
+        try:
+            # stream=True only reads the headers; the body is discarded when the response is closed
+            with session.get(current_url, allow_redirects=False, stream=True, timeout=timeout) as response:
+                status = response.status_code
+                location = response.headers.get("Location")
+        except requests.RequestException as e:
+            logging.warning(f"HTTP error while resolving {current_url}: {e}")
+            return current_url, True
+
+        if status in REDIRECT_STATUS_CODES and location:
+            next_url = urljoin(current_url, location)
+            if _requires_browser(next_url):
+                logging.info(f"{url} redirects to a login or bot check page ({next_url}); a browser is needed")
+                return current_url, True
+            current_url = next_url
+            continue
+        if status in BLOCKED_STATUS_CODES:
+            logging.info(f"{current_url} answered with HTTP {status}; a browser is needed")
+            return current_url, True
+        if status >= 400:
+            logging.warning(f"{current_url} answered with HTTP {status}")
+            return current_url, True
+        return current_url, False
+
+    logging.warning(f"Too many redirects while resolving {url}")
+    return current_url, True
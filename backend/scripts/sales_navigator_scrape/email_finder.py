@@ -4,12 +4,17 @@ import random
 import logging
 import os
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from backend.scripts.selenium.driver_setup_for_scrape import restart_driver_and_tor, setup_chrome_with_tor, start_tor, stop_tor
+from backend.scripts.selenium.driver_setup_for_scrape import setup_chrome_with_tor, start_tor, stop_tor
+from backend.scripts.selenium.driver_pool import get_driver_pool, restart_pooled_driver_and_tor
+from backend.scripts.selenium.wait_helpers import wait_for_document_ready, wait_for_element, human_pause, reset_wait_timer, read_wait_timer
 from backend.config import Config
-from config.job_functions import write_progress, check_stop_signal
-from config.utils import load_csv
+from config.job_functions import write_progress, check_stop_signal, record_job_metrics
+from config.utils import load_csv, save_stage_file, export_csv, dataframe_memory_mb
+from backend.scripts.sales_navigator_scrape.email_finder_cache import get_email_finder_cache, email_finder_cache_key, CACHED_FINDER_STATUSES
+
+# Columns loaded when the step runs in windowed mode
+WINDOW_COLUMNS = ['Full Name', 'Website', 'Email', 'Status']
 
 def find_email(full_name, company_name, driver, tor_process=None, max_retries=2, retry_delay=2):
     """
@@ -31,7 +36,7 @@ def find_email(full_name, company_name, driver, tor_process=None, max_retries=2,
         try:
             logging.info(f"Attempt {attempt} to find email for {full_name} at {company_name}")
             driver.get("https://skrapp.io/email-finder")
-            time.sleep(2)
+            wait_for_document_ready(driver)
             # Check for access denied (HTTP 403) or request blocked
             if "access to skrapp.io was denied" in driver.page_source.lower() or "http error 403" in driver.page_source.lower():
                 logging.warning("Access denied (HTTP 403) detected. Restarting Tor...")
@@ -42,25 +47,17 @@ def find_email(full_name, company_name, driver, tor_process=None, max_retries=2,
                 driver.quit()
                 driver = setup_chrome_with_tor()
                 driver.get("https://skrapp.io/email-finder")
-                time.sleep(2)
-
-            # Wait for the name field to be present
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "name"))
-            )
+                wait_for_document_ready(driver)
 
-            # Fill full name field
-            full_name_field = driver.find_element(By.NAME, "name")
-            time.sleep(1.5)
+            # Wait for the name field to be present, then fill it
+            full_name_field = wait_for_element(driver, (By.NAME, "name"))
+            human_pause()
             full_name_field.clear()
             full_name_field.send_keys(full_name)
-            time.sleep(1)
+            human_pause()
 
             # Wait for company field to be enabled
-            company_field = driver.find_element(By.XPATH, "//input[@placeholder='Company name or website']")
-            WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@placeholder='Company name or website']"))
-            )
+            company_field = wait_for_element(driver, (By.XPATH, "//input[@placeholder='Company name or website']"), condition=EC.element_to_be_clickable)
 
             # If still disabled, try JavaScript to enable
             if company_field.get_attribute("disabled"):
@@ -71,34 +68,25 @@ def find_email(full_name, company_name, driver, tor_process=None, max_retries=2,
 
             # Handle autocomplete if present
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "MuiAutocomplete-option.css-146xefr"))
-                )
-                autocomplete_option = driver.find_element(By.CLASS_NAME, "MuiAutocomplete-option.css-146xefr")
+                autocomplete_option = wait_for_element(driver, (By.CLASS_NAME, "MuiAutocomplete-option.css-146xefr"))
                 autocomplete_option.click()
-                time.sleep(random.uniform(0.5, 1))
+                human_pause()
             except:
                 pass  # No autocomplete or no options found
 
             # Click Find Email button
-            find_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".MuiTypography-root.css-1ulaxtk"))
-            )
+            find_button = wait_for_element(driver, (By.CSS_SELECTOR, ".MuiTypography-root.css-1ulaxtk"), condition=EC.element_to_be_clickable)
+            human_pause()
             try:
-                time.sleep(random.uniform(1, 3))
                 find_button.click()
-                time.sleep(random.uniform(3, 5))
             except:
                 driver.execute_script("arguments[0].click();", find_button)
-                time.sleep(random.uniform(3, 5))
 
             # Wait for either email result, "no result" message, or "search limit reached" message
             try:
-                WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located((
-                        By.XPATH, "//*[contains(text(), 'No result found!') or contains(@class, 'css-17x39hc') or contains(text(),'Search limit reached!') or contains(@class, 'css-1buerh9')]"
-                    ))
-                )
+                wait_for_element(driver, (
+                    By.XPATH, "//*[contains(text(), 'No result found!') or contains(@class, 'css-17x39hc') or contains(text(),'Search limit reached!') or contains(@class, 'css-1buerh9')]"
+                ), timeout=13)
                 logging.info(f"Found Result element")
             except:
                 logging.warning(f"Timeout waiting for result for {full_name} at {company_name}")
@@ -146,7 +134,7 @@ def find_email(full_name, company_name, driver, tor_process=None, max_retries=2,
     logging.warning(f"Failed to find email for {full_name} at {company_name} after {max_retries} attempts")
     return None, "no_result", tor_process  # MODIFIED: Default to "no_result" on failure
 
-def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size=50, tor_restart_interval=30, offset=0, delete_no_email=True, job_id=None, step_id='step6'):
+def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size=50, tor_restart_interval=30, offset=0, delete_no_email=True, job_id=None, step_id='step6', windowed=False):
     """
     Processes a CSV file, finds emails using Skrapp.io, and updates the CSV with Email and Status columns.
     Optionally deletes rows where Email_Found is False after processing.
@@ -164,6 +152,8 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
         delete_no_email (bool): If True, delete rows where Email_Found is False after processing.
         job_id (str): UUID of the job for progress tracking.
         step_id (str): Identifier for the processing step (default: 'step6').
+        windowed (bool): If True, only rows [offset, offset + max_rows) and the columns this step uses are loaded;
+                         the processed rows are merged back into the full output at the end.
     Returns:
         pd.DataFrame: The updated DataFrame or None if an error occurs.
     """
@@ -171,10 +161,18 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
         df, resolved_input_csv = load_csv(
             input_csv=input_csv,
             output_csv=output_csv,
-            required_columns=['Full Name', 'Website']
+            required_columns=['Full Name', 'Website'],
+            offset=offset,
+            max_rows=max_rows if windowed else None,
+            columns=WINDOW_COLUMNS
         )
         if df is None:
             return None
+        window = df.attrs.get("window") # Set by load_csv in windowed mode
+        # Absolute row count up to the end of the loaded rows (the window end in windowed mode)
+        row_count = df.index[-1] + 1 if not df.empty else 0
+        # Report the in-memory footprint of the loaded (compact) DataFrame with the job
+        record_job_metrics(step_id, job_id, rows_loaded=len(df), memory_mb=dataframe_memory_mb(df))
         
         # Initialize Status column
         if 'Email' not in df.columns:
@@ -191,12 +189,12 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
         if offset < 0:
             logging.error("Offset cannot be negative")
             raise ValueError("Offset cannot be negative")
-        if offset >= len(df):
-            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {len(df)}, no rows to process")
+        if offset >= row_count:
+            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {row_count}, no rows to process")
             return df
 
         # Adjust max_rows considering the offset
-        total_rows = min(len(df) - offset, max_rows)
+        total_rows = min(row_count - offset, max_rows)
         if total_rows <= 0:
             logging.info(f"No rows to process after applying offset {offset} and max_rows {max_rows}")
             return df
@@ -206,10 +204,14 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
         # Initialize Tor and WebDriver
         tor_process = start_tor()
         time.sleep(5)  # Wait for Tor to initialize
-        driver = setup_chrome_with_tor()
+        driver_pool = get_driver_pool("tor")
+        driver = driver_pool.lease()
 
         # Track if process was stopped
         stopped = False
+        wait_totals = {"wait_seconds": 0.0, "work_seconds": 0.0} # Time spent waiting on pages vs working
+        finder_cache = get_email_finder_cache() # Results of earlier searches, keyed by (normalized name, domain)
+        cache_stats = {"finder_cache_hits": 0, "finder_searches": 0}
 
         try:
             # Process rows in batches for logging purposes
@@ -219,12 +221,12 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
                 if check_stop_signal(step_id):
                     logging.info("Stop signal detected, terminating process")
                     write_progress(start_idx + 1, total_rows + offset, job_id, step_id=step_id, stop_call=True)
-                    df.to_csv(output_csv, index=False)
+                    save_stage_file(df, output_csv, window=window)
                     stopped = True
                     break
 
                 end_idx = min(start_idx + batch_size, offset + total_rows)
-                batch = df.iloc[start_idx:end_idx]
+                batch = df.loc[start_idx:end_idx - 1]
 
                 # Check for unprocessed or search_limit rows
                 unprocessed_mask = batch['Status'].isin(['', 'search_limit'])
@@ -240,7 +242,7 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
                     if check_stop_signal(step_id):
                         logging.info("Stop signal detected, terminating process")
                         write_progress(idx + 1, total_rows + offset, job_id, step_id=step_id, stop_call=True)
-                        df.to_csv(output_csv, index=False)
+                        save_stage_file(df, output_csv, window=window)
                         stopped = True
                         break
 
@@ -252,35 +254,56 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
                         logging.warning(f"Skipping row {idx + 1}: No valid website for {full_name}")
                         df.at[idx, 'Email'] = ""
                         df.at[idx, 'Status'] = "no_result"  # Set Status to "no_result"
-                        df.to_csv(output_csv, index=False)
+                        save_stage_file(df, output_csv, window=window)
                         logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
                         write_progress(idx + 1, total_rows + offset, job_id, step_id=step_id)
                         continue
 
+                    # Reuse the result of an earlier search for the same person and domain
+                    cache_key = email_finder_cache_key(full_name, website)
+                    cached = finder_cache.get(cache_key) if cache_key else None
+                    if cached is not None:
+                        logging.info(f"Finder cache hit for row {idx + 1}: {full_name} at {website} ({cached['status']})")
+                        df.at[idx, 'Email'] = cached['Email']
+                        df.at[idx, 'Status'] = cached['status']
+                        cache_stats["finder_cache_hits"] += 1
+                        save_stage_file(df, output_csv, window=window)
+                        write_progress(idx + 1, total_rows + offset, job_id, step_id=step_id)
+                        continue
+
                     # Check if Tor needs restarting
                     if rows_since_last_tor_restart >= tor_restart_interval:
                         logging.info("Restarting Tor process...")
-                        driver, tor_process = restart_driver_and_tor(driver, tor_process, True, False)
+                        driver, tor_process = restart_pooled_driver_and_tor(driver_pool, driver, tor_process)
                         rows_since_last_tor_restart = 0
                         logging.info("Tor process restarted and new driver initialized")
 
                     logging.info(f"Processing row {idx + 1}/{len(df)}: {full_name} at {website}")
+                    reset_wait_timer()
                     email, status, tor_process = find_email(full_name, website, driver, tor_process)  # MODIFIED: Receive status
 
                     # Handle search limit reached
                     if status == "search_limit":
                         logging.info(f"Search limit reached for row {idx + 1}, restarting Tor and retrying")
-                        driver, tor_process = restart_driver_and_tor(driver, tor_process, True, False)
+                        driver, tor_process = restart_pooled_driver_and_tor(driver_pool, driver, tor_process)
                         rows_since_last_tor_restart = 0
                         # Retry the same row
                         email, status, tor_process = find_email(full_name, website, driver, tor_process)  # MODIFIED: Retry with status
 
+                    row_timing = read_wait_timer()
+                    for key, value in row_timing.items():
+                        wait_totals[key] += value
+                    logging.info(f"Row {idx + 1} timing: waited {row_timing['wait_seconds']}s, worked {row_timing['work_seconds']}s")
+
                     df.at[idx, 'Email'] = email if email and status != "search_limit" else ""
                     df.at[idx, 'Status'] = status  # MODIFIED: Set Status column
                     rows_since_last_tor_restart += 1
+                    cache_stats["finder_searches"] += 1
+                    if cache_key and status in CACHED_FINDER_STATUSES:
+                        finder_cache.set(cache_key, {"Email": df.at[idx, 'Email']}, status=status)
 
                     # Save progress after each row
-                    df.to_csv(output_csv, index=False)
+                    save_stage_file(df, output_csv, window=window)
                     logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
                     write_progress(idx + 1, total_rows + offset, job_id, step_id=step_id)
 
@@ -291,16 +314,16 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
 
         finally:
             # Clean up and set final status
-            try:
-                driver.quit()
-            except:
-                logging.error("Error closing WebDriver")
+            driver_pool.release(driver)
             if tor_process:
                 try:
                     stop_tor(tor_process)
                 except:
                     logging.error("Error stopping Tor process")
-            logging.info("WebDriver and Tor process closed")
+            logging.info("WebDriver returned to the pool and Tor process closed")
+            record_job_metrics(step_id, job_id, **{key: round(value, 1) for key, value in wait_totals.items()})
+            record_job_metrics(step_id, job_id, **cache_stats)
+            logging.info(f"Finder cache: {cache_stats['finder_cache_hits']} hits, {cache_stats['finder_searches']} searches run")
 
             # Only write final progress if not already stopped
             if not stopped:
@@ -315,11 +338,13 @@ def process_csv_and_find_emails(input_csv, output_csv, max_rows=2000, batch_size
             deleted_rows = initial_row_count - len(df)
             if deleted_rows > 0:
                 logging.info(f"Deleted {deleted_rows} rows where Status was 'no_result'")
-                df.to_csv(output_csv, index=False)
+                save_stage_file(df, output_csv, window=window)
                 logging.info(f"Saved final DataFrame after deleting rows to {output_csv}")
             else:
                 logging.info("No rows with Status 'no_result' found to delete")
 
+        # Export the final state as CSV (the format shared between steps)
+        export_csv(df, output_csv, window=window)
         logging.info(f"Final row count after processing: {len(df)}")
         return df
 
@@ -0,0 +1,135 @@
+"""
+Persistent cache of Email Finder results keyed by (normalized full name, domain).
+
+Step 6 consults this cache before running a Skrapp.io search, so a person who was already searched
+in an earlier campaign does not use the daily search quota again. Found emails are kept for
+Config.EMAIL_FINDER_CACHE_TTL_DAYS; "no_result" answers are cached too (negative caching) but expire
+sooner, after Config.EMAIL_FINDER_NEGATIVE_TTL_DAYS, because the finder's database keeps growing.
+
+Existing Step 6 outputs can be imported once with:
+    python -m backend.scripts.sales_navigator_scrape.email_finder_cache [emails_dir]
+"""
+import logging
+import os
+import re
+import sys
+import unicodedata
+import pandas as pd
+from backend.config import Config
+from config.cache import ResultCache
+
+# Finder statuses that are stored in the cache ("search_limit" is a transient failure and never cached)
+CACHED_FINDER_STATUSES = ("found", "no_result")
+
+_email_finder_cache = None
+
+def get_email_finder_cache():
+    """
+    Returns the persistent Email Finder cache, opening it on first use.
+
+    Returns:
+        ResultCache: The "email_finder" cache.
+    """
+    global _email_finder_cache
+    if _email_finder_cache is None:
+        _email_finder_cache = ResultCache(
+            "email_finder",
+            ttl_days=Config.EMAIL_FINDER_CACHE_TTL_DAYS,
+            status_ttl_days={"no_result": Config.EMAIL_FINDER_NEGATIVE_TTL_DAYS},
+        )
+    return _email_finder_cache
+
+def normalize_person_name(full_name):
+    """
+    Normalizes a full name for cache lookups: accents removed, lowercase, punctuation dropped, single spaces.
+
+    Parameters:
+        full_name (str): Full name of the lead.
+
+    Returns:
+        str: Normalized name, e.g. "José  O'Neil" -> "jose oneil".
+    """
+    name = unicodedata.normalize("NFKD", str(full_name or ""))
+    name = "".join(char for char in name if not unicodedata.combining(char)).lower()
+    name = re.sub(r"[^\w\s-]", "", name)
+    return " ".join(name.replace("-", " ").split())
+
+def normalize_domain(website):
+    """
+    Normalizes a website or domain for cache lookups: no scheme, "www.", path or port, lowercase.
+
+    Parameters:
+        website (str): Website or domain of the company.
+
+    Returns:
+        str: Domain such as "example.com", or "" if none is given.
+    """
+    domain = str(website or "").strip().lower()
+    if domain in ("", "none", "nan"):
+        return ""
+    domain = re.sub(r"^[a-z]+://", "", domain).split("/")[0].split(":")[0]
+    return domain[4:] if domain.startswith("www.") else domain
+
+def email_finder_cache_key(full_name, website):
+    """
+    Returns the cache key of a lead.
+
+    Parameters:
+        full_name (str): Full name of the lead.
+        website (str): Website or domain of the company.
+
+    Returns:
+        str or None: "<normalized name>|<domain>", or None if the name or domain is missing.
+    """
+    name = normalize_person_name(full_name)
+    domain = normalize_domain(website)
+    return f"{name}|{domain}" if name and domain else None
+
+def import_email_finder_cache(emails_path=None):
+    """
+    Backfills the Email Finder cache from existing Step 6 output CSVs.
+    The file's modification time is used as the fetch time, so old results expire as usual.
+    Files are imported oldest first, so the newest result for a lead wins.
+
+    Parameters:
+        emails_path (str, optional): Folder with Step 6 CSVs. Defaults to Config.EMAILS_PATH.
+
+    Returns:
+        int: Number of cache entries written, or None if the folder does not exist.
+    """
+    emails_path = emails_path or Config.EMAILS_PATH
+    if not os.path.isdir(emails_path):
+        logging.error(f"Emails folder '{emails_path}' not found.")
+        print(f"Error: Emails folder '{emails_path}' not found.")
+        return None
+
+    cache = get_email_finder_cache()
+    imported = 0
+    file_paths = [os.path.join(emails_path, name) for name in os.listdir(emails_path) if name.endswith(".csv")]
+    for file_path in sorted(file_paths, key=os.path.getmtime):
+        file_name = os.path.basename(file_path)
+        try:
+            df = pd.read_csv(file_path, dtype=str, keep_default_na=False, usecols=lambda col: col in ('Full Name', 'Website', 'Email', 'Status'))
+        except Exception as e:
+            logging.warning(f"Skipping '{file_name}': {e}")
+            continue
+        if not {'Full Name', 'Website', 'Status'}.issubset(df.columns):
+            logging.info(f"Skipping '{file_name}': no Full Name/Website/Status columns")
+            continue
+
+        df = df[df['Status'].isin(CACHED_FINDER_STATUSES)]
+        entries = []
+        for full_name, website, email, status in zip(df['Full Name'], df['Website'], df.get('Email', pd.Series("", index=df.index)), df['Status']):
+            key = email_finder_cache_key(full_name, website)
+            if key and (status == "no_result" or email):
+                entries.append((key, {"Email": email if status == "found" else ""}, status))
+        count = cache.set_many(entries, fetched_at=os.path.getmtime(file_path))
+        imported += count
+        logging.info(f"Imported {count} finder results from '{file_name}'")
+        print(f"Imported {count} finder results from '{file_name}'")
+
+    print(f"Email finder cache now holds {cache.count()} entries ({imported} imported)")
+    return imported
+
+if __name__ == "__main__":
+    import_email_finder_cache(sys.argv[1] if len(sys.argv) > 1 else None)
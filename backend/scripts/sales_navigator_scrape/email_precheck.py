@@ -0,0 +1,144 @@
+"""
+Offline pre-verification of email addresses before Step 7.
+
+Every check in this module is vectorized over the whole 'Email' column, so a file is checked in one
+pass before any browser work starts. Each address gets a 'PreCheck' label:
+- "ok": worth verifying with the browser.
+- "invalid_syntax": not a well-formed address (RFC 5322 dot-atom local part, DNS domain with a TLD).
+- "role": a shared role mailbox such as info@ or sales@ (ROLE_LOCAL_PARTS).
+- "disposable": a throwaway mailbox provider (DISPOSABLE_DOMAINS).
+- "duplicate": the same address (after lowercasing) appears on an earlier row; it gets that row's result.
+
+Labels listed in Config.PRECHECK_SKIP are not sent to the verifier; their 'Email Status' is set from
+PRECHECK_EMAIL_STATUS instead.
+"""
+import logging
+import pandas as pd
+from backend.config import Config
+from config.precheck_labels import PRECHECK_OK, PRECHECK_INVALID_SYNTAX, PRECHECK_ROLE, PRECHECK_DISPOSABLE, PRECHECK_DUPLICATE
+
+# 'Email Status' written for rows skipped by the pre-check ("Invalid" matches verify_emails.STATUS_INVALID)
+PRECHECK_EMAIL_STATUS = {
+    PRECHECK_INVALID_SYNTAX: "Invalid",
+    PRECHECK_ROLE: "Role",
+    PRECHECK_DISPOSABLE: "Disposable",
+}
+
+# Lowercase address: dot-atom local part, then one or more DNS labels and an alphabetic TLD
+EMAIL_PATTERN = (
+    r"[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}"
+)
+
+# Local parts of shared role mailboxes (compared without any "+tag")
+ROLE_LOCAL_PARTS = frozenset({
+    "admin", "administrator", "billing", "booking", "bookings", "careers", "contact", "contactus",
+    "customerservice", "enquiries", "enquiry", "events", "finance", "frontdesk", "hello", "help",
+    "hostmaster", "hr", "info", "information", "inquiries", "jobs", "marketing", "media", "news",
+    "newsletter", "no-reply", "noreply", "office", "postmaster", "press", "privacy", "reception",
+    "recruitment", "reservations", "root", "sales", "security", "service", "spam", "support",
+    "team", "webmaster",
+})
+
+# Throwaway mailbox providers
+DISPOSABLE_DOMAINS = frozenset({
+    "10minutemail.com", "20minutemail.com", "discard.email", "dispostable.com", "emailondeck.com",
+    "fakeinbox.com", "getairmail.com", "getnada.com", "guerrillamail.biz", "guerrillamail.com",
+    "guerrillamail.de", "guerrillamail.info", "guerrillamail.net", "guerrillamail.org", "mailcatch.com",
+    "maildrop.cc", "mailinator.com", "mailinator.net", "mailnesia.com", "mintemail.com", "mohmal.com",
+    "moakt.com", "mytemp.email", "sharklasers.com", "spamgourmet.com", "temp-mail.io", "temp-mail.org",
+    "tempail.com", "tempmail.com", "tempmailo.com", "tempr.email", "throwawaymail.com", "trashmail.com",
+    "trashmail.de", "yopmail.com", "yopmail.fr", "yopmail.net",
+})
+
+
+def normalize_emails(emails):
+    """
+    Strips and lowercases a column of email addresses. Missing values become "".
+
+    Parameters:
+        emails (pd.Series): Email addresses.
+
+    Returns:
+        pd.Series: Normalized addresses.
+    """
+    return emails.fillna("").astype(str).str.strip().str.lower()
+
+
+def precheck_emails(emails):
+    """
+    Labels every address of a column (see the module docstring for the labels).
+    The first occurrence of an address keeps its own label; later occurrences are "duplicate".
+
+    Parameters:
+        emails (pd.Series): Email addresses.
+
+    Returns:
+        pd.DataFrame: 'Email' (normalized) and 'PreCheck' columns with the index of `emails`.
+    """
+    normalized = normalize_emails(emails)
+    valid = normalized.str.fullmatch(EMAIL_PATTERN).fillna(False).astype(bool)
+    parts = normalized.str.rsplit("@", n=1)
+    local_part = parts.str[0].str.split("+", n=1).str[0]
+    domain = parts.str[-1]
+
+    precheck = pd.Series(PRECHECK_OK, index=normalized.index)
+    precheck[valid & local_part.isin(ROLE_LOCAL_PARTS)] = PRECHECK_ROLE
+    precheck[valid & domain.isin(DISPOSABLE_DOMAINS)] = PRECHECK_DISPOSABLE
+    precheck[valid & normalized.duplicated()] = PRECHECK_DUPLICATE
+    precheck[~valid] = PRECHECK_INVALID_SYNTAX
+    return pd.DataFrame({"Email": normalized, "PreCheck": precheck})
+
+
+def apply_precheck(df, rows, skip=None):
+    """
+    Pre-checks the given rows in place: normalizes their 'Email', writes 'PreCheck' and marks rows
+    with a skipped label as processed with the matching 'Email Status'. Duplicates are detected
+    against all rows of `df`, so a row repeating an already verified address is resolved at once.
+
+    Parameters:
+        df (pd.DataFrame): Lead data with 'Email', 'Email Status' and 'Email_Processed' columns.
+        rows (pd.Index): Labels of the rows to check (the unprocessed rows of the run).
+        skip (iterable, optional): Labels that are not verified. Defaults to Config.PRECHECK_SKIP.
+
+    Returns:
+        dict: Number of checked rows per label.
+    """
+    skip = set(Config.PRECHECK_SKIP if skip is None else skip)
+    if 'PreCheck' not in df.columns:
+        df['PreCheck'] = ""
+    checked = precheck_emails(df['Email'])
+    checked = checked.loc[rows]
+    df.loc[rows, 'Email'] = checked['Email']
+    df.loc[rows, 'PreCheck'] = checked['PreCheck']
+
+    skipped = checked.index[checked['PreCheck'].isin(skip & set(PRECHECK_EMAIL_STATUS))]
+    df.loc[skipped, 'Email Status'] = checked.loc[skipped, 'PreCheck'].map(PRECHECK_EMAIL_STATUS)
+    df.loc[skipped, 'Email_Processed'] = True
+    resolve_duplicates(df)
+
+    counts = checked['PreCheck'].value_counts().to_dict()
+    logging.info(f"Pre-check of {len(checked)} rows: {counts}; {len(skipped)} rows skipped")
+    return counts
+
+
+def resolve_duplicates(df):
+    """
+    Copies the result of the first processed occurrence of an address to its unprocessed
+    "duplicate" rows. Duplicates whose original has no final result yet are left unprocessed.
+
+    Parameters:
+        df (pd.DataFrame): Lead data with 'Email', 'PreCheck', 'Email Status' and 'Email_Processed' columns.
+
+    Returns:
+        int: Number of duplicate rows resolved.
+    """
+    duplicates = (df['PreCheck'] == PRECHECK_DUPLICATE) & ~df['Email_Processed'].astype(bool)
+    if not duplicates.any():
+        return 0
+    originals = df[df['Email_Processed'].astype(bool) & (df['PreCheck'] != PRECHECK_DUPLICATE)]
+    status_by_email = originals.assign(Email=normalize_emails(originals['Email'])).drop_duplicates('Email').set_index('Email')['Email Status']
+    statuses = normalize_emails(df.loc[duplicates, 'Email']).map(status_by_email).dropna()
+    df.loc[statuses.index, 'Email Status'] = statuses
+    df.loc[statuses.index, 'Email_Processed'] = True
+    return len(statuses)
@@ -0,0 +1,103 @@
+"""
+Persistent cache of email verification results (Step 7).
+
+Two tables are kept:
+- "email_verification": the last verification status of each address, with a TTL per status
+  (Config.VERIFY_CACHE_VALID_TTL_DAYS, VERIFY_CACHE_INVALID_TTL_DAYS, VERIFY_CACHE_CATCH_ALL_TTL_DAYS).
+- "catch_all_domains": domains that answered "Catch-All". Such a domain accepts every address, so any
+  new address on it gets the same result without a browser round trip (Config.CATCH_ALL_DOMAIN_TTL_DAYS).
+
+Transient outcomes (search_limit, timeout, connection_error, no_result) are never cached.
+"""
+from backend.config import Config
+from config.cache import ResultCache
+
+# Verification statuses stored in the cache (see STATUS_* in verify_emails.py)
+CACHED_VERIFICATION_STATUSES = ("Valid", "Invalid", "Catch-All")
+CATCH_ALL_STATUS = "Catch-All"
+
+_verification_cache = None
+_catch_all_domain_cache = None
+
+def get_email_verification_cache():
+    """
+    Returns the per-address verification cache, opening it on first use.
+
+    Returns:
+        ResultCache: The "email_verification" cache.
+    """
+    global _verification_cache
+    if _verification_cache is None:
+        _verification_cache = ResultCache(
+            "email_verification",
+            ttl_days=Config.VERIFY_CACHE_VALID_TTL_DAYS,
+            status_ttl_days={
+                "Valid": Config.VERIFY_CACHE_VALID_TTL_DAYS,
+                "Invalid": Config.VERIFY_CACHE_INVALID_TTL_DAYS,
+                CATCH_ALL_STATUS: Config.VERIFY_CACHE_CATCH_ALL_TTL_DAYS,
+            },
+        )
+    return _verification_cache
+
+def get_catch_all_domain_cache():
+    """
+    Returns the cache of known catch-all domains, opening it on first use.
+
+    Returns:
+        ResultCache: The "catch_all_domains" cache.
+    """
+    global _catch_all_domain_cache
+    if _catch_all_domain_cache is None:
+        _catch_all_domain_cache = ResultCache("catch_all_domains", ttl_days=Config.CATCH_ALL_DOMAIN_TTL_DAYS)
+    return _catch_all_domain_cache
+
+def email_domain(email):
+    """
+    Returns the lowercase domain of an email address.
+
+    Parameters:
+        email (str): Email address.
+
+    Returns:
+        str: Domain, or "" if the address has no "@".
+    """
+    email = str(email or "").strip().lower()
+    return email.rsplit("@", 1)[1] if "@" in email else ""
+
+def lookup_verification(email):
+    """
+    Looks up a cached verification result for an address, first by address and then by catch-all domain.
+
+    Parameters:
+        email (str): Email address.
+
+    Returns:
+        tuple: (status, source) where source is "email" or "catch_all_domain", or (None, None) if not cached.
+    """
+    key = str(email or "").strip().lower()
+    if not key:
+        return None, None
+    cached = get_email_verification_cache().get(key)
+    if cached is not None:
+        return cached["status"], "email"
+    domain = email_domain(key)
+    if domain and get_catch_all_domain_cache().get(domain) is not None:
+        return CATCH_ALL_STATUS, "catch_all_domain"
+    return None, None
+
+def record_verification(email, status):
+    """
+    Stores a verification result. Catch-All results also mark the address's domain as catch-all.
+    Statuses other than CACHED_VERIFICATION_STATUSES are ignored.
+
+    Parameters:
+        email (str): Email address.
+        status (str): Verification status.
+    """
+    key = str(email or "").strip().lower()
+    if not key or status not in CACHED_VERIFICATION_STATUSES:
+        return
+    get_email_verification_cache().set(key, {}, status=status)
+    domain = email_domain(key)
+    if status == CATCH_ALL_STATUS and domain:
+        get_catch_all_domain_cache().set(domain, {"example_email": key}, status=status)
@@ -11,6 +11,7 @@ The script is designed to be robust, incorporating features such as:
 - Batch processing of URLs from the input CSV.
 - Saving progress incrementally to an output CSV file.
 - Optional deletion of rows from the output if a website URL could not be found.
+- A persistent company cache (SQLite), so a company's About page is fetched once across rows and campaigns.
 - Progress tracking and the ability to be stopped gracefully via an external signal.
 
 It relies on pandas for CSV manipulation, Selenium for web scraping, and tldextract
@@ -22,17 +23,107 @@ import pandas as pd
 import time
 import random
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import os
 import logging
 from urllib.parse import urlparse, parse_qs, unquote
 import tldextract
-from backend.scripts.selenium.driver_setup_for_scrape import restart_driver_and_tor, setup_driver_linkedin_singin
+from backend.scripts.selenium.driver_setup_for_scrape import restart_driver_and_tor
+from backend.scripts.selenium.driver_pool import get_driver_pool
+from backend.scripts.selenium.wait_helpers import wait_for_document_ready, wait_for_element, wait_for_network_idle, element_with_text, reset_wait_timer, read_wait_timer
 from backend.config import Config
-from config.job_functions import write_progress, check_stop_signal
-from config.utils import load_csv
+from config.job_functions import write_progress, check_stop_signal, record_job_metrics
+from config.utils import load_csv, save_stage_file, export_csv, dataframe_memory_mb
+from config.cache import ResultCache
+from backend.scripts.sales_navigator_scrape.normalize_leads import canonical_company_url
+
+# Columns loaded when the step runs in windowed mode
+WINDOW_COLUMNS = ['First Name', 'Company Id', 'Regular Company Url', 'Website', 'About_Text', 'Processed_About_Website']
+
+_company_cache = None
+
+def get_company_cache():
+    """
+    Returns the persistent company cache (Website and About_Text per company), opening it on first use.
+
+    Returns:
+        ResultCache: The "company_about" cache with a TTL of Config.COMPANY_CACHE_TTL_DAYS.
+    """
+    global _company_cache
+    if _company_cache is None:
+        _company_cache = ResultCache("company_about", ttl_days=Config.COMPANY_CACHE_TTL_DAYS)
+    return _company_cache
+
+def company_cache_keys(company_id, company_url):
+    """
+    Returns the cache keys of a company: its LinkedIn company ID and its canonical company URL (when known).
+
+    Parameters:
+        company_id (str): Value of the 'Company Id' column (may be empty).
+        company_url (str): LinkedIn company URL.
+
+    Returns:
+        list: Keys like ["id:12345", "url:https://www.linkedin.com/company/example"].
+    """
+    keys = []
+    company_id = str(company_id or "").strip()
+    if company_id.isdigit():
+        keys.append(f"id:{company_id}")
+    canonical_url = canonical_company_url(company_url)
+    if "/company/" in canonical_url:
+        keys.append(f"url:{canonical_url}")
+    return keys
+
+def lookup_company_cache(cache, keys, cached=None):
+    """
+    Returns the first fresh cache entry for any of a company's keys.
+
+    Parameters:
+        cache (ResultCache): The company cache.
+        keys (list): Keys from `company_cache_keys`.
+        cached (dict, optional): Entries already read with `cache.get_many`; the cache is queried if omitted.
+
+    Returns:
+        dict or None: {"Website", "About_Text", ...} or None if the company is not cached.
+    """
+    cached = cache.get_many(keys) if cached is None else cached
+    return next((cached[key] for key in keys if key in cached), None)
+
+def plan_company_groups(df, row_indices, linkedin_column='Regular Company Url'):
+    """
+    Groups rows by their canonical LinkedIn company URL, in order of first appearance.
+
+    Parameters:
+        df (pd.DataFrame): Lead data.
+        row_indices (iterable): Index labels of the rows to plan.
+        linkedin_column (str): Column with the LinkedIn company URL.
+
+    Returns:
+        tuple: (company_groups, invalid_rows) where company_groups maps each canonical company URL to the list
+               of its row indices, and invalid_rows lists the rows without a valid LinkedIn company URL.
+    """
+    company_groups = {}
+    invalid_rows = []
+    for idx in row_indices:
+        company_url = df.at[idx, linkedin_column]
+        if pd.notna(company_url) and "/company/" in company_url:
+            company_groups.setdefault(canonical_company_url(company_url), []).append(idx)
+        else:
+            invalid_rows.append(idx)
+    return company_groups, invalid_rows
+
+def apply_company_result(df, rows, result):
+    """
+    Writes a company's Website and About_Text to all of its rows and marks them processed if a website was found.
+
+    Parameters:
+        df (pd.DataFrame): Lead data (updated in place).
+        rows (list): Index labels of the company's rows.
+        result (dict): Result with "Website" and "About_Text" (from `extract_company_info` or the cache).
+    """
+    df.loc[rows, 'Website'] = result['Website']
+    df.loc[rows, 'About_Text'] = result['About_Text']
+    df.loc[rows, 'Processed_About_Website'] = result['Website'] != "None"
 
 def extract_company_info(first_name, company_url, index, driver, max_retries=3, retry_delay=3):
     """
@@ -77,27 +168,26 @@ def extract_company_info(first_name, company_url, index, driver, max_retries=3,
         try:
             logging.debug(f"Attempt {attempt} to get URL: {company_url} for {first_name}")
             driver.get(company_url)
-            time.sleep(random.uniform(2, 4))  # Allow time for dynamic content like JavaScript to load
+            wait_for_document_ready(driver)  # Wait until the DOM is parsed instead of a fixed delay
 
             # Check if LinkedIn redirected to a login page
             if "linkedin.com/login" in driver.current_url:
                 logging.error(f"Login required for {company_url} (First Name: {first_name}). Attempting re-login...")
                 # Re-initialize driver with login credentials
                 driver, _ = restart_driver_and_tor(driver=driver, tor_process=None, use_tor=False, linkedin=True)
-                time.sleep(2)                       # Wait for re-login process
                 driver.get(company_url)             # Try accessing the company URL again
-                time.sleep(random.uniform(2, 4))    # Allow page to load after re-login
+                wait_for_document_ready(driver)     # Wait for the page to load after re-login
 
-            wait = WebDriverWait(driver, 10) # Explicit wait for elements
+            # LinkedIn fills the About panel in with XHR requests after the DOM is ready. Let them settle,
+            # then still wait for the specific elements below (idle is only a hint).
+            wait_for_network_idle(driver, timeout=8)
 
             # --- Extract Website ---
             website = "None"
             try:
                 # XPath to locate the website link. It looks for a 'dt' containing "Website"
                 # and gets the 'a' tag in the following 'dd', or a generic link within a 'dd' for "Website".
-                website_element = wait.until(
-                    EC.presence_of_element_located((By.XPATH, '//section[contains(@class, "org-about-module__margin-bottom")]//dl//dt[contains(., "Website")]/following-sibling::dd[1]/a | //a[contains(@href, "http") and ancestor::dd[contains(., "Website")]]'))
-                )
+                website_element = wait_for_element(driver, (By.XPATH, '//section[contains(@class, "org-about-module__margin-bottom")]//dl//dt[contains(., "Website")]/following-sibling::dd[1]/a | //a[contains(@href, "http") and ancestor::dd[contains(., "Website")]]'))
                 raw_href = website_element.get_attribute("href").strip() if website_element else "None"
 
                 # Handle LinkedIn's redirect URLs (e.g., linkedin.com/redir/redirect?url=ENCODED_URL&...)
@@ -124,9 +214,8 @@ def extract_company_info(first_name, company_url, index, driver, max_retries=3,
                 # XPath to locate the "About" text, typically in a <p> tag within a specific section.
                 # It targets paragraphs with class "break-words" inside "org-about-module__margin-bottom" section,
                 # or any paragraph inside an "org-about-module" section as a fallback.
-                about_element = wait.until(
-                    EC.presence_of_element_located((By.XPATH, '//section[contains(@class, "org-about-module__margin-bottom")]//p[contains(@class, "break-words")] | //section[contains(@class, "org-about-module")]//p'))
-                )
+                # Wait until the paragraph has text, not just until it is in the DOM.
+                about_element = wait_for_element(driver, (By.XPATH, '//section[contains(@class, "org-about-module__margin-bottom")]//p[contains(@class, "break-words")] | //section[contains(@class, "org-about-module")]//p'), condition=element_with_text)
                 about_text = about_element.text.strip() if about_element else "None"
                 logging.info(f"Extracted About_Text for {first_name} (Row {index + 1}): {about_text[:50]}...") # Log first 50 chars
             except (TimeoutException, Exception) as e:
@@ -147,14 +236,13 @@ def extract_company_info(first_name, company_url, index, driver, max_retries=3,
                 time.sleep(retry_delay)
                 # Restart driver if a severe error occurred, ensuring a fresh session for retry
                 driver, _ = restart_driver_and_tor(driver, None, use_tor=False, linkedin=True)
-                time.sleep(2) # Wait for driver to restart
             else:
                 logging.error(f"Max retries reached for {company_url}. Skipping.")
                 return result, driver # Return default result after max retries
 
     return result, driver # Should ideally be returned within the loop
 
-def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_size=50, delete_no_website=True, offset=0, job_id=None, step_id='step5'):
+def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_size=50, delete_no_website=True, offset=0, job_id=None, step_id='step5', windowed=False):
     """
     Processes a CSV file containing LinkedIn company URLs, extracts "About" text and website domains,
     and saves the enriched data to an output CSV.
@@ -168,12 +256,15 @@ def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_siz
     input_csv (str): Path to the input CSV file. Must contain a column named 'Regular Company Url'.
     output_csv (str): Path where the updated CSV file will be saved.
     max_rows (int): Maximum number of rows from the input CSV to process.
-    batch_size (int): Number of rows to process before potentially re-initializing WebDriver and logging.
+    batch_size (int): Number of companies to process per leased WebDriver. Rows are grouped by company,
+                      so each company's About page is fetched once for all of its rows.
     delete_no_website (bool): If True, rows where 'Website' remains "None" after processing
                               will be removed from the final output CSV.
     offset (int): Number of rows to skip from the beginning of the input CSV.
     job_id (str): A unique identifier for the current processing job (for external tracking).
     step_id (str): Identifier for the current step in a larger job pipeline (for external tracking).
+    windowed (bool): If True, only rows [offset, offset + max_rows) and the columns this step uses are loaded;
+                     the processed rows are merged back into the full output at the end.
                               step4 for job 4
 
     Returns:
@@ -188,10 +279,18 @@ def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_siz
         df, resolved_input_csv = load_csv(
             input_csv=input_csv,
             output_csv=output_csv,
-            required_columns=[linkedin_column]
+            required_columns=[linkedin_column],
+            offset=offset,
+            max_rows=max_rows if windowed else None,
+            columns=WINDOW_COLUMNS
         )
         if df is None: # load_csv returns None on failure (e.g., file not found)
             return None
+        window = df.attrs.get("window") # Set by load_csv in windowed mode
+        # Absolute row count up to the end of the loaded rows (the window end in windowed mode)
+        row_count = df.index[-1] + 1 if not df.empty else 0
+        # Report the in-memory footprint of the loaded (compact) DataFrame with the job
+        record_job_metrics(step_id, job_id, rows_loaded=len(df), memory_mb=dataframe_memory_mb(df))
 
         # Initialize new columns in the DataFrame if they don't already exist.
         if 'Website' not in df.columns:
@@ -217,116 +316,140 @@ def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_siz
         if offset < 0:
             logging.error("Offset cannot be negative.")
             raise ValueError("Offset cannot be negative")
-        if offset >= len(df):
-            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {len(df)}. No rows to process.")
+        if offset >= row_count:
+            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {row_count}. No rows to process.")
             return df # Return the original DataFrame as no processing is needed.
 
         # Calculate the total number of rows to actually process, considering offset and max_rows.
-        total_rows_to_process_after_offset = min(len(df) - offset, max_rows)
+        total_rows_to_process_after_offset = min(row_count - offset, max_rows)
         if total_rows_to_process_after_offset <= 0:
             logging.info(f"No rows to process after applying offset {offset} and max_rows {max_rows}.")
             return df
 
         logging.info(f"Total rows to process (after offset {offset}, up to max_rows {max_rows}): {total_rows_to_process_after_offset}")
 
+        # Plan the work by company: pending rows are grouped by canonical company URL, so every company
+        # is fetched once and its result is copied to all of its rows.
+        company_cache = get_company_cache()
+        cache_stats = {"cache_hits": 0, "companies_fetched": 0, "rows_shared": 0}
+        rows_in_range = df.loc[offset:offset + total_rows_to_process_after_offset - 1]
+        pending_rows = rows_in_range.index[~rows_in_range['Processed_About_Website']]
+        company_groups, invalid_rows = plan_company_groups(df, pending_rows, linkedin_column)
+        for idx in invalid_rows:
+            logging.warning(f"Skipping invalid or missing LinkedIn company URL in row {idx + 1}: {df.at[idx, linkedin_column]}")
+        company_keys = {
+            company_url: company_cache_keys(df.at[rows[0], 'Company Id'] if 'Company Id' in df.columns else None, company_url)
+            for company_url, rows in company_groups.items()
+        }
+
+        # Fill the rows of companies that are already in the persistent cache, so only uncached companies are fetched.
+        cached_companies = company_cache.get_many(key for keys in company_keys.values() for key in keys)
+        for company_url in list(company_groups):
+            entry = lookup_company_cache(company_cache, company_keys[company_url], cached_companies)
+            if entry is not None:
+                rows = company_groups.pop(company_url)
+                apply_company_result(df, rows, entry)
+                cache_stats["cache_hits"] += len(rows)
+        if cache_stats["cache_hits"]:
+            save_stage_file(df, output_csv, window=window)
+        logging.info(f"Company plan: {len(pending_rows)} pending rows, {cache_stats['cache_hits']} filled from the cache, "
+                     f"{len(company_groups)} unique companies to fetch, {len(invalid_rows)} rows without a company URL.")
+
+        # Progress is reported in rows (absolute, as before) and in companies.
+        total_rows_for_progress = offset + total_rows_to_process_after_offset
+        rows_done = total_rows_for_progress - sum(len(rows) for rows in company_groups.values())
+        companies = list(company_groups.items())
+        companies_done = 0
+        write_progress(rows_done, total_rows_for_progress, job_id, step_id=step_id, current_company=0, total_companies=len(companies))
+
         stopped = False # Flag to indicate if processing was stopped by an external signal.
+        driver_pool = get_driver_pool("linkedin") # Shared pool of warm LinkedIn browsers.
+        driver = None
+        wait_totals = {"wait_seconds": 0.0, "work_seconds": 0.0} # Time spent waiting on pages vs working
 
         try:
-            # Process rows in batches for better resource management and logging.
-            # The outer loop iterates from 'offset' up to 'offset + total_rows_to_process_after_offset'.
-            for batch_start_idx in range(offset, offset + total_rows_to_process_after_offset, batch_size):
+            # Process companies in batches; the WebDriver is leased from the pool per batch.
+            for batch_start in range(0, len(companies), batch_size):
                 # Check for an external stop signal before starting a new batch.
                 if check_stop_signal(step_id):
                     logging.info("Stop signal detected. Terminating processing.")
                     # Report current progress before stopping.
-                    write_progress(batch_start_idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id, stop_call=True)
-                    df.to_csv(output_csv, index=False) # Save current state.
+                    write_progress(rows_done, total_rows_for_progress, job_id, step_id=step_id, stop_call=True, current_company=companies_done, total_companies=len(companies))
+                    save_stage_file(df, output_csv, window=window) # Save current state.
                     stopped = True
                     break # Exit the batch processing loop.
 
-                batch_end_idx = min(batch_start_idx + batch_size, offset + total_rows_to_process_after_offset)
-                current_batch_df_slice = df.iloc[batch_start_idx:batch_end_idx]
-                
-                # Identify rows within the current batch that haven't been processed yet.
-                unprocessed_mask = ~current_batch_df_slice['Processed_About_Website']
-                if not unprocessed_mask.any():
-                    logging.info(f"Batch from index {batch_start_idx} to {batch_end_idx} already processed. Skipping.")
-                    write_progress(batch_end_idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id)
-                    continue # Move to the next batch.
-
-                logging.info(f"Processing batch: rows from index {batch_start_idx} to {batch_end_idx} (out of {offset + total_rows_to_process_after_offset} total to process).")
-                
+                batch_companies = companies[batch_start:batch_start + batch_size]
+                logging.info(f"Processing companies {batch_start + 1}-{batch_start + len(batch_companies)} of {len(companies)}.")
+
                 driver = None # Initialize WebDriver to None for the current batch.
                 try:
-                    # Setup Selenium WebDriver with LinkedIn login for this batch.
-                    # kill_chrome_processes() # Potentially useful if issues with lingering processes occur.
-                    driver = setup_driver_linkedin_singin()
-                    time.sleep(3) # Allow time for driver setup and login.
-
-                    # Iterate through each row in the current batch that needs processing.
-                    # 'idx' here is the original DataFrame index.
-                    for idx in current_batch_df_slice[unprocessed_mask].index:
-                        # Check for stop signal before processing each row.
+                    # Lease a warm WebDriver with the LinkedIn login from the shared pool for this batch.
+                    driver = driver_pool.lease()
+
+                    for company_url, rows in batch_companies:
+                        # Check for stop signal before processing each company.
                         if check_stop_signal(step_id):
-                            logging.info(f"Stop signal detected during row processing at index {idx + 1}. Terminating.")
-                            write_progress(idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id, stop_call=True)
-                            df.to_csv(output_csv, index=False) # Save progress.
+                            logging.info(f"Stop signal detected before company {company_url}. Terminating.")
+                            write_progress(rows_done, total_rows_for_progress, job_id, step_id=step_id, stop_call=True, current_company=companies_done, total_companies=len(companies))
+                            save_stage_file(df, output_csv, window=window) # Save progress.
                             stopped = True
-                            break # Exit the inner loop (row processing).
+                            break # Exit the inner loop (company processing).
 
                         # Check if the Selenium session has expired (e.g., redirected to login page).
                         if driver.current_url.startswith("https://www.linkedin.com/login"):
-                            logging.warning(f"Session expired for row {idx + 1}. Reinitializing WebDriver and re-logging in.")
+                            logging.warning(f"Session expired before company {company_url}. Reinitializing WebDriver and re-logging in.")
                             driver, _ = restart_driver_and_tor(driver, None, use_tor=False, linkedin=True)
-                            time.sleep(3) # Allow time for re-login.
-
-                        first_name = df.at[idx, 'First Name'] if 'First Name' in df.columns else f"Row_{idx+1}"
-                        company_url_original = df.at[idx, linkedin_column]
-
-                        # Process only if company URL is valid and seems like a LinkedIn company URL.
-                        if pd.notna(company_url_original) and "/company/" in company_url_original:
-                            logging.info(f"Processing row {idx + 1}/{len(df)}: URL {company_url_original}")
-                            
-                            # Standardize company URL: remove trailing slashes, ensure it ends with /about.
-                            company_url_for_about = company_url_original.rstrip('/').replace('/about', '')
-                            company_url_for_about = f"{company_url_for_about}/about"
-                            logging.info(f"Modified URL for scraping (row {idx + 1}): {company_url_for_about}")
-
-                            # Call the core extraction function.
-                            extraction_result, driver = extract_company_info(first_name, company_url_for_about, idx, driver)
-                            
-                            # Update DataFrame with extracted data.
-                            df.at[idx, 'Website'] = extraction_result['Website']
-                            df.at[idx, 'About_Text'] = extraction_result['About_Text']
-                            # Mark as processed if a website was found. This logic might be refined
-                            # to mark as processed even if website is None but About_Text was found,
-                            # or simply after any attempt. Currently, it's based on website success.
-                            df.at[idx, 'Processed_About_Website'] = extraction_result['Website'] != "None"
+
+                        first_idx = rows[0]
+                        first_name = df.at[first_idx, 'First Name'] if 'First Name' in df.columns else f"Row_{first_idx+1}"
+                        # Standardize company URL: remove trailing slashes, ensure it ends with /about.
+                        company_url_for_about = df.at[first_idx, linkedin_column].rstrip('/').replace('/about', '')
+                        company_url_for_about = f"{company_url_for_about}/about"
+                        logging.info(f"Processing company {companies_done + 1}/{len(companies)} ({len(rows)} rows): {company_url_for_about}")
+
+                        # Another job may have fetched this company since the plan was made.
+                        keys = company_keys[company_url]
+                        extraction_result = lookup_company_cache(company_cache, keys)
+                        if extraction_result is not None:
+                            cache_stats["cache_hits"] += len(rows)
+                            logging.info(f"Company cache hit for {company_url}")
                         else:
-                            logging.warning(f"Skipping invalid or missing LinkedIn company URL in row {idx + 1}: {company_url_original}")
-                            df.at[idx, 'Processed_About_Website'] = False # Mark as not processable if URL is bad.
-                        
-                        # Save progress to the output CSV file after processing each row.
-                        df.to_csv(output_csv, index=False)
-                        logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
-                        # Report progress for this row.
-                        write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id)
+                            # Call the core extraction function once for all rows of the company.
+                            reset_wait_timer()
+                            extraction_result, driver = extract_company_info(first_name, company_url_for_about, first_idx, driver)
+                            row_timing = read_wait_timer()
+                            for key, value in row_timing.items():
+                                wait_totals[key] += value
+                            logging.info(f"Company {company_url} timing: waited {row_timing['wait_seconds']}s, worked {row_timing['work_seconds']}s")
+                            cache_stats["companies_fetched"] += 1
+                            cache_stats["rows_shared"] += len(rows) - 1
+                            # Cache only real results; a page that failed to load should be fetched again next time.
+                            if extraction_result['Website'] != "None" or extraction_result['About_Text'] != "None":
+                                cached_value = {"Website": extraction_result['Website'], "About_Text": extraction_result['About_Text']}
+                                company_cache.set_many([(key, cached_value, "found") for key in keys])
+
+                        # Copy the company's result to all of its rows.
+                        apply_company_result(df, rows, extraction_result)
+                        rows_done += len(rows)
+                        companies_done += 1
+
+                        # Save progress to the output file after each company.
+                        save_stage_file(df, output_csv, window=window)
+                        logging.info(f"Saved progress for {len(rows)} rows of {company_url} to {output_csv}")
+                        write_progress(rows_done, total_rows_for_progress, job_id, step_id=step_id, current_company=companies_done, total_companies=len(companies))
 
                         time.sleep(random.uniform(1, 2)) # Small random delay between requests.
                 except Exception as e:
-                    logging.error(f"Error processing batch from index {batch_start_idx} to {batch_end_idx}: {e}", exc_info=True)
+                    logging.error(f"Error processing companies {batch_start + 1}-{batch_start + len(batch_companies)}: {e}", exc_info=True)
                 finally:
-                    # Ensure WebDriver for the batch is closed.
+                    # Return the batch's WebDriver to the pool (it is health-checked there).
                     if driver is not None:
-                        try:
-                            driver.quit()
-                            logging.info(f"WebDriver closed successfully for batch {batch_start_idx}-{batch_end_idx}.")
-                        except Exception as e:
-                            logging.error(f"Error closing WebDriver for batch {batch_start_idx}-{batch_end_idx}: {e}")
-                        # kill_chrome_processes() # Optional: ensure all related browser processes are terminated.
-                        time.sleep(2)  # Brief pause to ensure processes can terminate fully.
+                        driver_pool.release(driver)
+                        driver = None
+                        logging.info(f"WebDriver returned to the pool after companies {batch_start + 1}-{batch_start + len(batch_companies)}.")
                 
-                if stopped: # If stop signal was received during row processing, break from batch loop too.
+                if stopped: # If stop signal was received during company processing, break from batch loop too.
                     break
 
         finally: # This 'finally' is for the main try-catch block of the function.
@@ -335,13 +458,12 @@ def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_siz
             # The driver here would be the one from the last batch if not properly closed there.
             # However, current logic closes driver per batch. This might be redundant or a safeguard.
             if driver is not None: # Check if driver instance might still exist (e.g., if error before batch finally)
-                try:
-                    driver.quit()
-                    time.sleep(2)
-                    logging.info("WebDriver closed successfully in main finally block (safeguard).")
-                except Exception as e:
-                    logging.error(f"Error closing WebDriver in main finally block: {e}")
-                # kill_chrome_processes()
+                driver_pool.release(driver, discard=True)
+                logging.info("WebDriver discarded in main finally block (safeguard).")
+            record_job_metrics(step_id, job_id, **{key: round(value, 1) for key, value in wait_totals.items()})
+            # Every row that did not need its own page load: cache hits plus rows that shared a company's fetch.
+            record_job_metrics(step_id, job_id, page_loads_avoided=cache_stats["cache_hits"] + cache_stats["rows_shared"], **cache_stats)
+            logging.info(f"Company cache: {cache_stats['cache_hits']} row hits, {cache_stats['companies_fetched']} companies fetched for {cache_stats['companies_fetched'] + cache_stats['rows_shared']} rows.")
 
             # Report final progress status (completed or stopped).
             if not stopped:
@@ -358,7 +480,7 @@ def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_siz
                 final_row_for_progress = (total_rows_to_process_after_offset + offset) if final_status == "completed" else effective_processed_count
                 
                 logging.info(f"Final Status: {final_status}. Reporting progress for {final_row_for_progress}/{total_rows_to_process_after_offset + offset} effective rows.")
-                write_progress(final_row_for_progress, total_rows_to_process_after_offset + offset, job_id, step_id=step_id, stop_call=(final_status == "stopped"))
+                write_progress(final_row_for_progress, total_rows_to_process_after_offset + offset, job_id, step_id=step_id, stop_call=(final_status == "stopped"), current_company=companies_done, total_companies=len(companies))
 
         # Optionally delete rows where 'Website' is "None" after all processing is done (and not stopped early).
         if delete_no_website and not stopped:
@@ -367,11 +489,13 @@ def process_csv_and_extract_info(input_csv, output_csv, max_rows=2000, batch_siz
             deleted_rows_count = initial_row_count - len(df)
             if deleted_rows_count > 0:
                 logging.info(f"Deleted {deleted_rows_count} rows where Website was 'None'.")
-                df.to_csv(output_csv, index=False) # Save the filtered DataFrame.
+                save_stage_file(df, output_csv, window=window) # Save the filtered DataFrame.
                 logging.info(f"Saved final DataFrame after deleting rows to {output_csv}")
             else:
                 logging.info("No rows with Website 'None' found to delete, or `delete_no_website` was false.")
 
+        # Export the final state as CSV (the format shared between steps)
+        export_csv(df, output_csv, window=window)
         logging.info(f"Final row count in DataFrame after processing: {len(df)}")
         return df
 
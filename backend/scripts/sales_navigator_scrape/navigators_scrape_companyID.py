@@ -4,6 +4,7 @@ import pandas as pd
 from datetime import datetime
 import logging
 from backend.config import Config
+from backend.scripts.sales_navigator_scrape.normalize_leads import normalize_leads
 
 # Define the fields to extract
 fields = [
@@ -39,32 +40,6 @@ def extract_company_info(lead_text):
     logging.warning("No company info found in lead text")
     return "", "", ""
 
-def clean_summary(text):
-    """
-    Clean HTML tags and extra text from summary text.
-    
-    Args:
-        text (str): The raw summary text.
-        
-    Returns:
-        str: Cleaned summary text.
-    """
-    if not text:
-        logging.debug("No summary text provided")
-        return ""
-    # Extract text between <span style="display: inline;"> and </span> if present
-    span_match = re.search(r'<span style="display: inline;">(.*?)<\/span>', text, re.DOTALL)
-    if span_match:
-        text = span_match.group(1)
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Remove "…see more" or similar
-    text = re.sub(r'…see more', '', text, flags=re.IGNORECASE)
-    # Clean up extra whitespace
-    text = ' '.join(text.strip().split())
-    logging.debug(f"Cleaned summary: {text[:50]}...")  # Log first 50 chars
-    return text
-
 def parse_lead_block(lead_text):
     """
     Parse a single lead block and extract relevant fields.
@@ -80,15 +55,9 @@ def parse_lead_block(lead_text):
     # Extract Full Name
     name_match = re.search(r'<span data-anonymize="person-name">([^<]+)</span>', lead_text)
     if name_match:
+        # First Name / Last Name are split for all leads at once in normalize_leads
         lead_data["Full Name"] = name_match.group(1).strip()
         lead_data["Name"] = lead_data["Full Name"]
-        # Split Full Name into First Name and Last Name
-        name_parts = lead_data["Full Name"].split()
-        if len(name_parts) >= 2:
-            lead_data["First Name"] = name_parts[0]
-            lead_data["Last Name"] = " ".join(name_parts[1:])
-        elif len(name_parts) == 1:
-            lead_data["First Name"] = name_parts[0]
         logging.info(f"Processing lead: {lead_data['Full Name'] or 'Unknown'}")
     
     # Extract Connection Degree
@@ -142,10 +111,10 @@ def parse_lead_block(lead_text):
         lead_data["Duration In Company"] = company_duration_match.group(1).strip()
         logging.debug(f"Duration In Company: {lead_data['Duration In Company']}")
     
-    # Extract Summary
+    # Extract Summary (raw HTML; cleaned for all leads at once in normalize_leads)
     summary_match = re.search(r'About:\s*([\s\S]+?)(?=\n\s*\n|\Z)', lead_text)
     if summary_match:
-        lead_data["Summary"] = clean_summary(summary_match.group(1).strip())
+        lead_data["Summary"] = summary_match.group(1).strip()
     
     # Extract Industry
     industry_match = re.search(r'(Hospitality|Hotels and Motels|Travel Arrangements)', lead_text)
@@ -210,6 +179,9 @@ def parse_sales_navigator(input_file, output_file, output_path=Config.DATA_CSV_P
     logging.info(f"Converting {len(leads)} leads to DataFrame")
     new_df = pd.DataFrame(leads, columns=fields)
 
+    # Split names, clean summaries and canonicalize company URLs column-wise
+    new_df = normalize_leads(new_df, filters=["split_name", "clean_summary", "canonical_url"])
+
     # Construct full output path
     full_output_path = os.path.join(output_path, output_file)
     logging.info(f"Output path: {full_output_path}")
@@ -0,0 +1,193 @@
+"""
+Vectorized normalization stage for lead DataFrames.
+
+Every operation in this module works on whole pandas columns at once (``.str`` accessors
+and regex replacements) instead of looping over rows in Python. The stage is used in two places:
+- Right after `parse_sales_navigator` builds its DataFrame, to split names and clean summaries.
+- As Step 2 (`remove_empty_company_rows`), where each operation is a configurable filter.
+
+Each filter takes a DataFrame and returns a (possibly smaller) DataFrame. Filters are looked up
+by name in `NORMALIZATION_FILTERS`, so callers can pick which ones run and in which order.
+"""
+import logging
+import re
+import pandas as pd
+
+# Matches any LinkedIn company URL and captures the company slug or numeric ID.
+# e.g. "http://linkedin.com/company/acme-inc/about/?trk=x" -> "acme-inc"
+COMPANY_URL_PATTERN = r'^(?:https?://)?(?:[\w-]+\.)?linkedin\.com/company/([^/?#\s]+)'
+COMPANY_URL_MATCH_PATTERN = r'(?:https?://)?(?:[\w-]+\.)?linkedin\.com/company/[^/?#\s]+'
+CANONICAL_COMPANY_URL_PREFIX = "https://www.linkedin.com/company/"
+
+# Summary cleanup patterns: the inline span's text, without HTML tags and the '…see more' suffix
+SUMMARY_SPAN_PATTERN = r'<span style="display: inline;">(.*?)</span>'
+HTML_TAG_PATTERN = r'<[^>]+>'
+SEE_MORE_PATTERN = r'…see more'
+
+
+def strip_company_columns(df):
+    """
+    Strips whitespace from 'Company Id' and 'Company Url' and drops rows where either is empty
+    or invalid. A valid Company Id is numeric and a valid Company Url points to a LinkedIn company page.
+
+    Parameters:
+        df (pd.DataFrame): Lead data with 'Company Id' and 'Company Url' columns.
+
+    Returns:
+        pd.DataFrame: Filtered DataFrame with stripped company columns.
+    """
+    company_id = df['Company Id'].astype(str).str.strip()
+    company_url = df['Company Url'].astype(str).str.strip()
+    valid = company_id.str.fullmatch(r'\d+') & company_url.str.match(COMPANY_URL_MATCH_PATTERN, flags=re.IGNORECASE)
+
+    df = df.assign(**{'Company Id': company_id, 'Company Url': company_url})
+    filtered_df = df[valid]
+    logging.info(f"strip_company_columns: kept {len(filtered_df)}/{len(df)} rows with valid Company Id and Company Url")
+    return filtered_df
+
+
+def split_full_name(df):
+    """
+    Splits 'Full Name' into 'First Name' (first word) and 'Last Name' (remaining words).
+    Rows with a single word only get a First Name. 'Name' mirrors 'Full Name'.
+
+    Parameters:
+        df (pd.DataFrame): Lead data with a 'Full Name' column.
+
+    Returns:
+        pd.DataFrame: DataFrame with updated name columns.
+    """
+    full_name = df['Full Name'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
+    name_parts = full_name.str.partition(' ')
+    return df.assign(**{
+        'Full Name': full_name,
+        'Name': full_name,
+        'First Name': name_parts[0],
+        'Last Name': name_parts[2],
+    })
+
+
+def clean_summary_column(df):
+    """
+    Cleans HTML tags, the '…see more' suffix and extra whitespace from the 'Summary' column.
+    When the summary is wrapped in a <span style="display: inline;"> only its content is kept.
+
+    Parameters:
+        df (pd.DataFrame): Lead data with a 'Summary' column.
+
+    Returns:
+        pd.DataFrame: DataFrame with a cleaned 'Summary' column.
+    """
+    summary = df['Summary'].astype(str)
+    span_text = summary.str.extract(SUMMARY_SPAN_PATTERN, flags=re.DOTALL, expand=False)
+    summary = span_text.fillna(summary)
+    summary = (
+        summary.str.replace(HTML_TAG_PATTERN, '', regex=True)
+        .str.replace(SEE_MORE_PATTERN, '', regex=True, flags=re.IGNORECASE)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+    )
+    return df.assign(Summary=summary)
+
+
+def canonicalize_company_urls(df, columns=('Company Url', 'Regular Company Url')):
+    """
+    Rewrites LinkedIn company URLs to the canonical form 'https://www.linkedin.com/company/<slug>'.
+    Drops scheme/host variations, query strings, fragments, trailing slashes and '/about'.
+    Values that are not LinkedIn company URLs are left unchanged (only stripped).
+
+    Parameters:
+        df (pd.DataFrame): Lead data.
+        columns (tuple): Column names to canonicalize. Missing columns are skipped.
+
+    Returns:
+        pd.DataFrame: DataFrame with canonical company URLs.
+    """
+    updates = {}
+    for column in columns:
+        if column not in df.columns:
+            continue
+        urls = df[column].astype(str).str.strip()
+        slug = urls.str.extract(COMPANY_URL_PATTERN, flags=re.IGNORECASE, expand=False)
+        updates[column] = (CANONICAL_COMPANY_URL_PREFIX + slug.str.lower()).fillna(urls)
+    return df.assign(**updates) if updates else df
+
+
+def canonical_company_url(url):
+    """
+    Canonicalizes a single LinkedIn company URL (see `canonicalize_company_urls`).
+
+    Parameters:
+        url (str): Company URL.
+
+    Returns:
+        str: Canonical URL, or the stripped input if it is not a LinkedIn company URL.
+    """
+    url = str(url or "").strip()
+    match = re.match(COMPANY_URL_PATTERN, url, flags=re.IGNORECASE)
+    return f"{CANONICAL_COMPANY_URL_PREFIX}{match.group(1).lower()}" if match else url
+
+
+# Registry of available filters, in their default order.
+NORMALIZATION_FILTERS = {
+    "strip_company": strip_company_columns,
+    "split_name": split_full_name,
+    "clean_summary": clean_summary_column,
+    "canonical_url": canonicalize_company_urls,
+}
+
+# Columns each filter needs; a filter is skipped if its columns are missing.
+FILTER_REQUIRED_COLUMNS = {
+    "strip_company": ['Company Id', 'Company Url'],
+    "split_name": ['Full Name'],
+    "clean_summary": ['Summary'],
+    "canonical_url": [],
+}
+
+DEFAULT_FILTERS = list(NORMALIZATION_FILTERS)
+
+
+def normalize_leads(df, filters=None):
+    """
+    Runs the selected normalization filters over a lead DataFrame, in order.
+
+    Parameters:
+        df (pd.DataFrame): Lead data.
+        filters (list, optional): Names of filters from `NORMALIZATION_FILTERS` to apply.
+                                  Defaults to all filters.
+
+    Returns:
+        pd.DataFrame: The normalized DataFrame with a fresh 0..n-1 index.
+
+    Raises:
+        ValueError: If an unknown filter name is given.
+    """
+    filters = DEFAULT_FILTERS if filters is None else filters
+    unknown = [name for name in filters if name not in NORMALIZATION_FILTERS]
+    if unknown:
+        raise ValueError(f"Unknown normalization filter(s): {', '.join(unknown)}. Available: {', '.join(NORMALIZATION_FILTERS)}")
+
+    for name in filters:
+        missing = [col for col in FILTER_REQUIRED_COLUMNS[name] if col not in df.columns]
+        if missing:
+            logging.warning(f"Skipping normalization filter '{name}': missing column(s) {missing}")
+            continue
+        df = NORMALIZATION_FILTERS[name](df)
+    return df.reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    # Quick timing check on synthetic data
+    rows = 100_000
+    sample = pd.DataFrame({
+        "Full Name": ["  Jane   Doe Smith "] * rows,
+        "Summary": ['<span style="display: inline;">Hello <b>world</b> …see more</span>'] * rows,
+        "Company Id": ["12345", " ", "678"] * (rows // 3) + ["1"] * (rows % 3),
+        "Company Url": ["https://linkedin.com/company/12345/about/"] * rows,
+        "Regular Company Url": ["http://www.linkedin.com/company/Acme-Inc/?trk=x"] * rows,
+    })
+    start = time.perf_counter()
+    result = normalize_leads(sample)
+    print(f"Normalized {rows} rows -> {len(result)} rows in {time.perf_counter() - start:.3f}s")
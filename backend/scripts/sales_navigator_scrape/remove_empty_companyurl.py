@@ -2,17 +2,24 @@ import logging
 import os
 from backend.config import Config
 from config.utils import load_csv
+from backend.scripts.sales_navigator_scrape.normalize_leads import normalize_leads
 
+# Filters Step 2 runs by default. Names and summaries were already split and cleaned when
+# parse_sales_navigator wrote the Step 1 output, so only the company columns are normalized again.
+STEP2_DEFAULT_FILTERS = ["strip_company", "canonical_url"]
 
-def remove_empty_company_rows(input_csv, output_csv=None, input_path=Config.DATA_CSV_PATH, output_path=os.path.join(Config.DATA_CSV_PATH, "filtered_url")):
+def remove_empty_company_rows(input_csv, output_csv=None, input_path=Config.DATA_CSV_PATH, output_path=os.path.join(Config.DATA_CSV_PATH, "filtered_url"), filters=None):
     """
-    Removes rows from a CSV file where Company Id or Company Url is empty.
+    Removes rows from a CSV file where Company Id or Company Url is empty or invalid.
+    Runs the vectorized normalization stage, which also canonicalizes the company URLs.
     
     Parameters:
         input_csv (str): Path to the input CSV file.
         output_csv (str): Path to save the filtered CSV file (default: 'Filtered_' + input_csv).
         input_path (str): Directory of the input CSV.
         output_path (str): Directory to save the filtered CSV.
+        filters (list, optional): Names of normalization filters to run (see normalize_leads.NORMALIZATION_FILTERS).
+                                  Defaults to STEP2_DEFAULT_FILTERS.
     
     Returns:
         pd.DataFrame or None: The filtered DataFrame, or None if an error occurs.
@@ -39,9 +46,8 @@ def remove_empty_company_rows(input_csv, output_csv=None, input_path=Config.DATA
         initial_rows = len(df)
         logging.info(f"Initial row count: {initial_rows}")
 
-        # Filter rows where both Company Id and Company Url are non-empty
-        filtered_df = df[df['Company Id'].str.strip() != '']
-        filtered_df = filtered_df[filtered_df['Company Url'].str.strip() != '']
+        # Strip/validate the company columns and canonicalize the company URLs, column-wise
+        filtered_df = normalize_leads(df, filters=filters or STEP2_DEFAULT_FILTERS)
         
         # Log filtered row count
         filtered_rows = len(filtered_df)
@@ -12,6 +12,8 @@ from datetime import datetime
 # Add the html_extractor directory to the system path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'html_extractor')))
 from backend.scripts.selenium.driver_setup_for_scrape import setup_driver_linkedin_singin
+from backend.scripts.sales_navigator_scrape.company_url_resolver import resolve_redirect, is_company_id_url, session_from_driver
+from backend.config import Config
 
 # Set up logging
 logging.basicConfig(
@@ -30,13 +32,15 @@ sheet_id = "1biy0oveY9nHwfruIdy5MC7FLobgfJZ1_OcHlOC6Ijhw"  # Replace with your G
 worksheet_name = "Sheet7"  # Replace with your worksheet name
 
 # Function to get the redirected company URL
-def get_company_url(company_id_url, driver):
+def get_company_url(company_id_url, driver, session=None):
     """
     Fetches the redirected LinkedIn company URL (name-based) from an ID-based URL.
+    With a session the redirect is followed over HTTP, and the browser is only used when that fails.
     
     Parameters:
         company_id_url (str): The company URL to process (e.g., https://www.linkedin.com/company/12345).
         driver: Selenium WebDriver instance.
+        session (requests.Session, optional): HTTP session with the LinkedIn cookies (see `session_from_driver`).
     
     Returns:
         str: The redirected URL or original URL if an error occurs.
@@ -45,11 +49,19 @@ def get_company_url(company_id_url, driver):
         if not company_id_url.startswith("https://www.linkedin.com"):
             company_id_url = "https://www.linkedin.com" + company_id_url
         
-        driver.get(company_id_url)
-        driver.add_human_behavior()
-        time.sleep(random.uniform(1, 3))
-        
-        final_url = driver.current_url
+        final_url = None
+        if session is not None:
+            resolved_url, needs_browser = resolve_redirect(company_id_url, session)
+            if not needs_browser and not is_company_id_url(resolved_url):
+                final_url = resolved_url
+            else:
+                logging.info(f"HTTP redirect for {company_id_url} could not be resolved ({resolved_url}). Falling back to the browser.")
+
+        if final_url is None:
+            driver.get(company_id_url)
+            driver.add_human_behavior()
+            time.sleep(random.uniform(1, 3))
+            final_url = driver.current_url
         if "/company/" in final_url:
             logging.info(f"Successfully fetched URL: {company_id_url} -> {final_url}")
             return final_url
@@ -104,6 +116,8 @@ def process_csv_and_update_urls(input_csv, output_csv, max_rows=1000, batch_size
         # Initialize the WebDriver
         chromedriver_path = None  # Set to your chromedriver path if needed
         driver = setup_driver_linkedin_singin(chromedriver_path=chromedriver_path, browser="chrome", headless=False)
+        # Resolve redirects over HTTP with the browser's cookies unless the HTTP resolver is switched off
+        session = session_from_driver(driver) if Config.COMPANY_URL_HTTP_RESOLVER else None
 
         try:
             # Process rows in batches
@@ -126,7 +140,7 @@ def process_csv_and_update_urls(input_csv, output_csv, max_rows=1000, batch_size
                     company_id_url = df.at[idx, linkedin_column]
                     if pd.notna(company_id_url) and "/company/" in company_id_url:
                         logging.info(f"Processing row {idx + 1}/{total_rows}: {company_id_url}")
-                        updated_url = get_company_url(company_id_url, driver)
+                        updated_url = get_company_url(company_id_url, driver, session=session)
                         df.at[idx, linkedin_column] = updated_url
                         df.at[idx, 'Processed_URL'] = True
                     else:
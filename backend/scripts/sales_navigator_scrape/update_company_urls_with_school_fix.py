@@ -7,7 +7,8 @@ import os
 import logging
 import json
 from backend.config import Config
-from backend.scripts.selenium.driver_setup_for_scrape import setup_driver_linkedin_singin
+from backend.scripts.selenium.driver_pool import get_driver_pool
+from backend.scripts.sales_navigator_scrape.company_url_resolver import resolve_redirect, is_company_id_url, session_from_driver
 from config.utils import load_csv
 
 # Function to check for stop signal
@@ -39,14 +40,16 @@ def write_progress(current_row, total_rows):
         logging.error(f"Failed to write progress: {e}")
 
 # Function to get the redirected company URL
-def get_company_url(company_id_url, driver):
+def get_company_url(company_id_url, driver, session=None):
     """
     Fetches the redirected LinkedIn company URL (name-based) from an ID-based URL.
     Flags rows for deletion if the redirected URL contains '/school/'.
+    With a session the redirect is followed over HTTP, and the browser is only used when that fails.
     
     Parameters:
         company_id_url (str): The company URL to process.
         driver: Selenium WebDriver instance.
+        session (requests.Session, optional): HTTP session with the LinkedIn cookies (see `session_from_driver`).
     
     Returns:
         tuple: (updated_url, delete_flag)
@@ -55,11 +58,19 @@ def get_company_url(company_id_url, driver):
         if not company_id_url.startswith("https://www.linkedin.com"):
             company_id_url = "https://www.linkedin.com" + company_id_url
         
-        driver.get(company_id_url)
-        driver.add_human_behavior()
-        time.sleep(random.uniform(1, 3))
-        
-        final_url = driver.current_url
+        final_url = None
+        if session is not None:
+            resolved_url, needs_browser = resolve_redirect(company_id_url, session)
+            if not needs_browser and not is_company_id_url(resolved_url):
+                final_url = resolved_url
+            else:
+                logging.info(f"HTTP redirect for {company_id_url} could not be resolved ({resolved_url}). Falling back to the browser.")
+
+        if final_url is None:
+            driver.get(company_id_url)
+            driver.add_human_behavior()
+            time.sleep(random.uniform(1, 3))
+            final_url = driver.current_url
         if "/school/" in final_url:
             logging.info(f"School URL detected: {company_id_url} -> {final_url}. Marking for deletion.")
             return final_url, True
@@ -79,13 +90,15 @@ def get_company_url(company_id_url, driver):
 def process_csv_and_update_urls(input_csv, output_csv, max_rows=2000, batch_size=10):
     """
     Processes a CSV file, updates 'Regular Company Url' with name-based URLs, deletes school-related rows,
-    and saves progress in real-time. Reinitializes WebDriver for each batch. Checks for stop signal after each row.
+    and saves progress in real-time. Leases the LinkedIn WebDriver from the shared pool for each batch.
+    Redirects are resolved over HTTP with the browser's cookies when Config.COMPANY_URL_HTTP_RESOLVER is set.
+    Checks for stop signal after each row.
     
     Parameters:
         input_csv (str): Path to the input CSV file.
         output_csv (str): Path to save the updated CSV file.
         max_rows (int): Maximum number of rows to process.
-        batch_size (int): Number of rows to process before saving and restarting WebDriver.
+        batch_size (int): Number of rows to process before saving and returning the WebDriver to the pool.
     
     Returns:
         pd.DataFrame: The updated DataFrame or None if an error occurs.
@@ -112,12 +125,17 @@ def process_csv_and_update_urls(input_csv, output_csv, max_rows=2000, batch_size
         # Initialize progress file
         write_progress(0, min(len(df), max_rows))
 
+        driver_pool = get_driver_pool("linkedin") # Shared pool of warm LinkedIn browsers.
+        session = None # HTTP session with the LinkedIn cookies, created from the first leased browser.
+
         # Process rows in batches
         total_rows = min(len(df), max_rows)
         logging.info(f"Total rows to process: {total_rows}")
         for start_idx in range(0, total_rows, batch_size):
-            # Initialize WebDriver for the batch
-            driver = setup_driver_linkedin_singin(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", headless=False)
+            # Lease the WebDriver for the batch
+            driver = driver_pool.lease()
+            if Config.COMPANY_URL_HTTP_RESOLVER and session is None:
+                session = session_from_driver(driver)
             
             try:
                 end_idx = min(start_idx + batch_size, total_rows)
@@ -147,7 +165,7 @@ def process_csv_and_update_urls(input_csv, output_csv, max_rows=2000, batch_size
                             logging.info(f"Stripped 'about/' from URL for row {idx + 1}: {company_id_url}")
 
                         logging.info(f"Processing row {idx + 1}/{total_rows}: {company_id_url}")
-                        updated_url, delete_row = get_company_url(company_id_url, driver)
+                        updated_url, delete_row = get_company_url(company_id_url, driver, session=session)
                         # Strip 'about/' from the end of the URL if present
                         if company_id_url.endswith("about/"):
                                 company_id_url = company_id_url[:-6]  # Remove 'about/'
@@ -174,12 +192,9 @@ def process_csv_and_update_urls(input_csv, output_csv, max_rows=2000, batch_size
                 write_progress(end_idx, total_rows)
             
             finally:
-                # Clean up WebDriver after each batch
-                try:
-                    driver.quit()
-                    logging.info(f"WebDriver closed for batch {start_idx}-{end_idx}")
-                except Exception as e:
-                    logging.error(f"Error closing WebDriver for batch {start_idx}-{end_idx}: {e}")
+                # Return the WebDriver to the pool after each batch (it is health-checked there)
+                driver_pool.release(driver)
+                logging.info(f"WebDriver returned to the pool for batch {start_idx}-{end_idx}")
                 # Clean up Tor (optional, uncomment if needed)
                 # stop_tor(tor_process)
 
@@ -10,12 +10,16 @@ Key functionalities include:
 - Integration with Tor for IP address rotation to mitigate rate limiting or IP blocks
   by Skrapp.io. The script can start, stop, and restart Tor processes.
 - Batch processing of emails to manage resources and save progress incrementally.
+- Pluggable verifier backends (`VERIFIER_BACKENDS`): the Skrapp.io browser check, a NeverBounce-style
+  HTTP API and a direct MX lookup + SMTP RCPT probe, selectable per job.
 - Handling various verification outcomes from Skrapp.io, such as "Valid", "Invalid",
   "Catch-All", as well as statuses indicating operational issues like rate limits ("search_limit"),
   timeouts, or connection errors.
 - Updating the input CSV file with new columns for "Email Status" and a flag "Email_Processed"
   to track verification status and progress.
 - Skipping rows that have already been processed in previous runs.
+- An offline pre-check (`email_precheck`) that skips malformed, role, disposable and duplicate
+  addresses before any browser work and records the outcome in a "PreCheck" column.
 - Optional deletion of rows where the email status is determined to be "Invalid".
 - Progress tracking and graceful shutdown capabilities via an external stop signal,
   coordinated through `job_functions`.
@@ -27,20 +31,25 @@ Python libraries for logging, OS interaction, and process management. It is inte
 run as part of a larger data processing pipeline, identified by `job_id` and `step_id`.
 """
 
+import asyncio
 import time
 import random
 import logging
 import os
 import uuid
+import httpx
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from urllib3.exceptions import NewConnectionError as Urllib3NewConnectionError
-from backend.scripts.selenium.driver_setup_for_scrape import restart_driver_and_tor, start_tor, stop_tor, setup_chrome_with_tor
+from backend.scripts.selenium.driver_setup_for_scrape import start_tor, stop_tor
+from backend.scripts.selenium.driver_pool import get_driver_pool, restart_pooled_driver_and_tor
+from backend.scripts.selenium.wait_helpers import wait_for_document_ready, wait_for_element, wait_for_any, wait_for_network_idle, human_pause, reset_wait_timer, read_wait_timer
 from backend.config import Config
 from config.logging import setup_logging
-from config.job_functions import write_progress, check_stop_signal
-from config.utils import load_csv
+from config.job_functions import write_progress, check_stop_signal, record_job_metrics
+from config.utils import load_csv, save_stage_file, export_csv, dataframe_memory_mb
+from backend.scripts.sales_navigator_scrape.email_verification_cache import lookup_verification, record_verification
+from backend.scripts.sales_navigator_scrape.email_precheck import apply_precheck, resolve_duplicates, PRECHECK_DUPLICATE
 from selenium.common.exceptions import WebDriverException, TimeoutException
 
 # --- Constants ---
@@ -59,6 +68,9 @@ STATUS_TIMEOUT = "timeout"
 STATUS_CONNECTION_ERROR = "connection_error"
 STATUS_NO_RESULT = "no_result"
 
+# Columns loaded when the step runs in windowed mode
+WINDOW_COLUMNS = ['Email', 'Email Status', 'Email_Processed', 'PreCheck']
+
 # XPaths for specific Skrapp.io verification messages
 # These are kept specific as the page structure dictates them.
 VERIFICATION_MESSAGE_XPATHS = [
@@ -67,15 +79,30 @@ VERIFICATION_MESSAGE_XPATHS = [
     (STATUS_CATCH_ALL,   "//div[contains(@class, 'MuiBox-root css-1pmn8ky')]//p[contains(text(), 'Email is reachable, but it')]"),
     (STATUS_CATCH_ALL,   "//div[contains(@class, 'MuiBox-root css-1b3tdk3')]//p[contains(text(), 'Email is reachable, but it')]") # Another variant for Catch-All
 ]
+
+# Results of NeverBounce-style verification APIs mapped to the statuses of this script
+API_RESULT_STATUSES = {
+    "valid": STATUS_VALID,
+    "invalid": STATUS_INVALID,
+    "disposable": STATUS_INVALID,
+    "catchall": STATUS_CATCH_ALL,
+    "accept_all": STATUS_CATCH_ALL,
+    "unknown": STATUS_NO_RESULT,
+}
 # --- End Constants ---
 
-# Placeholder for a potential alternative email verification function
-def verify_email_neverbounce():
+def verify_email_neverbounce(email, api_key=None):
     """
-    Placeholder function for verifying an email using NeverBounce.
-    Currently not implemented.
+    Verifies an email with the NeverBounce single-check API (see `ApiVerifier`).
+
+    Parameters:
+        email (str): Email address to verify.
+        api_key (str, optional): NeverBounce API key. Defaults to Config.VERIFIER_API_KEY.
+
+    Returns:
+        str: One of the STATUS_* constants.
     """
-    pass
+    return ApiVerifier(api_key=api_key).verify(email)
 
 def verify_email_scrapp(email, driver, tor_process=None, max_retries=2, retry_delay=2):
     """
@@ -103,7 +130,7 @@ def verify_email_scrapp(email, driver, tor_process=None, max_retries=2, retry_de
             # Navigate to Skrapp.io email verifier page
             logging.info(f"Attempt {attempt}/{max_retries} to verify email: {email} using Skrapp.io")
             driver.get(SKRAPP_VERIFIER_URL)
-            time.sleep(random.uniform(3, 5)) # Random delay to mimic human behavior
+            wait_for_document_ready(driver)
 
             # Check for access denied (HTTP 403) or request blocked, potentially indicating IP block
             page_source_lower = driver.page_source.lower()
@@ -114,20 +141,15 @@ def verify_email_scrapp(email, driver, tor_process=None, max_retries=2, retry_de
                 return STATUS_SEARCH_LIMIT, tor_process
 
             # Wait for the email input field to be present on the page
-            email_field = WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.NAME, SKRAPP_EMAIL_INPUT_NAME))
-            )
+            email_field = wait_for_element(driver, (By.NAME, SKRAPP_EMAIL_INPUT_NAME), timeout=15)
 
-            time.sleep(random.uniform(0.5, 1))
+            human_pause()
             email_field.clear()
-            time.sleep(random.uniform(0.2, 0.8))
             email_field.send_keys(email)
-            time.sleep(random.uniform(0.5, 1))
+            human_pause()
             
             # Locate and click the "Verify Email" button
-            verify_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, SKRAPP_VERIFY_BUTTON_CSS))
-            )
+            verify_button = wait_for_element(driver, (By.CSS_SELECTOR, SKRAPP_VERIFY_BUTTON_CSS), condition=EC.element_to_be_clickable)
             try:
                 verify_button.click()
             except Exception as click_exc: # Fallback to JavaScript click
@@ -137,10 +159,11 @@ def verify_email_scrapp(email, driver, tor_process=None, max_retries=2, retry_de
             # Wait for verification result area to appear or a rate limit message
             logging.debug(f"Waiting for verification result for {email} (Attempt {attempt})...")
             try:
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.XPATH, SKRAPP_RESULT_OR_LIMIT_XPATH))
-                )
-                logging.debug(f"Result area or limit message located for {email}.")                
+                wait_for_element(driver, (By.XPATH, SKRAPP_RESULT_OR_LIMIT_XPATH), timeout=30)
+                logging.debug(f"Result area or limit message located for {email}.")
+                # The result panel is filled in by the verifier's API response. Let it arrive; the status
+                # message itself is still waited for below, as idle is only a hint.
+                wait_for_network_idle(driver, timeout=10)
             except TimeoutException:
                 # Handle timeout if no result or error message appears within the timeframe
                 logging.warning(f"Timeout (25s) waiting for verification result area for {email} (Attempt {attempt}).")
@@ -150,37 +173,24 @@ def verify_email_scrapp(email, driver, tor_process=None, max_retries=2, retry_de
                     continue
                 return STATUS_TIMEOUT, tor_process # Max retries for this specific timeout
             
-            # Check specifically for "Too many requests sent" message (rate limiting)
+            # Wait once for the rate limit message or any of the verification statuses (Valid, Invalid, Catch-All),
+            # then read which one is on the page.
+            status_locators = [(By.XPATH, SKRAPP_RATE_LIMIT_TEXT_XPATH)] + [(By.XPATH, xpath_pattern) for _, xpath_pattern in VERIFICATION_MESSAGE_XPATHS]
             try:
-                # Short wait for this specific message, as it might appear quickly.
-                limit_element = WebDriverWait(driver, 7).until(
-                    EC.presence_of_element_located((By.XPATH, SKRAPP_RATE_LIMIT_TEXT_XPATH))
-                )
-                if limit_element: # Element found
-                    logging.warning(f"'Too many requests sent' detected for {email} (Attempt {attempt}). Returning STATUS_SEARCH_LIMIT to trigger Tor restart.")
-                    return STATUS_SEARCH_LIMIT, tor_process
+                wait_for_any(driver, [EC.presence_of_element_located(locator) for locator in status_locators], timeout=13)
             except TimeoutException:
-                logging.debug(f"Message not found, proceed to check for other statuses.")# Message not found, proceed to check for other statuses.
-            except Exception as e_limit_check: 
-                logging.debug(f"Non-critical error checking for rate limit message for {email}: {e_limit_check}")
+                logging.debug(f"No rate limit or status message appeared for {email} (Attempt {attempt}).")
+
+            if driver.find_elements(By.XPATH, SKRAPP_RATE_LIMIT_TEXT_XPATH):
+                logging.warning(f"'Too many requests sent' detected for {email} (Attempt {attempt}). Returning STATUS_SEARCH_LIMIT to trigger Tor restart.")
+                return STATUS_SEARCH_LIMIT, tor_process
 
-            # Check for different verification statuses (Valid, Invalid, Catch-All)
             email_status_found = None
             for status_constant, xpath_pattern in VERIFICATION_MESSAGE_XPATHS:
-                try:
-                    # Short timeout for finding status messages, page should be loaded.
-                    WebDriverWait(driver, 13).until(
-                        EC.presence_of_element_located((By.XPATH, xpath_pattern))
-                    )                    
+                if driver.find_elements(By.XPATH, xpath_pattern):
                     email_status_found = status_constant # Use the constant from the tuple
                     logging.info(f"'{email_status_found}' email status confirmed for {email} (Attempt {attempt}).")
                     break # Exit loop once a status is found
-                except TimeoutException:
-                    logging.debug(f"Status message for '{status_constant}' not found for {email} using XPath: {xpath_pattern}")
-                    continue 
-                except Exception as e_status_check: 
-                    logging.warning(f"Error checking for '{status_constant}' status for {email}: {e_status_check}")
-                    continue
 
             if not email_status_found:
                 # If no specific status message is found after checking all possibilities
@@ -214,18 +224,557 @@ def verify_email_scrapp(email, driver, tor_process=None, max_retries=2, retry_de
     logging.error(f"Failed to verify email {email} after {max_retries} attempts (exhausted loop). Defaulting to STATUS_CONNECTION_ERROR.")
     return STATUS_CONNECTION_ERROR, tor_process # Default to connection error if loop completes without success
 
-def process_csv_and_verify_emails(input_csv, output_csv, max_rows=2000, batch_size=50, tor_restart_interval=30, offset=0, delete_invalid=True, job_id=None, step_id='step7'):
+# --- Verifier backends ---
+
+class AsyncRateLimiter:
+    """
+    Spaces out calls on an event loop so that at most `rate` calls per second start.
+
+    Parameters:
+        rate (float): Calls per second.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until the next call may start."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class VerifierBackend:
+    """
+    Interface of an email verifier backend used by Step 7. A backend turns an address into one
+    of the STATUS_* constants.
+
+    Subclasses implement `verify` (blocking) and may override `averify` (asyncio). The default
+    `averify` runs `verify` in a worker thread, so every backend can be used with `averify_each`.
+    `max_concurrency` caps how many addresses a backend checks at the same time and `rate_limit`
+    how many checks start per second (the provider's quota).
+    """
+
+    name = None
+    max_concurrency = None # None means no backend-specific limit
+    rate_limit = None # Checks per second; None or 0 means unlimited
+
+    @property
+    def concurrent(self):
+        """True if the backend can check several addresses at once."""
+        return self.max_concurrency != 1
+
+    def open(self):
+        """Acquires the resources the backend needs (browser, Tor, HTTP client)."""
+
+    def close(self):
+        """Releases the resources acquired by `open`."""
+
+    def verify(self, email):
+        """
+        Verifies one address.
+
+        Parameters:
+            email (str): Email address to verify.
+
+        Returns:
+            str: One of the STATUS_* constants.
+        """
+        raise NotImplementedError
+
+    async def averify(self, email):
+        """Asyncio version of `verify`."""
+        return await asyncio.to_thread(self.verify, email)
+
+    async def aopen(self):
+        """Acquires resources for `averify` on the running event loop."""
+
+    async def aclose(self):
+        """Releases the resources acquired by `aopen`."""
+
+    async def averify_each(self, emails, on_result=None, concurrency=None):
+        """
+        Verifies several addresses concurrently on the running event loop, at most `concurrency`
+        at a time and no faster than `rate_limit`. Results are reported in completion order.
+
+        Parameters:
+            emails (iterable): Email addresses. Duplicates are checked once.
+            on_result (callable, optional): Called with (email, status) as each check finishes.
+                If it returns False, the remaining checks are cancelled.
+            concurrency (int, optional): Maximum checks in flight. Defaults to Config.VERIFIER_CONCURRENCY.
+
+        Returns:
+            dict: {email: status} for the finished checks.
+        """
+        concurrency = concurrency or Config.VERIFIER_CONCURRENCY
+        if self.max_concurrency:
+            concurrency = min(concurrency, self.max_concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = AsyncRateLimiter(self.rate_limit) if self.rate_limit else None
+
+        async def check(email):
+            async with semaphore:
+                if rate_limiter:
+                    await rate_limiter.acquire()
+                try:
+                    return email, await self.averify(email)
+                except Exception as e:
+                    logging.error(f"Verifier '{self.name}' failed for {email}: {e}", exc_info=True)
+                    return email, STATUS_CONNECTION_ERROR
+
+        results = {}
+        await self.aopen()
+        tasks = [asyncio.ensure_future(check(email)) for email in dict.fromkeys(emails)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                email, status = await next_result
+                results[email] = status
+                if on_result is not None and on_result(email, status) is False:
+                    logging.info(f"Cancelling {len(tasks) - len(results)} pending verifications")
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.aclose()
+        return results
+
+    async def averify_many(self, emails, concurrency=None):
+        """
+        Verifies several addresses concurrently on the running event loop (see `averify_each`).
+
+        Parameters:
+            emails (iterable): Email addresses. Duplicates are checked once.
+            concurrency (int, optional): Maximum checks in flight. Defaults to Config.VERIFIER_CONCURRENCY.
+
+        Returns:
+            dict: {email: status}.
+        """
+        return await self.averify_each(emails, concurrency=concurrency)
+
+    def verify_many(self, emails, concurrency=None):
+        """
+        Blocking wrapper around `averify_many` for callers without an event loop.
+
+        Parameters:
+            emails (iterable): Email addresses.
+            concurrency (int, optional): Maximum checks in flight.
+
+        Returns:
+            dict: {email: status}.
+        """
+        return asyncio.run(self.averify_many(emails, concurrency))
+
+
+class BrowserVerifier(VerifierBackend):
+    """
+    Skrapp.io verifier driven through a pooled Tor browser (`verify_email_scrapp`).
+    Tor is restarted every `tor_restart_interval` completed checks and when the site rate-limits.
+
+    Parameters:
+        tor_restart_interval (int): Completed checks between Tor restarts.
+    """
+
+    name = "browser"
+    max_concurrency = 1 # One browser session
+
+    def __init__(self, tor_restart_interval=30):
+        self.tor_restart_interval = tor_restart_interval
+        self.driver_pool = None
+        self.driver = None
+        self.tor_process = None
+        self.checks_since_restart = 0
+
+    def open(self):
+        self.tor_process = start_tor()
+        time.sleep(7) # Allow time for Tor to establish a connection
+        self.driver_pool = get_driver_pool("tor")
+        self.driver = self.driver_pool.lease()
+
+    def close(self):
+        if self.driver is not None:
+            self.driver_pool.release(self.driver)
+            self.driver = None
+            logging.info("WebDriver returned to the pool.")
+        try:
+            if self.tor_process:
+                stop_tor(self.tor_process)
+                self.tor_process = None
+                time.sleep(5)
+                logging.info("Tor process stopped successfully.")
+        except Exception as e:
+            logging.error(f"Error stopping Tor process: {e}")
+
+    def _restart(self):
+        self.driver, self.tor_process = restart_pooled_driver_and_tor(self.driver_pool, self.driver, self.tor_process)
+        self.checks_since_restart = 0
+
+    def verify(self, email):
+        if self.checks_since_restart >= self.tor_restart_interval:
+            logging.info("Restarting Tor process...")
+            self._restart()
+            logging.info("Tor process restarted and new driver initialized")
+
+        email_status, self.tor_process = verify_email_scrapp(email, self.driver, self.tor_process)
+        if email_status == STATUS_SEARCH_LIMIT:
+            logging.info(f"Rate limit reached for {email}, restarting Tor and retrying")
+            self._restart()
+            email_status, self.tor_process = verify_email_scrapp(email, self.driver, self.tor_process)
+        if email_status not in (STATUS_SEARCH_LIMIT, STATUS_TIMEOUT, STATUS_CONNECTION_ERROR, STATUS_NO_RESULT):
+            self.checks_since_restart += 1
+
+        # Reset the WebDriver session after each verification to prevent stale sessions.
+        # Returning it to the pool health-checks it and clears its cookies.
+        self.driver_pool.release(self.driver)
+        self.driver = None
+        self.driver = self.driver_pool.lease()
+        logging.info("WebDriver reset for next email verification")
+        time.sleep(random.uniform(1, 2)) # Small random delay between requests.
+        return email_status
+
+
+class ApiVerifier(VerifierBackend):
+    """
+    Verifier for NeverBounce-style HTTP services: GET `api_url?key=...&email=...` answering JSON
+    like {"status": "success", "result": "valid"}. Results are mapped with API_RESULT_STATUSES.
+
+    Parameters:
+        api_url (str): Single-check endpoint. Defaults to Config.VERIFIER_API_URL.
+        api_key (str): API key. Defaults to Config.VERIFIER_API_KEY.
+        timeout (float): Seconds per request. Defaults to Config.HTTP_TIMEOUT.
+        rate_limit (float): Requests per second (0 for unlimited). Defaults to Config.VERIFIER_API_RATE_LIMIT.
+    """
+
+    name = "api"
+
+    def __init__(self, api_url=None, api_key=None, timeout=None, rate_limit=None):
+        self.api_url = api_url or Config.VERIFIER_API_URL
+        self.api_key = api_key if api_key is not None else Config.VERIFIER_API_KEY
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.rate_limit = Config.VERIFIER_API_RATE_LIMIT if rate_limit is None else rate_limit
+        self.client = None
+        self.async_client = None
+
+    def open(self):
+        self.client = httpx.Client(timeout=self.timeout)
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    async def aopen(self):
+        limits = httpx.Limits(max_connections=Config.VERIFIER_CONCURRENCY, max_keepalive_connections=Config.VERIFIER_CONCURRENCY)
+        self.async_client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+
+    async def aclose(self):
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
+
+    def _params(self, email):
+        return {"key": self.api_key, "email": email}
+
+    def _status_from_response(self, email, response):
+        """Maps an HTTP response of the service to a STATUS_* constant."""
+        if response.status_code == 429:
+            logging.warning(f"Verifier API rate limit reached for {email}")
+            return STATUS_SEARCH_LIMIT
+        if response.status_code >= 400:
+            logging.warning(f"Verifier API answered HTTP {response.status_code} for {email}")
+            return STATUS_CONNECTION_ERROR
+        try:
+            payload = response.json()
+        except ValueError:
+            logging.warning(f"Verifier API returned invalid JSON for {email}")
+            return STATUS_CONNECTION_ERROR
+        if payload.get("status") != "success":
+            logging.warning(f"Verifier API error for {email}: {payload.get('status')} {payload.get('message', '')}")
+            return STATUS_SEARCH_LIMIT if "throttle" in str(payload.get("status")) else STATUS_CONNECTION_ERROR
+        return API_RESULT_STATUSES.get(str(payload.get("result")).lower(), STATUS_NO_RESULT)
+
+    def verify(self, email):
+        client = self.client or httpx.Client(timeout=self.timeout)
+        try:
+            response = client.get(self.api_url, params=self._params(email))
+        except httpx.TimeoutException:
+            logging.warning(f"Verifier API timed out for {email}")
+            return STATUS_TIMEOUT
+        except httpx.HTTPError as e:
+            logging.warning(f"Verifier API request failed for {email}: {e}")
+            return STATUS_CONNECTION_ERROR
+        finally:
+            if client is not self.client:
+                client.close()
+        return self._status_from_response(email, response)
+
+    async def averify(self, email):
+        if self.async_client is None:
+            return await super().averify(email)
+        try:
+            response = await self.async_client.get(self.api_url, params=self._params(email))
+        except httpx.TimeoutException:
+            logging.warning(f"Verifier API timed out for {email}")
+            return STATUS_TIMEOUT
+        except httpx.HTTPError as e:
+            logging.warning(f"Verifier API request failed for {email}: {e}")
+            return STATUS_CONNECTION_ERROR
+        return self._status_from_response(email, response)
+
+
+def lookup_mx_hosts(domain):
+    """
+    Returns the mail exchangers of a domain, most preferred first.
+    Uses dnspython when it is installed; otherwise (and for domains without MX records) the domain
+    itself is returned, which is the implicit MX of RFC 5321.
+
+    Parameters:
+        domain (str): Mail domain.
+
+    Returns:
+        list: Host names. Empty if the domain does not exist.
+    """
+    try:
+        import dns.resolver
+    except ImportError:
+        return [domain]
+    try:
+        answers = dns.resolver.resolve(domain, "MX", lifetime=Config.SMTP_TIMEOUT)
+        return [str(record.exchange).rstrip(".") for record in sorted(answers, key=lambda record: record.preference)]
+    except dns.resolver.NXDOMAIN:
+        return []
+    except (dns.resolver.NoAnswer, dns.resolver.NoNameservers):
+        return [domain]
+    except Exception as e:
+        logging.warning(f"MX lookup failed for {domain}: {e}")
+        return [domain]
+
+
+class SmtpVerifier(VerifierBackend):
+    """
+    Verifier that asks the domain's mail server directly: MX lookup, then an SMTP dialogue
+    (EHLO, MAIL FROM, RCPT TO, QUIT) that never sends a message. A 250 answer means "Valid",
+    a permanent 5xx answer "Invalid". If a random address on the same domain is accepted as well,
+    the domain is "Catch-All". Temporary 4xx answers (greylisting) give "no_result".
+
+    Parameters:
+        mx_resolver (callable, optional): domain -> list of mail hosts. Defaults to `lookup_mx_hosts`.
+        port (int): SMTP port. Defaults to Config.SMTP_PORT.
+        helo_host (str): Name sent with EHLO. Defaults to Config.SMTP_HELO_HOST.
+        mail_from (str): Envelope sender. Defaults to Config.SMTP_MAIL_FROM.
+        timeout (float): Seconds per connection and per reply. Defaults to Config.SMTP_TIMEOUT.
+        check_catch_all (bool): Probe a random address to detect catch-all domains.
+        rate_limit (float): Probes per second (0 for unlimited). Defaults to Config.SMTP_RATE_LIMIT.
+    """
+
+    name = "smtp"
+
+    def __init__(self, mx_resolver=None, port=None, helo_host=None, mail_from=None, timeout=None, check_catch_all=True, rate_limit=None):
+        self.rate_limit = Config.SMTP_RATE_LIMIT if rate_limit is None else rate_limit
+        self.mx_resolver = mx_resolver or lookup_mx_hosts
+        self.port = port or Config.SMTP_PORT
+        self.helo_host = helo_host or Config.SMTP_HELO_HOST
+        self.mail_from = mail_from or Config.SMTP_MAIL_FROM
+        self.timeout = timeout or Config.SMTP_TIMEOUT
+        self.check_catch_all = check_catch_all
+        self._mx_hosts = {} # domain -> hosts, shared by all checks of a job
+
+    def verify(self, email):
+        return asyncio.run(self.averify(email))
+
+    async def _read_reply(self, reader):
+        """Reads a (possibly multi-line) SMTP reply and returns its code."""
+        while True:
+            line = await asyncio.wait_for(reader.readline(), self.timeout)
+            if not line:
+                raise ConnectionError("Connection closed by the mail server")
+            if line[3:4] != b"-":
+                return int(line[:3])
+
+    async def _command(self, reader, writer, command):
+        writer.write(f"{command}\r\n".encode())
+        await writer.drain()
+        return await self._read_reply(reader)
+
+    async def _probe(self, host, email, domain):
+        """Runs the SMTP dialogue with one mail host and returns a STATUS_* constant."""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, self.port), self.timeout)
+        try:
+            if await self._read_reply(reader) != 220:
+                return STATUS_CONNECTION_ERROR
+            if await self._command(reader, writer, f"EHLO {self.helo_host}") != 250:
+                await self._command(reader, writer, f"HELO {self.helo_host}")
+            if await self._command(reader, writer, f"MAIL FROM:<{self.mail_from}>") != 250:
+                return STATUS_CONNECTION_ERROR
+            code = await self._command(reader, writer, f"RCPT TO:<{email}>")
+            if code in (250, 251):
+                if self.check_catch_all:
+                    probe_address = f"{uuid.uuid4().hex[:16]}@{domain}"
+                    if await self._command(reader, writer, f"RCPT TO:<{probe_address}>") in (250, 251):
+                        return STATUS_CATCH_ALL
+                return STATUS_VALID
+            if 500 <= code < 600:
+                return STATUS_INVALID
+            return STATUS_NO_RESULT
+        finally:
+            try:
+                writer.write(b"QUIT\r\n")
+                await writer.drain()
+            except Exception:
+                pass
+            writer.close()
+
+    async def averify(self, email):
+        domain = email.rsplit("@", 1)[-1].lower()
+        if domain not in self._mx_hosts:
+            self._mx_hosts[domain] = await asyncio.to_thread(self.mx_resolver, domain)
+        hosts = self._mx_hosts[domain]
+        if not hosts:
+            logging.info(f"No mail server for {domain}; {email} is invalid")
+            return STATUS_INVALID
+
+        status = STATUS_CONNECTION_ERROR
+        for host in hosts:
+            try:
+                status = await self._probe(host, email, domain)
+            except asyncio.TimeoutError:
+                logging.warning(f"SMTP timeout at {host} for {email}")
+                status = STATUS_TIMEOUT
+                continue
+            except (OSError, ConnectionError, ValueError) as e:
+                logging.warning(f"SMTP error at {host} for {email}: {e}")
+                status = STATUS_CONNECTION_ERROR
+                continue
+            if status != STATUS_CONNECTION_ERROR:
+                break
+        logging.info(f"SMTP verification result for {email}: Email Status={status}")
+        return status
+
+
+# Backends selectable per job by name
+VERIFIER_BACKENDS = {
+    BrowserVerifier.name: BrowserVerifier,
+    ApiVerifier.name: ApiVerifier,
+    SmtpVerifier.name: SmtpVerifier,
+}
+
+def get_verifier(name=None, **kwargs):
+    """
+    Creates a verifier backend by name.
+
+    Parameters:
+        name (str, optional): Key of VERIFIER_BACKENDS. Defaults to Config.VERIFIER_BACKEND.
+        **kwargs: Passed to the backend's constructor.
+
+    Returns:
+        VerifierBackend: The backend.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    name = name or Config.VERIFIER_BACKEND
+    if name not in VERIFIER_BACKENDS:
+        raise ValueError(f"Unknown verifier backend '{name}'. Choose one of: {', '.join(VERIFIER_BACKENDS)}")
+    return VERIFIER_BACKENDS[name](**kwargs)
+
+def verify_rows_concurrently(df, rows, verifier, output_csv, window=None, job_id=None, step_id='step7', progress_offset=0, progress_total=None, cache_stats=None, concurrency=None):
+    """
+    Verifies the given rows with a concurrent backend (API or SMTP) on an asyncio event loop.
+
+    Rows are resolved from the verification cache first; the remaining unique addresses are checked
+    at most `concurrency` at a time and no faster than the backend's rate limit, so throughput is
+    bound by the provider's quota. Results are written to `df` as they arrive, and the stage file is
+    saved every Config.VERIFY_CHECKPOINT_ROWS results or Config.VERIFY_CHECKPOINT_SECONDS seconds
+    instead of after every row. The stop signal is checked at every checkpoint.
+
+    Parameters:
+        df (pd.DataFrame): Data with 'Email', 'Email Status' and 'Email_Processed' columns, updated in place.
+        rows (pd.Index): Labels of the rows to verify.
+        verifier (VerifierBackend): Backend used for the checks.
+        output_csv (str): Stage file path for the checkpoints.
+        window (tuple, optional): Window of `df` in the full file (see `load_csv`).
+        job_id (str, optional): Job ID for progress reporting.
+        step_id (str): Step ID for progress reporting and the stop signal.
+        progress_offset (int): Rows before the first row of the run, added to the reported progress.
+        progress_total (int, optional): Total reported with the progress. Defaults to offset + len(rows).
+        cache_stats (dict, optional): Counters updated in place (verify_cache_hits, catch_all_domain_hits, verifications_run).
+        concurrency (int, optional): Maximum checks in flight. Defaults to Config.VERIFIER_CONCURRENCY.
+
+    Returns:
+        bool: True if the run was stopped by the stop signal.
+    """
+    cache_stats = cache_stats if cache_stats is not None else {"verify_cache_hits": 0, "catch_all_domain_hits": 0, "verifications_run": 0}
+    progress_total = progress_total or progress_offset + len(rows)
+    rows_by_email = {} # address -> rows waiting for its result
+    done_rows = 0
+
+    for idx in rows:
+        email = str(df.at[idx, 'Email']).strip()
+        if not email or "@" not in email:
+            df.at[idx, 'Email Status'] = STATUS_INVALID
+            df.at[idx, 'Email_Processed'] = True
+            done_rows += 1
+            continue
+        cached_status, cache_source = lookup_verification(email)
+        if cached_status is not None:
+            df.at[idx, 'Email Status'] = cached_status
+            df.at[idx, 'Email_Processed'] = True
+            cache_stats["verify_cache_hits" if cache_source == "email" else "catch_all_domain_hits"] += 1
+            done_rows += 1
+            continue
+        rows_by_email.setdefault(email, []).append(idx)
+
+    logging.info(f"{done_rows} rows resolved without a check; verifying {len(rows_by_email)} addresses with the '{verifier.name}' backend")
+    state = {"done_rows": done_rows, "since_checkpoint": 0, "last_checkpoint": time.monotonic(), "stopped": False}
+
+    def checkpoint():
+        save_stage_file(df, output_csv, window=window)
+        write_progress(progress_offset + state["done_rows"], progress_total, job_id, step_id=step_id)
+        state["since_checkpoint"] = 0
+        state["last_checkpoint"] = time.monotonic()
+
+    def on_result(email, status):
+        for idx in rows_by_email[email]:
+            df.at[idx, 'Email Status'] = status
+            df.at[idx, 'Email_Processed'] = status in (STATUS_VALID, STATUS_INVALID, STATUS_CATCH_ALL)
+        record_verification(email, status)
+        cache_stats["verifications_run"] += 1
+        state["done_rows"] += len(rows_by_email[email])
+        state["since_checkpoint"] += 1
+        if state["since_checkpoint"] >= Config.VERIFY_CHECKPOINT_ROWS or time.monotonic() - state["last_checkpoint"] >= Config.VERIFY_CHECKPOINT_SECONDS:
+            checkpoint()
+            if check_stop_signal(step_id):
+                logging.info("Stop signal detected, terminating process")
+                state["stopped"] = True
+                return False
+        return True
+
+    if rows_by_email:
+        asyncio.run(verifier.averify_each(list(rows_by_email), on_result=on_result, concurrency=concurrency))
+    save_stage_file(df, output_csv, window=window)
+    write_progress(progress_offset + state["done_rows"], progress_total, job_id, step_id=step_id, stop_call=state["stopped"])
+    return state["stopped"]
+
+def process_csv_and_verify_emails(input_csv, output_csv, max_rows=2000, batch_size=50, tor_restart_interval=30, offset=0, delete_invalid=True, job_id=None, step_id='step7', windowed=False, verifier=None, concurrency=None):
     """
     Processes a CSV file to verify email addresses contained within it using the Skrapp.io service.
     It reads emails from the specified input CSV, iteratively verifies them, and writes the
-    results (verification status, processed flag) back to an output CSV.
+    results (verification status, processed flag) back to an output CSV. The check itself is done
+    by a verifier backend (browser, API or SMTP, see VERIFIER_BACKENDS) chosen per job.
 
     The function incorporates several key features:
     - **Incremental Processing**: Works through the CSV in batches, saving progress after each email
       is processed to allow for resumption in case of interruption.
     - **Skip Processed Rows**: Checks for a 'Email_Processed' column and skips rows already marked True.
-    - **Tor Integration**: Manages a Tor process for IP rotation, restarting it at a configurable
-      interval (`tor_restart_interval`) of processed emails to avoid IP-based rate limits.
+    - **Pre-check**: Before the browser starts, the unprocessed rows are checked offline (syntax, role
+      mailboxes, disposable domains, duplicates) and rows that cannot be worth verifying are skipped.
+    - **Tor Integration**: The browser backend manages a Tor process for IP rotation, restarting it at a
+      configurable interval (`tor_restart_interval`) of processed emails to avoid IP-based rate limits.
     - **Error Handling**: Includes try-except blocks for robust operation, handling network issues,
       WebDriver problems, and Skrapp.io specific responses (like rate limits).
     - **Offset and Max Rows**: Allows processing a subset of the CSV using `offset` to skip initial
@@ -263,6 +812,16 @@ def process_csv_and_verify_emails(input_csv, output_csv, max_rows=2000, batch_si
     step_id (str, optional):
         An identifier for the current step within a larger job pipeline, used for external
         progress tracking and stop signal checks. Defaults to 'step7'.
+    windowed (bool, optional):
+        If True, only rows [offset, offset + max_rows) and the columns this step uses are loaded,
+        and the processed rows are merged back into the full output at the end. Defaults to False.
+    verifier (str or VerifierBackend, optional):
+        Backend that checks the addresses: "browser", "api" or "smtp", or a backend instance.
+        Defaults to Config.VERIFIER_BACKEND.
+    concurrency (int, optional):
+        Maximum checks in flight for concurrent backends ("api", "smtp"), which are run with
+        `verify_rows_concurrently` instead of row by row. 1 forces the row-by-row loop.
+        Defaults to Config.VERIFIER_CONCURRENCY.
 
     Returns:
     --------
@@ -277,10 +836,18 @@ def process_csv_and_verify_emails(input_csv, output_csv, max_rows=2000, batch_si
         df, resolved_input_csv = load_csv(
             input_csv=input_csv,
             output_csv=output_csv,
-            required_columns=['Email'] # Ensures the 'Email' column is present
+            required_columns=['Email'], # Ensures the 'Email' column is present
+            offset=offset,
+            max_rows=max_rows if windowed else None,
+            columns=WINDOW_COLUMNS
         )
         if df is None: # load_csv returns None if loading fails
             return None
+        window = df.attrs.get("window") # Set by load_csv in windowed mode
+        # Absolute row count up to the end of the loaded rows (the window end in windowed mode)
+        row_count = df.index[-1] + 1 if not df.empty else 0
+        # Report the in-memory footprint of the loaded (compact) DataFrame with the job
+        record_job_metrics(step_id, job_id, rows_loaded=len(df), memory_mb=dataframe_memory_mb(df))
 
         # Initialize 'Email Status' and 'Email_Processed' columns if they don't exist.
         # 'Email_Processed' tracks whether an email has been attempted for verification.
@@ -299,146 +866,155 @@ def process_csv_and_verify_emails(input_csv, output_csv, max_rows=2000, batch_si
         if offset < 0:
             logging.error("Offset cannot be negative.")
             raise ValueError("Offset cannot be negative")
-        if offset >= len(df):
-            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {len(df)}. No rows to process.")
+        if offset >= row_count:
+            logging.info(f"Offset {offset} is greater than or equal to DataFrame length {row_count}. No rows to process.")
             return df # Return the original DataFrame as no processing is needed.
 
         # Calculate the total number of rows to actually process, considering offset and max_rows.
-        total_rows_to_process_after_offset = min(len(df) - offset, max_rows)
+        total_rows_to_process_after_offset = min(row_count - offset, max_rows)
         if total_rows_to_process_after_offset <= 0:
             logging.info(f"No rows to process after applying offset {offset} and max_rows {max_rows}.")
             return df
 
         logging.info(f"Total rows to process (after offset {offset}, up to max_rows {max_rows}): {total_rows_to_process_after_offset}")
 
-        # Initialize Tor process and Selenium WebDriver configured to use Tor.
-        # This is crucial for IP rotation to avoid rate limits from Skrapp.io.
-        tor_process = start_tor()
-        time.sleep(7) # Allow time for Tor to establish a connection
-        driver = setup_chrome_with_tor()
+        # Offline pre-check of the rows still to verify, so malformed, role, disposable and duplicate
+        # addresses never reach the browser.
+        run_rows = df.loc[offset:offset + total_rows_to_process_after_offset - 1]
+        precheck_counts = apply_precheck(df, run_rows.index[~run_rows['Email_Processed']])
+        record_job_metrics(step_id, job_id, **{f"precheck_{label}": count for label, count in precheck_counts.items()})
+        save_stage_file(df, output_csv, window=window)
+
+        # Open the verifier backend (for the browser backend: Tor and a pooled WebDriver using it).
+        if not isinstance(verifier, VerifierBackend):
+            backend_options = {"tor_restart_interval": tor_restart_interval} if (verifier or Config.VERIFIER_BACKEND) == BrowserVerifier.name else {}
+            verifier = get_verifier(verifier, **backend_options)
+        use_pipeline = verifier.concurrent and concurrency != 1
+        logging.info(f"Verifying emails with the '{verifier.name}' backend ({'concurrent' if use_pipeline else 'row by row'})")
+        verifier.open()
 
         stopped = False # Flag to indicate if processing was stopped by an external signal.
+        wait_totals = {"wait_seconds": 0.0, "work_seconds": 0.0} # Time spent waiting on pages vs working
+        cache_stats = {"verify_cache_hits": 0, "catch_all_domain_hits": 0, "verifications_run": 0}
 
         try:
-            rows_since_last_tor_restart = 0 # Counter for Tor restart interval
-            # Process DataFrame in batches. `offset` defines the starting point.
-            # `total_rows_to_process_after_offset` defines how many rows from the offset point should be processed.
-            for batch_start_idx in range(offset, offset + total_rows_to_process_after_offset, batch_size):
-                if check_stop_signal(step_id):
-                    logging.info("Stop signal detected, terminating process")
-                    write_progress(batch_start_idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id, stop_call=True)
-                    df.to_csv(output_csv, index=False)
-                    stopped = True
-                    break
+            if use_pipeline:
+                # Concurrent backends: all pending rows are checked on an event loop with batched checkpoints.
+                pending_rows = run_rows.index[~df.loc[run_rows.index, 'Email_Processed'] & (df.loc[run_rows.index, 'PreCheck'] != PRECHECK_DUPLICATE)]
+                stopped = verify_rows_concurrently(
+                    df, pending_rows, verifier, output_csv, window=window, job_id=job_id, step_id=step_id,
+                    progress_offset=offset, progress_total=total_rows_to_process_after_offset + offset,
+                    cache_stats=cache_stats, concurrency=concurrency,
+                )
+            else:
+                # Process DataFrame in batches. `offset` defines the starting point.
+                # `total_rows_to_process_after_offset` defines how many rows from the offset point should be processed.
+                for batch_start_idx in range(offset, offset + total_rows_to_process_after_offset, batch_size):
+                    if check_stop_signal(step_id):
+                        logging.info("Stop signal detected, terminating process")
+                        write_progress(batch_start_idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id, stop_call=True)
+                        save_stage_file(df, output_csv, window=window)
+                        stopped = True
+                        break
 
-                batch_end_idx = min(batch_start_idx + batch_size, offset + total_rows_to_process_after_offset)
-                current_batch_df_slice = df.iloc[batch_start_idx:batch_end_idx]
+                    batch_end_idx = min(batch_start_idx + batch_size, offset + total_rows_to_process_after_offset)
+                    current_batch_df_slice = df.loc[batch_start_idx:batch_end_idx - 1]
 
-                # Check for unprocessed rows
-                unprocessed_mask = ~current_batch_df_slice['Email_Processed']
-                if not unprocessed_mask.any():
-                    logging.info(f"Batch from index {batch_start_idx}-{batch_end_idx} already processed, skipping.")
-                    write_progress(batch_end_idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id)
-                    continue # Move to the next batch.
+                    # Check for unprocessed rows
+                    unprocessed_mask = ~current_batch_df_slice['Email_Processed']
+                    if not unprocessed_mask.any():
+                        logging.info(f"Batch from index {batch_start_idx}-{batch_end_idx} already processed, skipping.")
+                        write_progress(batch_end_idx, offset + total_rows_to_process_after_offset, job_id, step_id=step_id)
+                        continue # Move to the next batch.
 
-                logging.info(f"Processing batch: rows from index {batch_start_idx} to {batch_end_idx} (out of {offset + total_rows_to_process_after_offset} total to process).")
+                    logging.info(f"Processing batch: rows from index {batch_start_idx} to {batch_end_idx} (out of {offset + total_rows_to_process_after_offset} total to process).")
 
-                try:
-                    for idx in current_batch_df_slice[unprocessed_mask].index:
-                        # Check for stop signal before processing each row.
-                        if check_stop_signal(step_id):
-                            logging.info("Stop signal detected, terminating process")
-                            write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id, stop_call=True)
-                            df.to_csv(output_csv, index=False)
-                            stopped = True
-                            break
-
-                        email = df.at[idx, 'Email'].strip()
+                    try:
+                        for idx in current_batch_df_slice[unprocessed_mask].index:
+                            # Check for stop signal before processing each row.
+                            if check_stop_signal(step_id):
+                                logging.info("Stop signal detected, terminating process")
+                                write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id, stop_call=True)
+                                save_stage_file(df, output_csv, window=window)
+                                stopped = True
+                                break
+
+                            if df.at[idx, 'PreCheck'] == PRECHECK_DUPLICATE:
+                                continue # Gets the result of the first occurrence in resolve_duplicates
+
+                            email = df.at[idx, 'Email'].strip()
                         
-                        if not email or "@" not in email:
-                            logging.info(f"Skipping row {idx + 1}: Invalid or empty email")
-                            df.at[idx, 'Email_Processed'] = True
-                            df.at[idx, 'Email Status'] = STATUS_INVALID
-                            df.to_csv(output_csv, index=False)
+                            if not email or "@" not in email:
+                                logging.info(f"Skipping row {idx + 1}: Invalid or empty email")
+                                df.at[idx, 'Email_Processed'] = True
+                                df.at[idx, 'Email Status'] = STATUS_INVALID
+                                save_stage_file(df, output_csv, window=window)
+                                logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
+                                write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id)
+                                continue
+
+                            # Reuse an earlier verification of this address, or of any address on a known catch-all domain
+                            cached_status, cache_source = lookup_verification(email)
+                            if cached_status is not None:
+                                logging.info(f"Verification cache hit ({cache_source}) for row {idx + 1}: {email} -> {cached_status}")
+                                df.at[idx, 'Email Status'] = cached_status
+                                df.at[idx, 'Email_Processed'] = True
+                                cache_stats["verify_cache_hits" if cache_source == "email" else "catch_all_domain_hits"] += 1
+                                save_stage_file(df, output_csv, window=window)
+                                write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id)
+                                continue
+
+                            logging.info(f"Processing row {idx + 1}/{len(df)}: {email}")
+                            reset_wait_timer()
+                            email_status = verifier.verify(email)
+
+                            row_timing = read_wait_timer()
+                            for key, value in row_timing.items():
+                                wait_totals[key] += value
+                            logging.info(f"Row {idx + 1} timing: waited {row_timing['wait_seconds']}s, worked {row_timing['work_seconds']}s")
+
+                            # Update DataFrame with status
+                            df.at[idx, 'Email Status'] = email_status
+                            cache_stats["verifications_run"] += 1
+                            record_verification(email, email_status)
+                            # Set Email_Processed based on status
+                            df.at[idx, 'Email_Processed'] = email_status in [ STATUS_VALID, STATUS_INVALID, STATUS_CATCH_ALL]
+
+                            # Save progress to the output CSV file after processing each row.
+                            save_stage_file(df, output_csv, window=window)
                             logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
+                            # Report progress for this row.
                             write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id)
-                            continue
-
-                        # Check if Tor needs restarting
-                        if rows_since_last_tor_restart >= tor_restart_interval:
-                            logging.info("Restarting Tor process...")
-                            driver, tor_process = restart_driver_and_tor(driver, tor_process, True, False)
-                            rows_since_last_tor_restart = 0
-                            logging.info("Tor process restarted and new driver initialized")
-
-                        logging.info(f"Processing row {idx + 1}/{len(df)}: {email}")
-                        email_status, tor_process = verify_email_scrapp(email, driver, tor_process)
-                        # Handle rate limit
-                        if email_status == STATUS_SEARCH_LIMIT:
-                            logging.info(f"Rate limit reached for row {idx + 1}, restarting Tor and retrying")
-                            driver, tor_process = restart_driver_and_tor(driver, tor_process, True, False)
-                            rows_since_last_tor_restart = 0
-                            email_status, tor_process = verify_email_scrapp(email, driver, tor_process)
-
-                        # Update DataFrame with status
-                        df.at[idx, 'Email Status'] = email_status
-                        # Set Email_Processed based on status
-                        df.at[idx, 'Email_Processed'] = email_status in [ STATUS_VALID, STATUS_INVALID, STATUS_CATCH_ALL]
-                        if email_status in [STATUS_SEARCH_LIMIT, STATUS_TIMEOUT, STATUS_CONNECTION_ERROR, STATUS_NO_RESULT]:
-                            # rows_since_last_tor_restart = 0  # Reset counter for transient errors
-                            pass
-                        else:
-                            rows_since_last_tor_restart += 1
-
-                        # Reset WebDriver after each verification to prevent stale sessions
-                        try:
-                            driver.quit()
-                        except WebDriverException as e:
-                            logging.warning(f"Failed to close WebDriver after verification: {e}")
-                        driver = setup_chrome_with_tor() 
-                        logging.info(f"WebDriver reset for next email verification")
-
-                        # Save progress to the output CSV file after processing each row.
-                        df.to_csv(output_csv, index=False)
-                        logging.info(f"Saved progress for row {idx + 1} to {output_csv}")
-                        # Report progress for this row.
-                        write_progress(idx + 1, total_rows_to_process_after_offset + offset, job_id, step_id=step_id)
-
-                        time.sleep(random.uniform(1, 2)) # Small random delay between requests.
-                except Exception as e:
-                    logging.error(f"Error processing batch from index {batch_start_idx} to {batch_end_idx}: {e}", exc_info=True)
-                finally:
-                    # # Ensure WebDriver for the batch is closed.
-                    # if driver is not None:
-                    #     try:
-                    #         driver.quit()
-                    #         logging.info(f"WebDriver closed successfully for batch {batch_start_idx}-{batch_end_idx}.")
-                    #     except Exception as e:
-                    #         logging.error(f"Error closing WebDriver for batch {batch_start_idx}-{batch_end_idx}: {e}")
-                    #     # kill_chrome_processes() # Optional: ensure all related browser processes are terminated.
-                        time.sleep(2)  # Brief pause to ensure processes can terminate fully.
-                if stopped:
-                    break
+                    except Exception as e:
+                        logging.error(f"Error processing batch from index {batch_start_idx} to {batch_end_idx}: {e}", exc_info=True)
+                    finally:
+                        # # Ensure WebDriver for the batch is closed.
+                        # if driver is not None:
+                        #     try:
+                        #         driver.quit()
+                        #         logging.info(f"WebDriver closed successfully for batch {batch_start_idx}-{batch_end_idx}.")
+                        #     except Exception as e:
+                        #         logging.error(f"Error closing WebDriver for batch {batch_start_idx}-{batch_end_idx}: {e}")
+                        #     # kill_chrome_processes() # Optional: ensure all related browser processes are terminated.
+                            time.sleep(2)  # Brief pause to ensure processes can terminate fully.
+                    if stopped:
+                        break
 
         finally: # This 'finally' is for the main try-catch block of the function.
-            # This block executes regardless of exceptions in the processing loop,
-            # but not if WebDriver & Tor Process are managed solely within the batch loop's try-finally.
-            # The driver & tor here would be the one from the last batch if not properly closed there.
-            # However, current logic closes driver per batch. This might be redundant or a safeguard.
-            if driver is not None: # Check if driver instance might still exist (e.g., if error before batch finally)
-                try:
-                    driver.quit()
-                    time.sleep(2)
-                    logging.info("WebDriver closed successfully in main finally block (safeguard).")
-                except Exception as e:
-                    logging.error(f"Error closing WebDriver in main finally block: {e}")
-            try:
-                if tor_process: # Check if tor proccess might still exist (e.g., if error before batch finally)
-                    stop_tor(tor_process)
-                    time.sleep(5)
-                    logging.info("Tor process stopped successfully in main finally block (safeguard).")                    
-            except Exception as e:
-                    logging.error(f"Error stopped Tor process in main finally block: {e}")
+            # This block executes regardless of exceptions in the processing loop and releases
+            # the verifier backend's resources (for the browser backend: the WebDriver and Tor).
+            verifier.close()
+            resolved_duplicates = resolve_duplicates(df)
+            if resolved_duplicates:
+                logging.info(f"Copied the verification result to {resolved_duplicates} duplicate rows")
+                save_stage_file(df, output_csv, window=window)
+            record_job_metrics(step_id, job_id, **{key: round(value, 1) for key, value in wait_totals.items()})
+            # Every cache hit is a browser verification round trip that was not needed.
+            browser_checks_avoided = cache_stats["verify_cache_hits"] + cache_stats["catch_all_domain_hits"]
+            record_job_metrics(step_id, job_id, browser_checks_avoided=browser_checks_avoided, **cache_stats)
+            logging.info(f"Verification cache: {browser_checks_avoided} browser checks avoided "
+                         f"({cache_stats['verify_cache_hits']} address hits, {cache_stats['catch_all_domain_hits']} catch-all domain hits), "
+                         f"{cache_stats['verifications_run']} verifications run")
 
             # Report final progress status (completed or stopped).
             if not stopped:
@@ -463,11 +1039,13 @@ def process_csv_and_verify_emails(input_csv, output_csv, max_rows=2000, batch_si
             deleted_rows_count = initial_row_count - len(df)
             if deleted_rows_count > 0:
                 logging.info(f"Deleted {deleted_rows_count} rows where Email Status was {STATUS_INVALID}")
-                df.to_csv(output_csv, index=False) # Save the filtered DataFrame.
+                save_stage_file(df, output_csv, window=window) # Save the filtered DataFrame.
                 logging.info(f"Saved final DataFrame after deleting rows to {output_csv}")
             else:
                 logging.info(f"No rows with Email Status {STATUS_INVALID} found to delete")
 
+        # Export the final state as CSV (the format shared between steps)
+        export_csv(df, output_csv, window=window)
         logging.info(f"Final row count after processing: {len(df)}")
         return df
 
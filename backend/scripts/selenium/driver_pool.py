@@ -0,0 +1,290 @@
+"""
+Pool of warm, reusable WebDriver sessions shared across jobs.
+
+Jobs lease a ready browser instead of cold-starting Chrome for every batch or job and return it when done.
+Returned browsers are health-checked and recycled once they exceed `Config.DRIVER_POOL_MAX_AGE`
+seconds or `Config.DRIVER_POOL_MAX_USES` leases. Each driver kind has its own pool:
+
+    "standard"  -> setup_driver
+    "linkedin"  -> setup_driver_linkedin_singin (always size 1: a Chrome profile can only be opened once)
+    "tor"       -> setup_chrome_with_tor (cookies are cleared on return so jobs do not share Skrapp sessions)
+"""
+import atexit
+import logging
+import threading
+import time
+from backend.config import Config
+from backend.scripts.selenium.driver_setup_for_scrape import setup_driver, setup_driver_linkedin_singin, setup_chrome_with_tor, restart_tor
+
+# Factory used to create the browsers of each pool kind
+DRIVER_FACTORIES = {
+    "standard": setup_driver,
+    "linkedin": setup_driver_linkedin_singin,
+    "tor": setup_chrome_with_tor,
+}
+
+# Pool kinds whose browsers keep their cookies between leases (the LinkedIn session must survive)
+KEEP_COOKIES_KINDS = {"linkedin"}
+
+class DriverPool:
+    """
+    Thread-safe pool of WebDriver instances of one kind with lease/release semantics.
+
+    Parameters:
+        kind (str): Pool kind, one of DRIVER_FACTORIES.
+        size (int): Maximum number of browsers (idle + leased) the pool keeps open.
+        max_age (int): Seconds after which a browser is closed instead of being reused.
+        max_uses (int): Number of leases after which a browser is closed instead of being reused.
+        headless (bool): Run the browsers in headless mode.
+    """
+
+    def __init__(self, kind, size=1, max_age=1800, max_uses=50, headless=False):
+        if kind not in DRIVER_FACTORIES:
+            raise ValueError(f"Unknown driver pool kind '{kind}'. Use one of: {', '.join(DRIVER_FACTORIES)}")
+        self.kind = kind
+        self.size = 1 if kind == "linkedin" else max(1, size)
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self.headless = headless
+        self._idle = []
+        self._leased = 0
+        self._creating = 0
+        self._condition = threading.Condition()
+
+    def _create_driver(self):
+        """Starts a new browser and stamps it with the pool bookkeeping attributes."""
+        start = time.perf_counter()
+        driver = DRIVER_FACTORIES[self.kind](headless=self.headless)
+        driver._pool_created_at = time.time()
+        driver._pool_uses = 0
+        logging.info(f"Driver pool '{self.kind}': started a new browser in {time.perf_counter() - start:.1f}s")
+        return driver
+
+    def _quit_driver(self, driver):
+        """Closes a browser, ignoring errors from sessions that are already dead."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Driver pool '{self.kind}': error while closing browser: {e}")
+
+    def _clear_cookies(self, driver):
+        """Clears all cookies of a browser so the next job starts with a clean session."""
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            try:
+                driver.delete_all_cookies()
+            except Exception as e:
+                logging.warning(f"Driver pool '{self.kind}': could not clear cookies: {e}")
+
+    def _is_healthy(self, driver):
+        """Returns True if the browser session still answers commands."""
+        try:
+            driver.execute_script("return document.readyState")
+            return bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def _is_expired(self, driver):
+        """Returns True if the browser reached its maximum age or number of leases."""
+        age = time.time() - getattr(driver, "_pool_created_at", time.time())
+        return age >= self.max_age or getattr(driver, "_pool_uses", 0) >= self.max_uses
+
+    def lease(self, timeout=None):
+        """
+        Leases a ready browser, starting a new one if no healthy idle browser is available.
+        Blocks while the pool is at its maximum size.
+
+        Parameters:
+            timeout (float, optional): Seconds to wait for a free slot. Defaults to Config.DRIVER_POOL_LEASE_TIMEOUT.
+
+        Returns:
+            WebDriver: The leased browser.
+        """
+        timeout = Config.DRIVER_POOL_LEASE_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while not self._idle and self._leased + self._creating >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No '{self.kind}' browser became available within {timeout}s")
+                    self._condition.wait(remaining)
+                if self._idle:
+                    driver = self._idle.pop()
+                    self._leased += 1
+                else:
+                    driver = None
+                    self._creating += 1
+
+            if driver is None:
+                try:
+                    driver = self._create_driver()
+                except Exception:
+                    with self._condition:
+                        self._creating -= 1
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self._creating -= 1
+                    self._leased += 1
+            elif not self._is_healthy(driver) or self._is_expired(driver):
+                logging.info(f"Driver pool '{self.kind}': recycling an unhealthy or expired browser")
+                self._quit_driver(driver)
+                with self._condition:
+                    self._leased -= 1
+                    self._condition.notify()
+                continue
+
+            driver._pool_uses += 1
+            return driver
+
+    def release(self, driver, discard=False):
+        """
+        Returns a leased browser to the pool. Browsers that are unhealthy, expired or discarded are closed.
+        Browsers created outside the pool (e.g. by `restart_driver_and_tor` during a job) are adopted.
+
+        Parameters:
+            driver (WebDriver or None): The browser to return. None only frees the lease.
+            discard (bool): Close the browser instead of returning it to the pool.
+        """
+        keep = False
+        if driver is not None:
+            if not hasattr(driver, "_pool_created_at"):
+                driver._pool_created_at = time.time()
+                driver._pool_uses = 1
+            keep = not discard and self._is_healthy(driver) and not self._is_expired(driver)
+            if keep and self.kind not in KEEP_COOKIES_KINDS:
+                self._clear_cookies(driver)
+
+        with self._condition:
+            self._leased = max(0, self._leased - 1)
+            if keep and len(self._idle) + self._leased + self._creating < self.size:
+                self._idle.append(driver)
+            else:
+                keep = False
+            self._condition.notify()
+
+        if driver is not None and not keep:
+            self._quit_driver(driver)
+
+    def replace(self, driver):
+        """
+        Discards a leased browser and leases a fresh one in its place.
+
+        Parameters:
+            driver (WebDriver or None): The browser to discard.
+
+        Returns:
+            WebDriver: The new browser.
+        """
+        self.release(driver, discard=True)
+        return self.lease()
+
+    def prewarm(self, count=None):
+        """
+        Starts idle browsers ahead of time so the next leases do not wait for Chrome to start.
+
+        Parameters:
+            count (int, optional): Number of idle browsers to have ready. Defaults to the pool size.
+        """
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self._condition:
+                if len(self._idle) >= count or len(self._idle) + self._leased + self._creating >= self.size:
+                    return
+                self._creating += 1
+            try:
+                driver = self._create_driver()
+            except Exception as e:
+                logging.error(f"Driver pool '{self.kind}': failed to pre-warm a browser: {e}")
+                with self._condition:
+                    self._creating -= 1
+                    self._condition.notify()
+                return
+            with self._condition:
+                self._creating -= 1
+                self._idle.append(driver)
+                self._condition.notify()
+
+    def close_all(self):
+        """Closes all idle browsers. Leased browsers are closed when they are returned."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit_driver(driver)
+
+    def stats(self):
+        """Returns the number of idle and leased browsers of the pool."""
+        with self._condition:
+            return {"kind": self.kind, "size": self.size, "idle": len(self._idle), "leased": self._leased}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_driver_pool(kind="standard"):
+    """
+    Returns the shared pool for a driver kind, creating it from the Config settings on first use.
+
+    Parameters:
+        kind (str): Pool kind, one of DRIVER_FACTORIES.
+
+    Returns:
+        DriverPool: The shared pool.
+    """
+    with _pools_lock:
+        if kind not in _pools:
+            _pools[kind] = DriverPool(
+                kind,
+                size=Config.DRIVER_POOL_SIZE,
+                max_age=Config.DRIVER_POOL_MAX_AGE,
+                max_uses=Config.DRIVER_POOL_MAX_USES,
+                headless=Config.DRIVER_POOL_HEADLESS,
+            )
+        return _pools[kind]
+
+def restart_pooled_driver_and_tor(pool, driver, tor_process):
+    """
+    Pool-aware replacement for `restart_driver_and_tor(driver, tor_process, use_tor=True)`:
+    discards the leased browser, restarts Tor for a new circuit and leases a fresh browser.
+
+    Parameters:
+        pool (DriverPool): The "tor" pool the browser was leased from.
+        driver (WebDriver): The leased browser to discard.
+        tor_process (subprocess.Popen): Current Tor process.
+
+    Returns:
+        tuple: (new_driver, new_tor_process)
+    """
+    pool.release(driver, discard=True)
+    new_tor_process = restart_tor(tor_process)
+    time.sleep(5)  # Wait for new Tor process to initialize
+    return pool.lease(), new_tor_process
+
+def prewarm_driver_pools(kinds=None):
+    """
+    Pre-warms the configured pools in background threads, so app start-up is not blocked.
+
+    Parameters:
+        kinds (list, optional): Pool kinds to pre-warm. Defaults to Config.DRIVER_POOL_PREWARM.
+
+    Returns:
+        list: The started threads.
+    """
+    kinds = Config.DRIVER_POOL_PREWARM if kinds is None else kinds
+    threads = []
+    for kind in kinds:
+        thread = threading.Thread(target=get_driver_pool(kind).prewarm, name=f"prewarm-{kind}", daemon=True)
+        thread.start()
+        threads.append(thread)
+        logging.info(f"Pre-warming '{kind}' driver pool")
+    return threads
+
+def shutdown_driver_pools():
+    """Closes the idle browsers of all pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
+
+atexit.register(shutdown_driver_pools)
@@ -10,7 +10,76 @@ import subprocess
 import psutil
 from backend.config import Config
 
-def restart_driver_and_tor(driver, tor_process, use_tor=False, linkedin=False, chromedriver_path=Config.CHROMEDRIVER_PATH, tor_path=Config.TOR_EXECUTABLE, headless=False):
+# Resources blocked by the lean profile. The scrapers only read DOM text, so images, fonts and media are never needed.
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.bmp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg", "*.wav",
+]
+
+def apply_lean_chrome_options(options):
+    """
+    Configures ChromeOptions for the lean profile: no images, media autoplay, extensions or GPU,
+    and `driver.get` returns at DOMContentLoaded ("eager") instead of waiting for every resource.
+
+    Parameters:
+        options (ChromeOptions): Options to update.
+
+    Returns:
+        ChromeOptions: The updated options.
+    """
+    options.page_load_strategy = "eager"
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--autoplay-policy=user-gesture-required")
+    options.add_argument("--mute-audio")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return options
+
+def apply_lean_firefox_options(options):
+    """
+    Configures FirefoxOptions for the lean profile (same intent as `apply_lean_chrome_options`).
+
+    Parameters:
+        options (FirefoxOptions): Options to update.
+
+    Returns:
+        FirefoxOptions: The updated options.
+    """
+    options.page_load_strategy = "eager"
+    options.set_preference("permissions.default.image", 2)
+    options.set_preference("media.autoplay.default", 5)
+    options.set_preference("gfx.downloadable_fonts.enabled", False)
+    options.set_preference("layers.acceleration.disabled", True)
+    options.set_preference("extensions.enabledScopes", 0)
+    return options
+
+def enable_lean_network_blocking(driver):
+    """
+    Blocks the LEAN_BLOCKED_URL_PATTERNS requests through the Chrome DevTools Protocol, which also catches
+    fonts and media that the Chrome prefs do not cover. Does nothing on browsers without CDP (Firefox).
+
+    Parameters:
+        driver (WebDriver): WebDriver instance.
+
+    Returns:
+        bool: True if blocking was enabled.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URL_PATTERNS})
+        return True
+    except Exception as e:
+        logging.warning(f"Could not enable resource blocking for the lean profile: {e}")
+        return False
+
+def restart_driver_and_tor(driver, tor_process, use_tor=False, linkedin=False, chromedriver_path=Config.CHROMEDRIVER_PATH, tor_path=Config.TOR_EXECUTABLE, headless=False, lean=Config.DRIVER_LEAN_PROFILE):
     """
     Restarts both the WebDriver and Tor process (if applicable) with proper cleanup and reinitialization.
     
@@ -22,6 +91,7 @@ def restart_driver_and_tor(driver, tor_process, use_tor=False, linkedin=False, c
         chromedriver_path (str): Path to chromedriver executable.
         tor_path (str): Path to tor.exe.
         headless (bool): Run WebDriver in headless mode.
+        lean (bool): Use the lean resource-blocking profile.
     
     Returns:
         tuple: (new_driver, new_tor_process) where new_driver is the new WebDriver instance
@@ -82,13 +152,13 @@ def restart_driver_and_tor(driver, tor_process, use_tor=False, linkedin=False, c
     try:
         logging.info(f"Initializing new WebDriver. use_tor: {use_tor}, linkedin: {linkedin}")
         if use_tor and new_tor_process: # Only use Tor setup if Tor actually started
-            new_driver = setup_chrome_with_tor(chromedriver_path, headless=headless)
+            new_driver = setup_chrome_with_tor(chromedriver_path, headless=headless, lean=lean)
             logging.info("WebDriver initialized with Tor configuration.")
         elif linkedin:
-            new_driver = setup_driver_linkedin_singin(chromedriver_path, headless=headless)
+            new_driver = setup_driver_linkedin_singin(chromedriver_path, headless=headless, lean=lean)
             logging.info("WebDriver initialized with LinkedIn profile configuration.")
         else:
-            new_driver = setup_driver(chromedriver_path, headless=headless)
+            new_driver = setup_driver(chromedriver_path, headless=headless, lean=lean)
             logging.info("WebDriver initialized with standard configuration.")
         
         if new_driver:
@@ -108,7 +178,7 @@ def restart_driver_and_tor(driver, tor_process, use_tor=False, linkedin=False, c
 
     return new_driver, new_tor_process
 
-def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", headless=False):
+def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", headless=False, lean=Config.DRIVER_LEAN_PROFILE):
     """
     Sets up a WebDriver (Chrome or Firefox) with anti-detection measures to appear less like a bot.
     
@@ -116,6 +186,7 @@ def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", h
         chromedriver_path (str, optional): Path to the WebDriver executable (Chrome or Gecko).
         browser (str, optional): Browser type ("chrome" or "firefox"). Defaults to "chrome".
         headless (bool, optional): Run in headless mode. Defaults to False.
+        lean (bool, optional): Block images, media and fonts and load pages eagerly. Defaults to Config.DRIVER_LEAN_PROFILE.
     
     Returns:
         WebDriver: Configured WebDriver instance.
@@ -129,6 +200,8 @@ def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", h
         options.set_preference("general.useragent.override", user_agent)
         if headless:
             options.add_argument("--headless")
+        if lean:
+            apply_lean_firefox_options(options)
         if chromedriver_path:
             service = FirefoxService(chromedriver_path)
             driver = webdriver.Firefox(service=service, options=options)
@@ -144,6 +217,8 @@ def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", h
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        if lean:
+            apply_lean_chrome_options(options)
         if chromedriver_path:
             service = Service(chromedriver_path)
             driver = webdriver.Chrome(service=service, options=options)
@@ -152,6 +227,8 @@ def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", h
 
     # Remove 'webdriver' property to avoid detection
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        enable_lean_network_blocking(driver)
 
     # Optional: Add human-like behavior (random mouse movements or scrolling)
     def add_human_behavior():
@@ -166,7 +243,7 @@ def setup_driver(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", h
 
     return driver
 
-def setup_driver_linkedin_singin(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", headless=False):
+def setup_driver_linkedin_singin(chromedriver_path=Config.CHROMEDRIVER_PATH, browser="chrome", headless=False, lean=Config.DRIVER_LEAN_PROFILE):
     """
     Sets up a WebDriver with LinkedIn Chrome profile for authentication.
     
@@ -174,6 +251,9 @@ def setup_driver_linkedin_singin(chromedriver_path=Config.CHROMEDRIVER_PATH, bro
         chromedriver_path (str, optional): Path to the WebDriver executable.
         browser (str, optional): Browser type ("chrome" or "firefox"). Defaults to "chrome".
         headless (bool, optional): Run in headless mode. Defaults to False.
+        lean (bool, optional): Block image, font and media requests. Defaults to Config.DRIVER_LEAN_PROFILE.
+                               Only the request blocking of `enable_lean_network_blocking` is used: the
+                               lean browser options would be saved into the persistent LinkedIn profile.
     
     Returns:
         WebDriver: Configured WebDriver instance.
@@ -221,6 +301,8 @@ def setup_driver_linkedin_singin(chromedriver_path=Config.CHROMEDRIVER_PATH, bro
 
     # Remove 'webdriver' property to avoid detection
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        enable_lean_network_blocking(driver)
 
     # Optional: Add human-like behavior
     def add_human_behavior():
@@ -284,7 +366,7 @@ def restart_tor(tor_process, tor_path=Config.TOR_EXECUTABLE):
     time.sleep(5)  # Wait for Tor to shut down
     return start_tor(tor_path)
 
-def setup_chrome_with_tor(chromedriver_path=Config.CHROMEDRIVER_PATH, headless=False):
+def setup_chrome_with_tor(chromedriver_path=Config.CHROMEDRIVER_PATH, headless=False, lean=Config.DRIVER_LEAN_PROFILE):
     """
     Setup Chrome WebDriver routed through Tor SOCKS5 proxy (127.0.0.1:9050).
     Assumes Tor is running locally on port 9050.
@@ -292,6 +374,7 @@ def setup_chrome_with_tor(chromedriver_path=Config.CHROMEDRIVER_PATH, headless=F
     Parameters:
         chromedriver_path (str, optional): Path to chromedriver executable.
         headless (bool, optional): Run in headless mode. Defaults to False.
+        lean (bool, optional): Block images, media and fonts and load pages eagerly. Defaults to Config.DRIVER_LEAN_PROFILE.
     
     Returns:
         WebDriver: Configured WebDriver instance.
@@ -315,6 +398,8 @@ def setup_chrome_with_tor(chromedriver_path=Config.CHROMEDRIVER_PATH, headless=F
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
+    if lean:
+        apply_lean_chrome_options(options)
 
     if chromedriver_path:
         service = Service(chromedriver_path)
@@ -324,6 +409,8 @@ def setup_chrome_with_tor(chromedriver_path=Config.CHROMEDRIVER_PATH, headless=F
 
     # Remove 'webdriver' property to avoid detection
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        enable_lean_network_blocking(driver)
 
     def add_human_behavior():
         try:
@@ -336,7 +423,7 @@ def setup_chrome_with_tor(chromedriver_path=Config.CHROMEDRIVER_PATH, headless=F
 
     return driver
 
-def setup_firefox_with_tor(geckodriver_path=Config.GECKODRIVER_PATH, headless=False):
+def setup_firefox_with_tor(geckodriver_path=Config.GECKODRIVER_PATH, headless=False, lean=Config.DRIVER_LEAN_PROFILE):
     """
     Setup Firefox WebDriver routed through Tor SOCKS5 proxy (127.0.0.1:9050).
     Assumes Tor is running locally on port 9050.
@@ -344,6 +431,7 @@ def setup_firefox_with_tor(geckodriver_path=Config.GECKODRIVER_PATH, headless=Fa
     Parameters:
         geckodriver_path (str, optional): Path to geckodriver executable.
         headless (bool, optional): Run in headless mode. Defaults to False.
+        lean (bool, optional): Block images, media and fonts and load pages eagerly. Defaults to Config.DRIVER_LEAN_PROFILE.
     
     Returns:
         WebDriver: Configured WebDriver instance.
@@ -360,6 +448,8 @@ def setup_firefox_with_tor(geckodriver_path=Config.GECKODRIVER_PATH, headless=Fa
 
     if headless:
         options.add_argument("--headless")
+    if lean:
+        apply_lean_firefox_options(options)
 
     if geckodriver_path:
         service = FirefoxService(geckodriver_path)
@@ -369,6 +459,8 @@ def setup_firefox_with_tor(geckodriver_path=Config.GECKODRIVER_PATH, headless=Fa
 
     # Remove 'webdriver' property to avoid detection
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        enable_lean_network_blocking(driver)
 
     def add_human_behavior():
         try:
@@ -0,0 +1,176 @@
+"""
+Condition-based waits for the scraping steps, built on WebDriverWait.
+
+The helpers return as soon as the page or element is ready instead of sleeping a fixed time.
+Every helper adds the time it spent waiting to a per-thread row timer, so a step can log how much
+of each row was spent waiting compared with working:
+
+    reset_wait_timer()
+    ... scrape one row with the helpers below ...
+    timing = read_wait_timer()  # {"wait_seconds": ..., "work_seconds": ...}
+"""
+import random
+import threading
+import time
+from contextlib import contextmanager
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+_timer = threading.local()
+
+def reset_wait_timer():
+    """
+    Starts timing a new row for the current thread.
+    """
+    _timer.started_at = time.perf_counter()
+    _timer.wait_seconds = 0.0
+
+def read_wait_timer():
+    """
+    Returns the time spent waiting and working since the last `reset_wait_timer` call in this thread.
+
+    Returns:
+        dict: {"wait_seconds": float, "work_seconds": float}
+    """
+    started_at = getattr(_timer, "started_at", None)
+    if started_at is None:
+        return {"wait_seconds": 0.0, "work_seconds": 0.0}
+    total = time.perf_counter() - started_at
+    waited = min(getattr(_timer, "wait_seconds", 0.0), total)
+    return {"wait_seconds": round(waited, 3), "work_seconds": round(total - waited, 3)}
+
+@contextmanager
+def timed_wait():
+    """
+    Context manager that counts the time spent in its block as waiting time.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timer.wait_seconds = getattr(_timer, "wait_seconds", 0.0) + time.perf_counter() - start
+
+def wait_for_document_ready(driver, timeout=10, ready_states=("interactive", "complete")):
+    """
+    Waits until the current page's document.readyState is in ready_states.
+
+    Parameters:
+        driver (WebDriver): Selenium WebDriver instance.
+        timeout (float): Maximum seconds to wait.
+        ready_states (tuple): Accepted readyState values. "interactive" means the DOM is parsed.
+
+    Returns:
+        bool: True if the document became ready, False on timeout.
+    """
+    with timed_wait():
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") in ready_states
+            )
+            return True
+        except Exception:
+            return False
+
+def wait_for_element(driver, locator, timeout=10, condition=EC.presence_of_element_located):
+    """
+    Waits for an element and returns it. Raises TimeoutException if it does not appear in time.
+
+    Parameters:
+        driver (WebDriver): Selenium WebDriver instance.
+        locator (tuple): (By.*, selector) of the element.
+        timeout (float): Maximum seconds to wait.
+        condition (callable): expected_conditions factory, e.g. EC.element_to_be_clickable.
+
+    Returns:
+        WebElement: The element.
+    """
+    with timed_wait():
+        return WebDriverWait(driver, timeout, poll_frequency=0.2).until(condition(locator))
+
+def wait_for_any(driver, conditions, timeout=10):
+    """
+    Waits until any of several expected conditions is met. Raises TimeoutException otherwise.
+
+    Parameters:
+        driver (WebDriver): Selenium WebDriver instance.
+        conditions (list): expected_conditions instances, e.g. [EC.presence_of_element_located(...), ...].
+        timeout (float): Maximum seconds to wait.
+
+    Returns:
+        The result of the first condition that was met.
+    """
+    with timed_wait():
+        return WebDriverWait(driver, timeout, poll_frequency=0.2).until(EC.any_of(*conditions))
+
+# Counts the resources the page has finished loading. A PerformanceObserver keeps counting after the
+# Resource Timing buffer is full (Chrome stops at 250 entries, which LinkedIn pages pass); the buffer is
+# enlarged as well for pages that read it themselves.
+_RESOURCE_COUNT_SCRIPT = """
+if (window.__resourceCount === undefined) {
+    window.__resourceCount = performance.getEntriesByType('resource').length;
+    try { performance.setResourceTimingBufferSize(10000); } catch (e) {}
+    try {
+        new PerformanceObserver(function (list) { window.__resourceCount += list.getEntries().length; })
+            .observe({type: 'resource'});
+    } catch (e) {}
+}
+return [document.readyState, window.__resourceCount];
+"""
+
+def wait_for_network_idle(driver, idle_time=0.5, timeout=10):
+    """
+    Waits until the page has stopped finishing new resources for idle_time seconds.
+    Uses the browser's Resource Timing entries, so it works on Chrome and Firefox without extra logging setup.
+
+    This is only a hint that the page has settled: a request still in flight has no entry yet, so a slow
+    response can arrive after "idle". Callers must still wait for the element they read afterwards.
+
+    Parameters:
+        driver (WebDriver): Selenium WebDriver instance.
+        idle_time (float): Seconds without new resources that count as idle.
+        timeout (float): Maximum seconds to wait.
+
+    Returns:
+        bool: True if the network became idle, False on timeout.
+    """
+    with timed_wait():
+        deadline = time.perf_counter() + timeout
+        last_count, last_change = -1, time.perf_counter()
+        while time.perf_counter() < deadline:
+            try:
+                ready_state, count = driver.execute_script(_RESOURCE_COUNT_SCRIPT)
+            except Exception:
+                return False
+            now = time.perf_counter()
+            if count != last_count:
+                last_count, last_change = count, now
+            elif ready_state == "complete" and now - last_change >= idle_time:
+                return True
+            time.sleep(0.1)
+        return False
+
+def element_with_text(locator):
+    """
+    Expected condition for `wait_for_element`: the first element matching locator that has non-empty
+    text, so a panel is not read while its content is still loading.
+
+    Parameters:
+        locator (tuple): (By.*, selector) of the element.
+
+    Returns:
+        callable: driver -> WebElement, or False while no matching element has text.
+    """
+    def condition(driver):
+        for element in driver.find_elements(*locator):
+            if element.text.strip():
+                return element
+        return False
+    return condition
+
+def human_pause(min_seconds=0.1, max_seconds=0.4):
+    """
+    Short random pause between form interactions so input timing does not look scripted.
+    Counted as waiting time.
+    """
+    with timed_wait():
+        time.sleep(random.uniform(min_seconds, max_seconds))
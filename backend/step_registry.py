@@ -0,0 +1,279 @@
+"""
+Declarative registry of the pipeline steps.
+
+Each step is a `StepDefinition`: its processing function (as module and function name), whether it runs
+synchronously in the request or as a background job, its input/output folders and file name prefix, and
+the request parameters it accepts with their defaults. The generic `/api/steps/<step>` handler validates a
+request against the definition, then calls the function or records and starts a job. Adding a step only
+takes a new entry in STEPS.
+
+The step modules pull in pandas, selenium, openai, tldextract, fake_useragent and psutil, which take
+most of the application's start-up time. `get_step_handler` imports a step's module the first time the
+step is used, so the web app can serve `/` without loading any of them.
+`backend/scripts/benchmarks/import_time_benchmark.py` checks that importing the app stays free of them.
+"""
+import importlib
+import logging
+import os
+import threading
+import time
+from backend.config import Config
+
+SYNC = "sync"
+ASYNC = "async"
+
+_resolved = {}
+_lock = threading.Lock()
+
+def load_attribute(module_name, attribute):
+    """
+    Imports a module on first use and returns one of its attributes.
+
+    Parameters:
+        module_name (str): Dotted module path.
+        attribute (str): Name of the function or constant in the module.
+
+    Returns:
+        object: The attribute.
+    """
+    key = (module_name, attribute)
+    if key not in _resolved:
+        with _lock:
+            if key not in _resolved:
+                start = time.perf_counter()
+                _resolved[key] = getattr(importlib.import_module(module_name), attribute)
+                logging.info(f"Loaded {module_name}.{attribute} in {time.perf_counter() - start:.2f}s")
+    return _resolved[key]
+
+class StepDefinition:
+    """
+    Declaration of one pipeline step.
+
+    Parameters:
+        number (int): Step number in the URL (/api/steps/<number>).
+        title (str): Short description used in response messages.
+        handler (tuple): (module, function) of the processing function.
+        mode (str): SYNC (runs in the request) or ASYNC (background job with progress tracking).
+        output_folder (str): Folder of the output file.
+        output_prefix (str): Prefix added to the input file name to name the output file.
+        input_folder (str, optional): Folder of the input file. Async steps get full input and output
+                                      paths as `input_csv`/`output_csv`; sync steps get the file names.
+        input_columns (tuple): Columns the input file must have (checked on upload and before a job starts).
+        processed_marker (tuple, optional): (column, is_processed) identifying the rows of a file this step
+                                            has processed; is_processed gets the column's raw CSV value.
+        params (dict, optional): Optional request fields and their defaults, passed as keyword arguments.
+        required (tuple): Request fields that must be present.
+        fixed (dict, optional): Keyword arguments always passed to the function (e.g. step_id).
+        validate (callable, optional): data -> error message or None, for checks beyond required fields.
+        prepare (callable, optional): (definition, data) -> (args, kwargs, output_path), replacing the
+                                      default call built from the input file name.
+        output_label (str): What the output is called in the completion message of sync steps.
+    """
+
+    def __init__(self, number, title, handler, mode, output_folder, output_prefix="", input_folder=None, input_columns=(),
+                 processed_marker=None, params=None, required=("input_csv",), fixed=None, validate=None, prepare=None, output_label="Output"):
+        self.number = number
+        self.title = title
+        self.handler = handler
+        self.mode = mode
+        self.output_folder = output_folder
+        self.output_prefix = output_prefix
+        self.input_folder = input_folder
+        self.input_columns = tuple(input_columns)
+        self.processed_marker = processed_marker
+        self.params = dict(params or {})
+        self.required = tuple(required)
+        self.fixed = dict(fixed or {})
+        self.validate = validate
+        self.prepare = prepare
+        self.output_label = output_label
+
+    @property
+    def step_id(self):
+        """Identifier used in job, progress and stop files (e.g. 'step7')."""
+        return f"step{self.number}"
+
+    def check_request(self, data):
+        """
+        Validates a request body against the definition.
+
+        Parameters:
+            data (dict or None): JSON body of the request.
+
+        Returns:
+            str or None: Error message, or None if the request is valid.
+        """
+        missing = [field for field in self.required if not data or field not in data]
+        if missing:
+            return f"Missing {' or '.join(missing)} for Step {self.number}"
+        return self.validate(data) if self.validate else None
+
+    def build_call(self, data):
+        """
+        Builds the arguments of the processing function from a validated request.
+
+        Parameters:
+            data (dict): JSON body of the request.
+
+        Returns:
+            tuple: (args, kwargs, output_path).
+        """
+        if self.prepare:
+            return self.prepare(self, data)
+        input_csv = data["input_csv"]
+        output_csv = f"{self.output_prefix}{input_csv}"
+        output_path = os.path.join(self.output_folder, output_csv)
+        kwargs = {name: data.get(name, default) for name, default in self.params.items()}
+        kwargs.update(self.fixed)
+        if self.mode == ASYNC:
+            kwargs.update(input_csv=os.path.join(self.input_folder, input_csv), output_csv=output_path)
+            return (), kwargs, output_path
+        return (input_csv, output_csv), kwargs, output_path
+
+def _prepare_step1(definition, data):
+    """Saves the pasted Sales Navigator HTML to a temp file and passes it to the parser."""
+    temp_file = os.path.join(Config.TEMP_PATH, "Sales_Navigator.txt")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.write(data["html_content"])
+    output_path = os.path.join(definition.output_folder, data["output_file"])
+    return (temp_file, data["output_file"], definition.output_folder), {}, output_path
+
+def _is_true(value):
+    """Processed flag columns are written as True/False."""
+    return value == "True"
+
+def _email_searched(value):
+    """Step 6 retries rows with an empty Status or a search_limit Status."""
+    return value not in ("", "search_limit")
+
+def _validate_verifier(data):
+    """Rejects unknown Step 7 verifier backends."""
+    verifier = data.get("verifier", Config.VERIFIER_BACKEND)
+    verifier_backends = load_attribute("backend.scripts.sales_navigator_scrape.verify_emails", "VERIFIER_BACKENDS")
+    if verifier not in verifier_backends:
+        return f"Unknown verifier '{verifier}'. Choose one of: {', '.join(verifier_backends)}"
+    return None
+
+STEPS = {definition.number: definition for definition in [
+    StepDefinition(
+        1, "Parse Sales Navigator", ("backend.scripts.sales_navigator_scrape.navigators_scrape_companyID", "parse_sales_navigator"),
+        SYNC, output_folder=Config.DATA_CSV_PATH, required=("html_content", "output_file"), prepare=_prepare_step1,
+    ),
+    StepDefinition(
+        2, "Remove Empty Company URLs", ("backend.scripts.sales_navigator_scrape.remove_empty_companyurl", "remove_empty_company_rows"),
+        SYNC, input_folder=Config.DATA_CSV_PATH, input_columns=("Company Id", "Company Url"),
+        output_folder=Config.FILTERED_URL_PATH, output_prefix="Filtered_", output_label="Filtered CSV",
+        params={"filters": None}, # Optional list of normalization filters
+    ),
+    StepDefinition(
+        3, "Correct Names", ("backend.scripts.openai.correctname_finder", "process_csv"),
+        SYNC, input_folder=Config.FILTERED_URL_PATH, input_columns=("Full Name",),
+        output_folder=Config.UPDATED_NAME_PATH, output_prefix="Updated_Name_", output_label="Updated CSV",
+    ),
+    # Step 4 (update company URLs, update_company_urls.py) is currently disabled.
+    StepDefinition(
+        5, "Extract Domain/About", ("backend.scripts.sales_navigator_scrape.extract_company_about_website", "process_csv_and_extract_info"),
+        ASYNC, input_folder=Config.UPDATED_NAME_PATH, input_columns=("Regular Company Url",),
+        output_folder=Config.DOMAIN_ABOUT_PATH, output_prefix="DomainAbout_",
+        processed_marker=("Processed_About_Website", _is_true),
+        params={
+            "max_rows": 2000,                   # Rows to process
+            "batch_size": 100,                  # Rows between checkpoints
+            "delete_no_website": False,         # Delete rows without a website
+            "offset": 0,                        # Row offset to start processing from
+            "windowed": False,                  # Load only the offset/max_rows window
+        },
+    ),
+    StepDefinition(
+        6, "Find Emails", ("backend.scripts.sales_navigator_scrape.email_finder", "process_csv_and_find_emails"),
+        ASYNC, input_folder=Config.DOMAIN_ABOUT_PATH, input_columns=("Full Name", "Website"),
+        output_folder=Config.EMAILS_PATH, output_prefix="Emails_",
+        processed_marker=("Status", _email_searched),
+        params={
+            "max_rows": 2000,
+            "batch_size": 50,
+            "tor_restart_interval": 30,         # Rows between Tor circuit restarts
+            "offset": 0,
+            "windowed": False,
+            "delete_no_email": False,
+        },
+    ),
+    StepDefinition(
+        7, "Verify Emails", ("backend.scripts.sales_navigator_scrape.verify_emails", "process_csv_and_verify_emails"),
+        ASYNC, input_folder=Config.EMAILS_PATH, input_columns=("Email",),
+        output_folder=Config.VERIFIED_EMAILS_PATH, output_prefix="Verified_",
+        processed_marker=("Email_Processed", _is_true),
+        params={
+            "max_rows": 2000,
+            "batch_size": 50,
+            "tor_restart_interval": 30,
+            "offset": 0,
+            "windowed": False,
+            "delete_invalid": False,            # Delete invalid emails
+            "verifier": Config.VERIFIER_BACKEND, # "browser", "api" or "smtp"
+            "concurrency": None,                # Checks in flight for the "api" and "smtp" verifiers
+        },
+        fixed={"step_id": "step7"}, validate=_validate_verifier,
+    ),
+    StepDefinition(
+        8, "Generate Icebreakers", ("backend.scripts.openai.icebreaker_generator", "process_csv_and_generate_icebreaker"),
+        ASYNC, input_folder=Config.VERIFIED_EMAILS_PATH, input_columns=("Summary", "About_Text"),
+        output_folder=Config.ICEBREAKERS_PATH, output_prefix="Icebreaker_",
+        processed_marker=("Processed_Icebreaker", _is_true),
+        params={
+            "max_rows": 2000,
+            "batch_size": 50,
+            "agent_prompt": "default_agent",
+            "delete_no_icebreaker": False,
+            "offset": 0,
+            "windowed": False,
+        },
+        fixed={"step_id": "step8"},
+    ),
+]}
+
+def async_steps():
+    """Returns the numbers of the steps that run as background jobs."""
+    return [number for number, definition in STEPS.items() if definition.mode == ASYNC]
+
+def input_columns_for_folder(folder_path):
+    """
+    Returns the columns a file in a folder needs for the steps that read from that folder.
+
+    Parameters:
+        folder_path (str): Data folder.
+
+    Returns:
+        list: Required columns (empty if no step reads from the folder).
+    """
+    folder_path = os.path.normcase(os.path.abspath(folder_path))
+    columns = []
+    for definition in STEPS.values():
+        if definition.input_folder and os.path.normcase(os.path.abspath(definition.input_folder)) == folder_path:
+            columns.extend(column for column in definition.input_columns if column not in columns)
+    return columns
+
+def processed_markers():
+    """
+    Returns the markers of the steps that flag processed rows, for counting them in a file.
+
+    Returns:
+        dict: Step ID (e.g. 'step7') -> (column, is_processed).
+    """
+    return {definition.step_id: definition.processed_marker for definition in STEPS.values() if definition.processed_marker}
+
+def get_step_handler(step):
+    """
+    Returns the processing function of a step, importing its module on first use.
+
+    Parameters:
+        step (int): Step number.
+
+    Returns:
+        callable: The step's processing function.
+
+    Raises:
+        KeyError: If the step is not registered.
+    """
+    module_name, function_name = STEPS[step].handler
+    return load_attribute(module_name, function_name)
@@ -0,0 +1,40 @@
+"""
+Production entry point of the web app.
+
+Unlike `python backend/app.py` (Flask's debug server with its reloader), the app is served by a
+production WSGI server, and steps 5-8 run in a separate job runner process (JOB_RUNNER_MODE=process):
+
+    python -m backend.job_runner                            # job runner, in its own terminal/service
+    gunicorn -c backend/gunicorn.conf.py backend.wsgi:app   # Linux/macOS
+    python -m backend.wsgi                                  # waitress (also on Windows)
+
+Settings: WSGI_BIND, WSGI_WORKERS, WSGI_THREADS in backend/config.py.
+"""
+import os
+import sys
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Production serving hands background steps to the job runner unless configured otherwise
+os.environ.setdefault("JOB_RUNNER_MODE", "process")
+
+from backend.app import app
+from backend.config import Config
+from config.logging import setup_logging
+
+def serve():
+    """
+    Serves the app with waitress on Config.WSGI_BIND, with Config.WSGI_THREADS threads.
+    """
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        print("waitress is not installed. Install it with 'pip install waitress' or run gunicorn -c backend/gunicorn.conf.py backend.wsgi:app")
+        return
+    setup_logging()
+    print(f"Serving on http://{Config.WSGI_BIND} (job runner mode: {Config.JOB_RUNNER_MODE})")
+    waitress_serve(app, listen=Config.WSGI_BIND, threads=Config.WSGI_THREADS)
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,171 @@
+# config/cache.py
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from backend.config import Config
+
+# Maximum number of keys per "IN (...)" query (SQLite's default variable limit is 999)
+_QUERY_CHUNK_SIZE = 500
+
+_local = threading.local()
+
+def get_cache_connection(db_path=None):
+    """
+    Returns this thread's connection to the cache database, opening it on first use.
+    The database runs in WAL mode so jobs in other threads can read while one writes.
+
+    Parameters:
+        db_path (str, optional): Path of the SQLite file. Defaults to Config.CACHE_DB_PATH.
+
+    Returns:
+        sqlite3.Connection: The connection.
+    """
+    db_path = db_path or Config.CACHE_DB_PATH
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    if db_path not in connections:
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(db_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connections[db_path] = connection
+    return connections[db_path]
+
+class ResultCache:
+    """
+    Persistent key -> JSON value cache with a time-to-live, stored in one SQLite table.
+
+    Entries older than their TTL are treated as missing, so they are fetched again and overwritten.
+    The TTL can depend on the entry's status, e.g. to re-check negative results sooner than positive ones.
+
+    Parameters:
+        name (str): Table name (letters, digits and underscores).
+        ttl_days (float or None): Default lifetime of an entry in days. None means entries never expire.
+        status_ttl_days (dict, optional): Lifetime in days per status, overriding ttl_days.
+        db_path (str, optional): Path of the SQLite file. Defaults to Config.CACHE_DB_PATH.
+    """
+
+    def __init__(self, name, ttl_days=None, status_ttl_days=None, db_path=None):
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+            raise ValueError(f"Invalid cache name '{name}'")
+        self.name = name
+        self.ttl_days = ttl_days
+        self.status_ttl_days = dict(status_ttl_days or {})
+        self.db_path = db_path
+        with self._connection() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, status TEXT, fetched_at REAL NOT NULL)"
+            )
+
+    def _connection(self):
+        """Returns this thread's connection to the cache database."""
+        return get_cache_connection(self.db_path)
+
+    def _is_fresh(self, status, fetched_at, now):
+        """Returns True if an entry with this status and fetch time is still within its TTL."""
+        ttl_days = self.status_ttl_days.get(status, self.ttl_days)
+        return ttl_days is None or now - fetched_at < ttl_days * 86400
+
+    def get(self, key):
+        """
+        Returns the cached value of a key.
+
+        Parameters:
+            key (str): Cache key.
+
+        Returns:
+            dict or None: The value (with "status" and "fetched_at" added), or None if missing or expired.
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """
+        Returns the cached values of several keys with as few queries as possible.
+
+        Parameters:
+            keys (iterable): Cache keys.
+
+        Returns:
+            dict: {key: value} for the keys that are cached and not expired.
+        """
+        keys = list(dict.fromkeys(key for key in keys if key))
+        now = time.time()
+        results = {}
+        connection = self._connection()
+        for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+            chunk = keys[start:start + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT key, value, status, fetched_at FROM {self.name} WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, value, status, fetched_at in rows:
+                if self._is_fresh(status, fetched_at, now):
+                    results[key] = dict(json.loads(value), status=status, fetched_at=fetched_at)
+        return results
+
+    def set(self, key, value, status=None, fetched_at=None):
+        """
+        Stores a value, replacing any previous entry for the key.
+
+        Parameters:
+            key (str): Cache key.
+            value (dict): JSON-serializable value.
+            status (str, optional): Status of the entry, used to pick the TTL.
+            fetched_at (float, optional): Unix time the value was fetched. Defaults to now.
+        """
+        self.set_many([(key, value, status)], fetched_at=fetched_at)
+
+    def set_many(self, entries, fetched_at=None):
+        """
+        Stores several values in one transaction.
+
+        Parameters:
+            entries (iterable): (key, value, status) tuples.
+            fetched_at (float, optional): Unix time the values were fetched. Defaults to now.
+
+        Returns:
+            int: Number of entries stored.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = [(key, json.dumps(value), status, fetched_at) for key, value, status in entries if key]
+        try:
+            with self._connection() as connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO {self.name} (key, value, status, fetched_at) VALUES (?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error as e:
+            logging.error(f"Failed to write {len(rows)} entries to cache '{self.name}': {e}")
+            return 0
+        return len(rows)
+
+    def delete(self, key):
+        """Removes a key from the cache."""
+        with self._connection() as connection:
+            connection.execute(f"DELETE FROM {self.name} WHERE key = ?", (key,))
+
+    def purge_expired(self):
+        """
+        Deletes all expired entries.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        now = time.time()
+        connection = self._connection()
+        expired = [
+            (key,) for key, status, fetched_at in connection.execute(f"SELECT key, status, fetched_at FROM {self.name}")
+            if not self._is_fresh(status, fetched_at, now)
+        ]
+        with connection:
+            connection.executemany(f"DELETE FROM {self.name} WHERE key = ?", expired)
+        return len(expired)
+
+    def count(self):
+        """Returns the number of entries (including expired ones) in the cache."""
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.name}").fetchone()[0]
@@ -0,0 +1,101 @@
+# config/compression.py
+"""
+gzip/brotli compression of API responses.
+
+`compress_response` compresses complete JSON, CSV and text responses for clients that accept it
+(registered as an after_request hook of the API blueprint); `compress_chunks` compresses streamed
+bodies such as CSV downloads chunk by chunk. Brotli is used when the optional `brotli` package is
+installed and the client prefers or accepts it, gzip otherwise.
+"""
+import zlib
+
+from backend.config import Config
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Response types worth compressing; SSE streams are excluded (they must flush every event)
+COMPRESSIBLE_MIMETYPES = ("application/json", "text/csv", "text/plain")
+
+def choose_encoding(accept_encodings):
+    """
+    Picks the content encoding for a request.
+
+    Parameters:
+        accept_encodings (werkzeug.datastructures.Accept): `request.accept_encodings`.
+
+    Returns:
+        str or None: "br", "gzip", or None to send the body uncompressed.
+    """
+    available = ["br", "gzip"] if brotli is not None else ["gzip"]
+    encoding = accept_encodings.best_match(available)
+    return encoding if encoding and accept_encodings[encoding] > 0 else None
+
+def compress_bytes(data, encoding):
+    """
+    Compresses a complete body.
+
+    Parameters:
+        data (bytes): Body.
+        encoding (str): "br" or "gzip".
+
+    Returns:
+        bytes: Compressed body.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=Config.COMPRESS_BROTLI_QUALITY)
+    compressor = zlib.compressobj(Config.COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31) # wbits 31: gzip container
+    return compressor.compress(data) + compressor.flush()
+
+def compress_chunks(chunks, encoding):
+    """
+    Compresses a streamed body chunk by chunk.
+
+    Parameters:
+        chunks (iterable): Chunks of the body (bytes).
+        encoding (str): "br" or "gzip".
+
+    Yields:
+        bytes: Compressed data.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=Config.COMPRESS_BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(Config.COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress, finish = compressor.compress, compressor.flush
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+def compress_response(response, accept_encodings):
+    """
+    Compresses a complete JSON, CSV or text response if the client accepts it and it is larger than
+    Config.COMPRESS_MIN_BYTES. A strong ETag becomes weak, since the bytes sent differ from the
+    uncompressed representation it was computed from.
+
+    Parameters:
+        response (flask.Response): Response of a view.
+        accept_encodings (werkzeug.datastructures.Accept): `request.accept_encodings`.
+
+    Returns:
+        flask.Response: The same response, compressed if applicable.
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or "Content-Encoding" in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(accept_encodings)
+    data = response.get_data()
+    if encoding is None or len(data) < Config.COMPRESS_MIN_BYTES:
+        return response
+    response.set_data(compress_bytes(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
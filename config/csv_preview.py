@@ -0,0 +1,145 @@
+# config/csv_preview.py
+"""
+Row previews of large CSV files without loading them.
+
+A sparse row-offset index (the byte offset of every Config.PREVIEW_INDEX_STRIDE-th data row) is built
+in one pass over the file and stored in its metadata file (see config/file_metadata.py), so it is only
+rebuilt after the file changed. A preview seeks to the indexed row before the requested one and parses
+at most PREVIEW_INDEX_STRIDE + limit rows, whatever the size of the file.
+"""
+import csv
+import io
+import itertools
+import os
+import re
+from backend.config import Config
+from config.file_metadata import read_metadata, write_metadata
+
+# Bytes read at once while building an index
+INDEX_CHUNK_SIZE = 1024 * 1024
+
+# Window checkpoints of windowed runs: "<output>.rows<start>-<end>.csv" (see config.utils.window_checkpoint_path)
+_WINDOW_CHECKPOINT = re.compile(r"\.rows(\d+)-(\d+)\.csv$")
+
+def build_row_index(f, stride):
+    """
+    Scans a CSV file and records the byte offset of every `stride`-th data row.
+    Newlines inside quoted fields do not start a row.
+
+    Parameters:
+        f (file): CSV file opened in binary mode, positioned at the start.
+        stride (int): Data rows between two indexed offsets.
+
+    Returns:
+        dict: stride, offsets (offsets[k] is where data row k * stride starts) and rows (data rows).
+    """
+    offsets = []
+    newlines = 0 # Newlines outside quotes so far; newline n ends the header (n=1) or data row n-2
+    position = 0
+    in_quotes = False
+    last_byte = b""
+    while True:
+        chunk = f.read(INDEX_CHUNK_SIZE)
+        if not chunk:
+            break
+        segment_start = position
+        for index, segment in enumerate(chunk.split(b'"')):
+            if index:
+                in_quotes = not in_quotes
+                segment_start += 1
+            if not in_quotes:
+                count = segment.count(b"\n")
+                # Newline n starts data row n - 1; the indexed rows are those with (n - 1) % stride == 0
+                target = newlines + 1 + (-newlines) % stride
+                seen, found = newlines, -1
+                while target <= newlines + count:
+                    while seen < target:
+                        found = segment.index(b"\n", found + 1)
+                        seen += 1
+                    offsets.append(segment_start + found + 1)
+                    target += stride
+                newlines += count
+            segment_start += len(segment)
+        position += len(chunk)
+        last_byte = chunk[-1:]
+    # A newline at the very end does not start a row
+    while offsets and offsets[-1] >= position:
+        offsets.pop()
+    records = newlines + (1 if last_byte not in (b"\n", b"") else 0)
+    return {"stride": stride, "offsets": offsets, "rows": max(records - 1, 0)}
+
+def _row_index(path, f, stride):
+    """Returns the cached row index of an open file, building and storing it if the file changed."""
+    stat = os.fstat(f.fileno())
+    metadata = read_metadata(path) or {}
+    index = metadata.get("row_index")
+    if index and index.get("stride") == stride and (metadata.get("size"), metadata.get("mtime")) == (stat.st_size, stat.st_mtime):
+        return index
+    f.seek(0)
+    index = build_row_index(f, stride)
+    current = os.stat(path)
+    # Only store it if `path` is still the file that was indexed (stage files are replaced, not rewritten)
+    if (current.st_size, current.st_mtime, current.st_ino) == (stat.st_size, stat.st_mtime, stat.st_ino):
+        write_metadata(path, dict(metadata, row_index=index))
+    return index
+
+def window_checkpoint_for(output_path, row):
+    """
+    Finds the checkpoint of a windowed run of an output file whose window contains a row.
+
+    Parameters:
+        output_path (str): Path of the stage's output CSV.
+        row (int): Absolute data row.
+
+    Returns:
+        tuple: (checkpoint path, first row of its window), or (None, None) if there is none.
+    """
+    folder, name = os.path.split(output_path)
+    base = os.path.splitext(name)[0]
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return None, None
+    for candidate in names:
+        match = _WINDOW_CHECKPOINT.search(candidate)
+        if match and candidate[:match.start()] == base and int(match.group(1)) <= row <= int(match.group(2)):
+            return os.path.join(folder, candidate), int(match.group(1))
+    return None, None
+
+def preview_csv(path, offset=0, limit=None, stop=None):
+    """
+    Returns a range of rows of a CSV file, seeking through its row-offset index.
+
+    Parameters:
+        path (str): Path of the CSV file.
+        offset (int): First data row (0-based). Negative values count from the end (-10: the last 10 rows).
+        limit (int, optional): Number of rows. Defaults to 50, capped at Config.PREVIEW_MAX_ROWS.
+        stop (int, optional): Return the `limit` rows before this row instead (used to tail the rows a
+                              running job has written up to its current row). Overrides `offset`.
+
+    Returns:
+        dict: file, columns, total_rows, offset (of the first returned row) and rows (lists of values
+              in the order of `columns`).
+    """
+    limit = min(limit or 50, Config.PREVIEW_MAX_ROWS)
+    stride = Config.PREVIEW_INDEX_STRIDE
+    with open(path, "rb") as f:
+        index = _row_index(path, f, stride)
+        total_rows = index["rows"]
+        if stop is not None:
+            start = max(min(stop, total_rows) - limit, 0)
+            limit = min(stop, total_rows) - start
+        else:
+            start = max(total_rows + offset, 0) if offset < 0 else min(offset, total_rows)
+
+        f.seek(0)
+        text = io.TextIOWrapper(f, encoding="utf-8-sig", errors="replace", newline="")
+        columns = next(csv.reader(text), [])
+        text.detach() # Keep the binary file open for the seek below
+        rows = []
+        if start < total_rows and limit > 0 and index["offsets"]:
+            f.seek(index["offsets"][start // stride])
+            reader = csv.reader(io.TextIOWrapper(f, encoding="utf-8", errors="replace", newline=""))
+            for row in itertools.islice(reader, start % stride, start % stride + limit):
+                rows.append(row + [""] * (len(columns) - len(row)))
+    return {"file": os.path.basename(path), "columns": columns, "total_rows": total_rows, "offset": start, "rows": rows}
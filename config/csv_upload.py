@@ -0,0 +1,219 @@
+# config/csv_upload.py
+"""
+Streaming CSV uploads.
+
+The request body is read in chunks of Config.UPLOAD_CHUNK_SIZE and written straight to a temporary file
+next to the destination, so a large upload is never held in memory or spooled by Werkzeug first. On the
+way, `CsvUploadWriter`:
+- validates the header row against the required columns as soon as it has arrived (and stops the
+  upload if columns are missing),
+- counts the data rows (newlines outside quoted fields),
+- computes the SHA-256 of the content.
+
+The finished file is moved into place atomically and its metadata (rows, columns, sha256, size, mtime)
+is stored next to it (see config/file_metadata.py), so steps and file listings don't have to parse it.
+"""
+import csv
+import hashlib
+import logging
+import os
+from werkzeug.sansio.multipart import MultipartDecoder, File, Data, Epilogue, NeedData
+from backend.config import Config
+from config.file_metadata import write_metadata
+
+# Largest accepted header row; a longer first "line" is not a CSV header
+MAX_HEADER_BYTES = 64 * 1024
+
+class CsvUploadWriter:
+    """
+    Writes an uploaded CSV to disk chunk by chunk while validating its header and counting its rows.
+
+    Parameters:
+        destination (str): Final path of the file.
+        required_columns (iterable): Columns the header must contain.
+    """
+
+    def __init__(self, destination, required_columns=()):
+        self.destination = destination
+        self.required_columns = list(required_columns)
+        self.temp_path = f"{destination}.part"
+        self.columns = None
+        self._file = open(self.temp_path, "wb")
+        self._hash = hashlib.sha256()
+        self._header = bytearray()
+        self._in_quotes = False
+        self._records = 0
+        self._last_byte = b""
+        self._size = 0
+
+    def write(self, data):
+        """
+        Appends a chunk of the upload.
+
+        Parameters:
+            data (bytes): Next chunk of the file.
+
+        Raises:
+            ValueError: If the header row is too long or misses required columns.
+        """
+        if not data:
+            return
+        if self.columns is None:
+            self._read_header(data)
+        self._count_records(data)
+        self._hash.update(data)
+        self._file.write(data)
+        self._size += len(data)
+        self._last_byte = data[-1:]
+
+    def _read_header(self, data):
+        """Collects the first record and validates it once complete."""
+        self._header.extend(data)
+        in_quotes = False
+        for position, byte in enumerate(self._header):
+            if byte == 0x22: # '"'
+                in_quotes = not in_quotes
+            elif byte == 0x0A and not in_quotes: # '\n' outside quotes ends the header
+                self._parse_header(bytes(self._header[:position]))
+                return
+        if len(self._header) > MAX_HEADER_BYTES:
+            raise ValueError(f"No header row found in the first {MAX_HEADER_BYTES} bytes")
+
+    def _parse_header(self, raw_header):
+        """Sets self.columns from the raw header row and checks the required columns."""
+        header_line = raw_header.decode("utf-8-sig", errors="replace").rstrip("\r")
+        self.columns = [column.strip() for column in next(csv.reader([header_line]), [])]
+        missing = [column for column in self.required_columns if column not in self.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    def _count_records(self, data):
+        """Counts newlines outside quoted fields. Escaped quotes ("") keep the quote parity, so no state beyond it is needed."""
+        segments = data.split(b'"')
+        for index, segment in enumerate(segments):
+            if index:
+                self._in_quotes = not self._in_quotes
+            if not self._in_quotes:
+                self._records += segment.count(b"\n")
+
+    def close(self):
+        """
+        Finishes the upload: moves the file into place and stores its metadata.
+
+        Returns:
+            dict: The stored metadata (file, rows, columns, sha256, size, mtime).
+
+        Raises:
+            ValueError: If the upload is empty or has no complete header row.
+        """
+        self._file.close()
+        if self.columns is None:
+            if not self._header:
+                self.abort()
+                raise ValueError("The uploaded file is empty")
+            self._parse_header(bytes(self._header))
+        records = self._records + (1 if self._last_byte not in (b"\n", b"") else 0)
+        os.replace(self.temp_path, self.destination)
+        metadata = {"rows": max(records - 1, 0), "columns": self.columns, "sha256": self._hash.hexdigest()}
+        return write_metadata(self.destination, metadata) or dict(metadata, file=os.path.basename(self.destination), size=self._size)
+
+    def abort(self):
+        """Discards the partial upload."""
+        self._file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+def _upload_destination(folder_path, filename):
+    """Returns the destination path of an uploaded file, rejecting names that are not plain CSV file names."""
+    name = os.path.basename((filename or "").replace("\\", "/"))
+    if not name:
+        raise ValueError("No file selected")
+    if not name.lower().endswith(".csv"):
+        raise ValueError("Only CSV files can be uploaded")
+    return os.path.join(folder_path, name)
+
+def _write_stream(writer, chunks):
+    """Feeds chunks to a writer, discarding the partial file on any error."""
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+        return writer.close()
+    except Exception:
+        writer.abort()
+        raise
+
+def _read_chunks(stream, chunk_size):
+    """Yields the body of a request stream in chunks."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def receive_csv_upload(stream, mimetype, mimetype_params, folder_path, filename=None, required_columns=(), chunk_size=None):
+    """
+    Streams an uploaded CSV to disk and returns its metadata.
+
+    Two request formats are accepted:
+    - multipart/form-data with the file in the 'file' field (the HTML form upload),
+    - the raw file as the request body, with its name passed as `filename`.
+
+    Parameters:
+        stream (file-like): Request body stream (e.g. `request.stream`).
+        mimetype (str): Content type of the request without parameters.
+        mimetype_params (dict): Content type parameters (the multipart boundary).
+        folder_path (str): Destination folder.
+        filename (str, optional): File name for raw body uploads.
+        required_columns (iterable): Columns the header row must contain.
+        chunk_size (int, optional): Bytes read at once. Defaults to Config.UPLOAD_CHUNK_SIZE.
+
+    Returns:
+        dict: Metadata of the stored file (file, rows, columns, sha256, size, mtime).
+
+    Raises:
+        ValueError: If the request has no file, the name is not a CSV name or the header is invalid.
+    """
+    chunk_size = chunk_size or Config.UPLOAD_CHUNK_SIZE
+    if mimetype != "multipart/form-data":
+        writer = CsvUploadWriter(_upload_destination(folder_path, filename), required_columns)
+        metadata = _write_stream(writer, _read_chunks(stream, chunk_size))
+    else:
+        boundary = mimetype_params.get("boundary")
+        if not boundary:
+            raise ValueError("Missing multipart boundary")
+        metadata = _receive_multipart(stream, boundary.encode(), folder_path, required_columns, chunk_size)
+    logging.info(f"Uploaded {metadata['file']}: {metadata['rows']} rows, {metadata['size']} bytes, sha256 {metadata['sha256']}")
+    return metadata
+
+def _receive_multipart(stream, boundary, folder_path, required_columns, chunk_size):
+    """Parses a multipart body incrementally and streams its 'file' part through a CsvUploadWriter."""
+    decoder = MultipartDecoder(boundary)
+    writer = None
+    metadata = None
+    in_file_part = False
+    try:
+        for chunk in _read_chunks(stream, chunk_size):
+            decoder.receive_data(chunk)
+            event = decoder.next_event()
+            while not isinstance(event, (NeedData, Epilogue)):
+                if isinstance(event, File):
+                    in_file_part = event.name == "file" and writer is None and metadata is None
+                    if in_file_part:
+                        writer = CsvUploadWriter(_upload_destination(folder_path, event.filename), required_columns)
+                elif isinstance(event, Data) and in_file_part:
+                    writer.write(event.data)
+                    if not event.more_data:
+                        metadata, writer, in_file_part = writer.close(), None, False
+                event = decoder.next_event()
+            if isinstance(event, Epilogue):
+                break
+    except Exception:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.abort()
+        raise ValueError("The upload ended before the file was complete")
+    if metadata is None:
+        raise ValueError("No file provided")
+    return metadata
@@ -0,0 +1,142 @@
+# config/file_metadata.py
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Suffix of the metadata file stored next to a data file ("Leads.csv" -> "Leads.csv.meta.json")
+METADATA_SUFFIX = ".meta.json"
+
+# Files whose stats are kept in memory, on top of the metadata files
+MAX_CACHED_STATS = 4096
+
+_stats_cache = OrderedDict()
+_stats_lock = threading.Lock()
+
+def metadata_path(path):
+    """
+    Returns the path of the metadata file of a data file.
+
+    Parameters:
+        path (str): Path of the data file.
+
+    Returns:
+        str: Path of its metadata file.
+    """
+    return f"{path}{METADATA_SUFFIX}"
+
+def write_metadata(path, metadata):
+    """
+    Stores metadata of a data file next to it, stamped with the file's current size and mtime
+    so that later changes to the file invalidate it.
+
+    Parameters:
+        path (str): Path of the data file.
+        metadata (dict): JSON-serializable metadata (rows, columns, sha256, ...).
+
+    Returns:
+        dict: The stored metadata, or None if it could not be written.
+    """
+    try:
+        stat = os.stat(path)
+        stored = dict(metadata, file=os.path.basename(path), size=stat.st_size, mtime=stat.st_mtime, written_at=time.time())
+        temp_path = f"{metadata_path(path)}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2)
+        os.replace(temp_path, metadata_path(path))
+        return stored
+    except OSError as e:
+        logging.error(f"Failed to write metadata of {path}: {e}")
+        return None
+
+def read_metadata(path):
+    """
+    Returns the stored metadata of a data file if it still matches the file.
+
+    Parameters:
+        path (str): Path of the data file.
+
+    Returns:
+        dict or None: The metadata, or None if there is none or the file changed since it was written.
+    """
+    try:
+        with open(metadata_path(path), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    if metadata.get("size") != stat.st_size or metadata.get("mtime") != stat.st_mtime:
+        return None
+    return metadata
+
+def scan_csv(path, markers=None):
+    """
+    Reads a CSV once and counts its rows and the rows each stage has processed.
+
+    Parameters:
+        path (str): Path of the CSV file.
+        markers (dict, optional): Stage name -> (column, is_processed) where is_processed(value) tells
+                                  whether a row's value in that column marks it as processed.
+
+    Returns:
+        dict: rows, columns and processed (stage -> processed rows, for the stages whose column exists).
+    """
+    with open(path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+        reader = csv.reader(f)
+        columns = [column.strip() for column in next(reader, [])]
+        stage_columns = {stage: (columns.index(column), is_processed)
+                         for stage, (column, is_processed) in (markers or {}).items() if column in columns}
+        processed = dict.fromkeys(stage_columns, 0)
+        rows = 0
+        for row in reader:
+            if not row:
+                continue
+            rows += 1
+            for stage, (index, is_processed) in stage_columns.items():
+                if index < len(row) and is_processed(row[index]):
+                    processed[stage] += 1
+    return {"rows": rows, "columns": columns, "processed": processed}
+
+def file_stats(path, markers=None, stat=None):
+    """
+    Returns the row count, columns, size, mtime and processed counts of a CSV file.
+
+    Stats are looked up in memory, then in the file's metadata file, and only computed with
+    `scan_csv` when the file changed (size or mtime) since they were stored.
+
+    Parameters:
+        path (str): Path of the CSV file.
+        markers (dict, optional): Stage markers passed to `scan_csv`.
+        stat (os.stat_result, optional): Result of os.stat(path) if already known.
+
+    Returns:
+        dict: The file's metadata (file, rows, columns, processed, size, mtime, ...).
+    """
+    stat = stat or os.stat(path)
+    key = os.path.abspath(path)
+    with _stats_lock:
+        cached = _stats_cache.get(key)
+        if cached and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime:
+            _stats_cache.move_to_end(key)
+            return cached
+
+    metadata = read_metadata(path)
+    if not metadata or "rows" not in metadata or "processed" not in metadata:
+        scanned = scan_csv(path, markers)
+        unchanged = os.stat(path)
+        metadata = dict(metadata or {}, **scanned)
+        if (unchanged.st_size, unchanged.st_mtime) == (stat.st_size, stat.st_mtime):
+            metadata = write_metadata(path, metadata) or metadata
+        metadata.setdefault("file", os.path.basename(path))
+        metadata.setdefault("size", stat.st_size)
+        metadata.setdefault("mtime", stat.st_mtime)
+
+    with _stats_lock:
+        _stats_cache[key] = metadata
+        _stats_cache.move_to_end(key)
+        while len(_stats_cache) > MAX_CACHED_STATS:
+            _stats_cache.popitem(last=False)
+    return metadata
@@ -0,0 +1,189 @@
+# config/job_events.py
+import os
+import re
+import json
+import uuid
+import logging
+import threading
+import time
+from backend.config import Config
+
+class JobEventBus:
+    """
+    In-process publish/subscribe of job state for the `/api/events` stream.
+
+    The bus keeps the latest state of every job together with a sequence number. Publishing
+    merges the new fields into that state and bumps the sequence; subscribers wait on a
+    condition variable until the sequence passes the last one they have seen and then receive
+    every job that changed since. Slow subscribers therefore never build up a backlog: they get
+    one up-to-date state per job, and a reconnecting client can resume from its last sequence
+    number (the SSE `Last-Event-ID`).
+
+    The same states back the `/api/status` snapshot.
+
+    With several processes (production mode), `attach_store` shares the events through a
+    `JobStore`: every publish is also written to the store, and a background thread replays the
+    events of the other processes into this bus.
+    """
+
+    def __init__(self, max_jobs=None):
+        self.max_jobs = max_jobs or Config.SSE_MAX_TRACKED_JOBS
+        self.instance_id = uuid.uuid4().hex[:12]
+        self.store = None
+        self._condition = threading.Condition()
+        self._sequence = 0
+        self._states = {} # (step_id, job_id) -> (sequence, state)
+
+    @property
+    def sequence(self):
+        """Sequence number of the latest event (0 before the first one)."""
+        return self._sequence
+
+    def publish(self, step_id, job_id, fields, share=True):
+        """
+        Merges fields into a job's state and wakes up all subscribers.
+
+        Parameters:
+            step_id (str): Step identifier (e.g. 'step7').
+            job_id (str): UUID of the job.
+            fields (dict): State fields (status, current_row, total_rows, progress, ...).
+            share (bool): Also write the event to the attached job store (False for replayed events).
+
+        Returns:
+            int: Sequence number of the event.
+        """
+        if share and self.store is not None:
+            self.store.append_event(self.instance_id, step_id, job_id, fields)
+        key = (step_id, job_id)
+        with self._condition:
+            self._sequence += 1
+            state = dict(self._states.get(key, (0, {}))[1])
+            state.update(fields, step_id=step_id, job_id=job_id)
+            step_number = re.fullmatch(r"step(\d+)", str(step_id))
+            if step_number:
+                state["step"] = int(step_number.group(1))
+            self._states[key] = (self._sequence, state)
+            if len(self._states) > self.max_jobs:
+                # Forget the least recently updated job, keeping running jobs while possible
+                oldest_key = min(self._states, key=lambda k: (self._states[k][1].get("status") == "running", self._states[k][0]))
+                del self._states[oldest_key]
+            self._condition.notify_all()
+            return self._sequence
+
+    def changes_since(self, sequence):
+        """
+        Returns the jobs whose state changed after a sequence number.
+
+        Parameters:
+            sequence (int): Last sequence number seen by the caller (0 for a full snapshot).
+
+        Returns:
+            tuple: (current sequence, list of (sequence, state) sorted by sequence).
+        """
+        with self._condition:
+            changed = sorted((entry for entry in self._states.values() if entry[0] > sequence), key=lambda entry: entry[0])
+            return self._sequence, [(seq, dict(state)) for seq, state in changed]
+
+    def snapshot(self, recent_per_step=None):
+        """
+        Returns the latest state of all running jobs and of the most recent other jobs of each step.
+
+        Parameters:
+            recent_per_step (int, optional): Finished jobs kept per step, newest first. Defaults to all.
+
+        Returns:
+            tuple: (current sequence, list of states ordered by step, then newest first).
+        """
+        with self._condition:
+            entries = sorted(self._states.values(), key=lambda entry: (entry[1].get("step", 0), -entry[0]))
+            sequence = self._sequence
+        jobs = []
+        finished_per_step = {}
+        for _, state in entries:
+            if state.get("status") != "running":
+                step = state.get("step_id")
+                finished_per_step[step] = finished_per_step.get(step, 0) + 1
+                if recent_per_step is not None and finished_per_step[step] > recent_per_step:
+                    continue
+            jobs.append(dict(state))
+        return sequence, jobs
+
+    def wait_for_changes(self, sequence, timeout=None):
+        """
+        Blocks until a job changes after `sequence` or the timeout expires.
+
+        Parameters:
+            sequence (int): Last sequence number seen by the caller.
+            timeout (float, optional): Seconds to wait.
+
+        Returns:
+            tuple: (current sequence, list of (sequence, state)); the list is empty on timeout.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._sequence > sequence, timeout=timeout)
+        return self.changes_since(sequence)
+
+    def attach_store(self, store, poll_interval=None):
+        """
+        Shares this bus with the other processes using the same job store, and starts the
+        background thread that replays their events into it.
+
+        Parameters:
+            store (JobStore): Store shared by the web workers and the job runner.
+            poll_interval (float, optional): Seconds between reads of the store. Defaults to Config.JOB_EVENT_POLL_SECONDS.
+        """
+        if self.store is not None:
+            return
+        self.store = store
+        poll_interval = poll_interval or Config.JOB_EVENT_POLL_SECONDS
+        threading.Thread(target=self._replay_store_events, args=(store.last_event_sequence(), poll_interval), daemon=True).start()
+        logging.info(f"Job event bus {self.instance_id} attached to job store {store.db_path}")
+
+    def _replay_store_events(self, store_sequence, poll_interval):
+        """Publishes the events other processes write to the store (runs in a daemon thread)."""
+        while True:
+            try:
+                events = self.store.events_since(store_sequence)
+                for store_sequence, origin, step_id, job_id, fields in events:
+                    if origin != self.instance_id:
+                        self.publish(step_id, job_id, fields, share=False)
+                if events:
+                    continue
+            except Exception as e:
+                logging.error(f"Failed to read job events from the job store: {e}")
+            time.sleep(poll_interval)
+
+job_events = JobEventBus()
+
+def load_recorded_jobs(bus=None, steps=(5, 6, 7, 8)):
+    """
+    Publishes the jobs recorded in the jobs_stepX.json and progress files, so that the event
+    stream and `/api/status` also know the jobs of earlier server runs.
+
+    Parameters:
+        bus (JobEventBus, optional): Bus to fill. Defaults to `job_events`.
+        steps (iterable): Step numbers to load.
+
+    Returns:
+        int: Number of jobs loaded.
+    """
+    from config.job_functions import format_progress_message, read_jobs
+
+    bus = bus or job_events
+    loaded = 0
+    for step in steps:
+        try:
+            jobs = read_jobs(f"step{step}")
+            for job in jobs[-bus.max_jobs:]:
+                state = dict(job)
+                progress_file = os.path.join(Config.TEMP_PATH, f"progress_step{step}_{job['job_id']}.json")
+                if os.path.exists(progress_file):
+                    with open(progress_file, "r") as f:
+                        state.update(json.load(f))
+                    state["status"] = job.get("status", state.get("status"))
+                state["progress"] = format_progress_message(state)
+                bus.publish(f"step{step}", job["job_id"], state)
+                loaded += 1
+        except Exception as e:
+            logging.error(f"Failed to load recorded jobs of step {step}: {e}")
+    return loaded
@@ -1,17 +1,108 @@
 import os
+import gzip
 import json
 import logging
+from contextlib import contextmanager
+from filelock import FileLock
 from backend.config import Config
+from config.job_events import job_events
 
-def write_progress(current_row, total_rows, job_id, step_id, stop_call=False):
+def jobs_file_path(step_id):
     """
-    Write processing progress to a JSON file for a specific step and job.
+    Returns the path of the job records file of a step.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g. 'step7').
+
+    Returns:
+        str: Path of jobs_stepX.json.
+    """
+    return os.path.join(Config.TEMP_PATH, f"jobs_{step_id}.json")
+
+def _jobs_file_lock(step_id):
+    """
+    Returns the lock of a step's jobs file (jobs_stepX.json.lock). It is an OS file lock, so it
+    serializes the web workers, the job runner and the threads of each process alike.
+    """
+    return FileLock(f"{jobs_file_path(step_id)}.lock", timeout=Config.JOBS_LOCK_TIMEOUT)
+
+def _load_jobs(jobs_file):
+    """Reads a jobs file; a missing file has no jobs. Must be called with the step's lock held."""
+    if not os.path.exists(jobs_file):
+        return []
+    with open(jobs_file, "r") as f:
+        return json.load(f)
+
+def read_jobs(step_id):
+    """
+    Reads the job records of a step.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g. 'step7').
+
+    Returns:
+        list: Job records, oldest first. Empty if the step has none or the file cannot be read.
+    """
+    jobs_file = jobs_file_path(step_id)
+    try:
+        with _jobs_file_lock(step_id):
+            return _load_jobs(jobs_file)
+    except Exception as e:
+        logging.error(f"Failed to read {jobs_file}: {e}")
+        return []
+
+@contextmanager
+def edit_jobs(step_id):
+    """
+    Context manager for a read-modify-write of a step's job records. It holds the step's file lock,
+    yields the records as a list to change in place and writes them back when the block ends without
+    an error. The file is written to a temporary file and renamed over the old one, so readers never
+    see a partly written file.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g. 'step7').
+
+    Yields:
+        list: Job records, oldest first.
+    """
+    jobs_file = jobs_file_path(step_id)
+    os.makedirs(Config.TEMP_PATH, exist_ok=True)
+    with _jobs_file_lock(step_id):
+        jobs = _load_jobs(jobs_file)
+        yield jobs
+        temp_path = f"{jobs_file}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(jobs, f, indent=2)
+        os.replace(temp_path, jobs_file)
+
+def format_progress_message(progress):
+    """
+    Returns the human-readable progress text shown in the UI for a progress record.
+
+    Parameters:
+        progress (dict): Progress record as written by `write_progress`.
+
+    Returns:
+        str: e.g. "Processing row 12/200 (company 3/40)" while running, otherwise the capitalized status.
+    """
+    if progress.get("status") != "running":
+        return progress.get("status", "N/A").capitalize()
+    message = f"Processing row {progress.get('current_row', 0)}/{progress.get('total_rows', 0)}"
+    if "total_companies" in progress:
+        message += f" (company {progress.get('current_company', 0)}/{progress['total_companies']})"
+    return message
+
+def write_progress(current_row, total_rows, job_id, step_id, stop_call=False, **extra):
+    """
+    Write processing progress to a JSON file for a specific step and job, and publish it
+    to the job event stream (`/api/events`).
 
     Args:
         current_row (int): Current row being processed (1-based index).
         total_rows (int): Total number of rows to process.
         job_id (str): Unique identifier for the job (e.g., UUID).
         step_id (str): Identifier for the processing step (e.g., 'step4', 'step5').
+        **extra: Additional progress counters stored in the file (e.g. current_company, total_companies).
 
     Returns:
         None
@@ -19,15 +110,18 @@ def write_progress(current_row, total_rows, job_id, step_id, stop_call=False):
     progress_file = os.path.join(Config.TEMP_PATH, f"progress_{step_id}_{job_id}.json")
     status = 'stopped' if stop_call else ("running" if current_row < total_rows else "completed")           
     
+    progress = {
+        "job_id": job_id,
+        "current_row": current_row,
+        "total_rows": total_rows,
+        "status": status,
+        **extra
+    }
     try:
         with open(progress_file, "w") as f:
-            json.dump({
-                "job_id": job_id,
-                "current_row": current_row,
-                "total_rows": total_rows,
-                "status": status
-            }, f, indent=2)
+            json.dump(progress, f, indent=2)
         update_job_status(step_id, job_id, status)
+        job_events.publish(step_id, job_id, dict(progress, progress=format_progress_message(progress)))
         logging.info(f"Progress updated for job {job_id} ({step_id}): row {current_row}/{total_rows}, status: {status}")
     except Exception as e:
         logging.error(f"Failed to write progress for job {job_id} ({step_id}): {e}")
@@ -41,23 +135,92 @@ def update_job_status(step, job_id, status):
         job_id (str): UUID of the job.
         status (str): New status ('running', 'completed', or 'stopped').
     """
-    jobs_file = os.path.join(Config.TEMP_PATH, f"jobs_{step}.json")
     try:
-        os.makedirs(Config.TEMP_PATH, exist_ok=True)
-        if os.path.exists(jobs_file):
-            with open(jobs_file, "r") as f:
-                jobs = json.load(f)
-        else:
-            jobs = []
-        for job in jobs:
-            if job["job_id"] == job_id:
-                job["status"] = status
-                break
-        with open(jobs_file, "w") as f:
-            json.dump(jobs, f, indent=2)
+        with edit_jobs(step) as jobs:
+            for job in jobs:
+                if job["job_id"] == job_id:
+                    job["status"] = status
+                    break
     except Exception as e:
         print(f"Error updating job status for step {step}, job {job_id}: {e}")
 
+def create_job(step_id, job_id, **fields):
+    """
+    Records a new running job in the jobs_stepX.json file, removes a stop signal left over from
+    an earlier job of the step and publishes the job on the job event stream.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g. 'step7').
+        job_id (str): UUID of the job.
+        **fields: Additional fields of the job record (e.g. input_csv, output_csv).
+
+    Returns:
+        dict: The job record.
+    """
+    stop_file = os.path.join(Config.TEMP_PATH, f"stop_{step_id}.txt")
+    if os.path.exists(stop_file):
+        os.remove(stop_file)
+
+    record = {"job_id": job_id, **fields, "status": "running"}
+    with edit_jobs(step_id) as jobs:
+        jobs.append(record)
+        jobs[:] = _archive_old_jobs(step_id, jobs)
+    job_events.publish(step_id, job_id, dict(record, progress="Starting"))
+    return record
+
+def job_archive_path(step_id):
+    """
+    Returns the path of the archive of old job records of a step.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g. 'step7').
+
+    Returns:
+        str: Path of the gzipped JSON-lines archive (jobs_stepX.archive.jsonl.gz).
+    """
+    return os.path.join(Config.TEMP_PATH, f"jobs_{step_id}.archive.jsonl.gz")
+
+def _archive_old_jobs(step_id, jobs, keep=None):
+    """
+    Moves the oldest finished jobs beyond the newest `keep` records to the step's archive, with their
+    final progress, and deletes their progress files. Running jobs are never archived.
+    Must be called inside `edit_jobs` of the step.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g. 'step7').
+        jobs (list): Job records of the step, oldest first.
+        keep (int, optional): Records kept in jobs_stepX.json. Defaults to Config.JOBS_RETAINED.
+
+    Returns:
+        list: The job records to keep.
+    """
+    keep = Config.JOBS_RETAINED if keep is None else keep
+    excess = len(jobs) - keep
+    if keep <= 0 or excess <= 0:
+        return jobs
+    archived = []
+    kept = []
+    for job in jobs:
+        if len(archived) < excess and job.get("status") != "running":
+            archived.append(job)
+        else:
+            kept.append(job)
+    try:
+        # Appending to a gzip file adds a new member; gzip.open reads all members in order
+        with gzip.open(job_archive_path(step_id), "at", encoding="utf-8") as f:
+            for job in archived:
+                progress = read_progress(step_id, job["job_id"])
+                f.write(json.dumps(dict(job, final_progress=progress) if progress else job) + "\n")
+    except OSError as e:
+        logging.error(f"Failed to archive old jobs of {step_id}: {e}")
+        return jobs
+    for job in archived:
+        progress_file = os.path.join(Config.TEMP_PATH, f"progress_{step_id}_{job['job_id']}.json")
+        if os.path.exists(progress_file):
+            os.remove(progress_file)
+    logging.info(f"Archived {len(archived)} old jobs of {step_id} to {job_archive_path(step_id)}")
+    return kept
+
 def check_stop_signal(step_id):
     """
     Check if a stop signal file exists for the specified step.
@@ -69,4 +232,64 @@ def check_stop_signal(step_id):
         bool: True if stop signal file exists, False otherwise.
     """
     stop_file = os.path.join(Config.TEMP_PATH, f"stop_{step_id}.txt")
-    return os.path.exists(stop_file)
\ No newline at end of file
+    return os.path.exists(stop_file)
+
+def record_job_metrics(step_id, job_id, **metrics):
+    """
+    Stores metrics for a job in the "metrics" entry of its record in the jobs_stepX.json file.
+    Existing metrics of the job are kept and updated with the new values.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g., 'step5').
+        job_id (str): UUID of the job. Nothing is recorded if it is None.
+        **metrics: Metric names and JSON-serializable values (e.g., memory_mb=12.5).
+    """
+    if not job_id:
+        return
+    if not os.path.exists(jobs_file_path(step_id)):
+        return
+    try:
+        with edit_jobs(step_id) as jobs:
+            for job in jobs:
+                if job["job_id"] == job_id:
+                    job.setdefault("metrics", {}).update(metrics)
+                    job_events.publish(step_id, job_id, {"metrics": job["metrics"]})
+                    break
+        logging.info(f"Recorded metrics for job {job_id} ({step_id}): {metrics}")
+    except Exception as e:
+        logging.error(f"Failed to record metrics for job {job_id} ({step_id}): {e}")
+
+def find_job(job_id, steps):
+    """
+    Finds the record of a job in the jobs_stepX.json files.
+
+    Parameters:
+        job_id (str): UUID of the job.
+        steps (iterable): Step numbers to search (e.g. async_steps()).
+
+    Returns:
+        tuple: (step number, job record), or (None, None) if no step has the job.
+    """
+    for step in steps:
+        for job in read_jobs(f"step{step}"):
+            if job.get("job_id") == job_id:
+                return step, job
+    return None, None
+
+def read_progress(step_id, job_id):
+    """
+    Reads the progress file of a job.
+
+    Parameters:
+        step_id (str): Identifier for the processing step (e.g., 'step7').
+        job_id (str): UUID of the job.
+
+    Returns:
+        dict or None: The progress record as written by `write_progress`, or None if there is none.
+    """
+    progress_file = os.path.join(Config.TEMP_PATH, f"progress_{step_id}_{job_id}.json")
+    try:
+        with open(progress_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
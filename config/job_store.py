@@ -0,0 +1,183 @@
+# config/job_store.py
+import json
+import logging
+import sqlite3
+import time
+from backend.config import Config
+from config.cache import get_cache_connection
+
+class JobStore:
+    """
+    SQLite store shared by the web workers and the job runner in production mode (JOB_RUNNER_MODE=process).
+
+    It holds two tables:
+    - "job_queue": step jobs submitted by the web workers, claimed and executed by `backend/job_runner.py`.
+    - "job_events": the job state updates published in any process, so that every web worker can
+      replay them into its own `job_events` bus (see `JobEventBus.attach_store`).
+
+    Parameters:
+        db_path (str, optional): Path of the SQLite file. Defaults to Config.JOB_DB_PATH.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or Config.JOB_DB_PATH
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_queue ("
+                "job_id TEXT PRIMARY KEY, step INTEGER NOT NULL, params TEXT NOT NULL, status TEXT NOT NULL, "
+                "queued_at REAL NOT NULL, claimed_by TEXT, claimed_at REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_events ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, origin TEXT NOT NULL, step_id TEXT NOT NULL, "
+                "job_id TEXT NOT NULL, fields TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _connection(self):
+        """Returns this thread's connection to the job database."""
+        return get_cache_connection(self.db_path)
+
+    def enqueue(self, step, job_id, params):
+        """
+        Queues a step job for the job runner.
+
+        Parameters:
+            step (int): Step number (5, 6, 7 or 8).
+            job_id (str): UUID of the job.
+            params (dict): JSON-serializable keyword arguments of the step's processing function.
+        """
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT INTO job_queue (job_id, step, params, status, queued_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, step, json.dumps(params), time.time()),
+            )
+
+    def claim_next(self, worker_id):
+        """
+        Atomically claims the oldest queued job.
+
+        Parameters:
+            worker_id (str): Name of the claiming job runner.
+
+        Returns:
+            tuple or None: (step, job_id, params), or None if the queue is empty.
+        """
+        connection = self._connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT job_id, step, params FROM job_queue WHERE status = 'queued' ORDER BY queued_at LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE job_queue SET status = 'claimed', claimed_by = ?, claimed_at = ? WHERE job_id = ?",
+                    (worker_id, time.time(), row[0]),
+                )
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.rollback()
+            logging.error(f"Failed to claim a job from the job queue: {e}")
+            return None
+        if row is None:
+            return None
+        job_id, step, params = row
+        return step, job_id, json.loads(params)
+
+    def finish(self, job_id, status):
+        """
+        Records the final status of a claimed job.
+
+        Parameters:
+            job_id (str): UUID of the job.
+            status (str): 'finished' or 'failed' (the step's own progress records completed or stopped).
+        """
+        with self._connection() as connection:
+            connection.execute("UPDATE job_queue SET status = ? WHERE job_id = ?", (status, job_id))
+
+    def requeue_claimed(self, worker_id):
+        """
+        Puts the jobs a runner had claimed back in the queue, e.g. after the runner was restarted.
+        The steps resume from their checkpoints, so the jobs continue where they stopped.
+
+        Parameters:
+            worker_id (str): Name of the job runner.
+
+        Returns:
+            int: Number of jobs requeued.
+        """
+        with self._connection() as connection:
+            return connection.execute(
+                "UPDATE job_queue SET status = 'queued', claimed_by = NULL, claimed_at = NULL "
+                "WHERE status = 'claimed' AND claimed_by = ?", (worker_id,)
+            ).rowcount
+
+    def append_event(self, origin, step_id, job_id, fields):
+        """
+        Stores a job state update for the other processes.
+
+        Parameters:
+            origin (str): Instance id of the publishing bus (its own events are skipped when replaying).
+            step_id (str): Step identifier (e.g. 'step7').
+            job_id (str): UUID of the job.
+            fields (dict): State fields of the update.
+
+        Returns:
+            int or None: Sequence number of the stored event, or None if it could not be stored.
+        """
+        try:
+            with self._connection() as connection:
+                return connection.execute(
+                    "INSERT INTO job_events (origin, step_id, job_id, fields, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (origin, step_id, job_id, json.dumps(fields, default=str), time.time()),
+                ).lastrowid
+        except sqlite3.Error as e:
+            logging.error(f"Failed to store event of job {job_id} ({step_id}): {e}")
+            return None
+
+    def events_since(self, sequence, limit=500):
+        """
+        Returns the stored job state updates after a sequence number.
+
+        Parameters:
+            sequence (int): Last sequence number already read.
+            limit (int): Maximum number of events returned.
+
+        Returns:
+            list: (sequence, origin, step_id, job_id, fields) tuples in order.
+        """
+        rows = self._connection().execute(
+            "SELECT seq, origin, step_id, job_id, fields FROM job_events WHERE seq > ? ORDER BY seq LIMIT ?",
+            (sequence, limit),
+        ).fetchall()
+        return [(seq, origin, step_id, job_id, json.loads(fields)) for seq, origin, step_id, job_id, fields in rows]
+
+    def last_event_sequence(self):
+        """Returns the sequence number of the newest stored event (0 if there is none)."""
+        return self._connection().execute("SELECT COALESCE(MAX(seq), 0) FROM job_events").fetchone()[0]
+
+    def purge_events(self, max_age_seconds=86400):
+        """
+        Deletes stored events older than max_age_seconds.
+
+        Returns:
+            int: Number of events deleted.
+        """
+        with self._connection() as connection:
+            return connection.execute(
+                "DELETE FROM job_events WHERE created_at < ?", (time.time() - max_age_seconds,)
+            ).rowcount
+
+_job_store = None
+
+def get_job_store():
+    """
+    Returns the job store of this process, opening it on first use.
+
+    Returns:
+        JobStore: The store at Config.JOB_DB_PATH.
+    """
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStore()
+    return _job_store
@@ -0,0 +1,78 @@
+# config/log_reader.py
+"""
+Reads the last lines of log files without loading them.
+
+Plain logs are read backwards from the end in blocks, so the cost of a tail depends on how far back
+the requested lines are, not on the size of the log. Rolled-over logs (".gz", see config/logging.py)
+cannot be read backwards and are streamed forwards, keeping only the last matching lines.
+"""
+import gzip
+import os
+from collections import deque
+from backend.config import Config
+
+# Bytes read at once when reading a log backwards
+BLOCK_SIZE = 64 * 1024
+
+def _reverse_lines(f, end, state):
+    """
+    Yields the lines of a binary file from `end` backwards (without line endings).
+    state["position"] is the offset of the first byte not read yet, 0 once the whole file was read.
+    """
+    position = end
+    remainder = b""
+    while position > 0:
+        size = min(BLOCK_SIZE, position)
+        position -= size
+        f.seek(position)
+        lines = (f.read(size) + remainder).split(b"\n")
+        remainder = lines[0]
+        state["position"] = position + len(remainder)
+        for line in reversed(lines[1:]):
+            yield line
+    state["position"] = 0
+    yield remainder
+
+def _matches(line, grep, job_id):
+    return (not grep or grep in line) and (not job_id or job_id in line)
+
+def read_log_tail(path, tail=100, grep=None, job_id=None, max_scan_bytes=None):
+    """
+    Returns the last lines of a log file, optionally only those containing a text and/or a job ID.
+
+    Parameters:
+        path (str): Path of a log file (plain or gzipped).
+        tail (int): Number of lines to return.
+        grep (str, optional): Only lines containing this text (case-sensitive).
+        job_id (str, optional): Only lines mentioning this job ID.
+        max_scan_bytes (int, optional): Bytes of a plain log searched backwards at most.
+                                        Defaults to Config.LOG_TAIL_MAX_SCAN_BYTES.
+
+    Returns:
+        dict: file, lines (oldest first), size, scanned_bytes and complete (False if the search
+              stopped at max_scan_bytes before finding `tail` lines).
+    """
+    max_scan_bytes = max_scan_bytes or Config.LOG_TAIL_MAX_SCAN_BYTES
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as f:
+            lines = deque((line.rstrip("\r\n") for line in f if _matches(line, grep, job_id)), maxlen=tail)
+        size = os.path.getsize(path)
+        return {"file": os.path.basename(path), "lines": list(lines), "size": size, "scanned_bytes": size, "complete": True}
+
+    grep = grep.encode("utf-8") if grep else None
+    job_id = job_id.encode("utf-8") if job_id else None
+    lines = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        state = {"position": size}
+        for line in _reverse_lines(f, size, state):
+            line = line.rstrip(b"\r")
+            if line and _matches(line, grep, job_id):
+                lines.append(line.decode("utf-8", errors="replace"))
+                if len(lines) >= tail:
+                    break
+            if size - state["position"] >= max_scan_bytes:
+                break
+    lines.reverse()
+    complete = len(lines) >= tail or state["position"] == 0
+    return {"file": os.path.basename(path), "lines": lines, "size": size, "scanned_bytes": size - state["position"], "complete": complete}
@@ -1,41 +1,112 @@
 # Set up logging
 from datetime import datetime
+import gzip
 import logging
+import logging.handlers
 import os
+import shutil
+import time
 from backend.config import Config
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(filename)s - %(message)s'
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Log file handler that rolls the file over when it reaches Config.LOG_MAX_BYTES or is older than
+    Config.LOG_ROTATE_SECONDS, and gzips the rolled-over files ("<log>.1.gz", "<log>.2.gz", ...).
+    At most Config.LOG_BACKUP_COUNT compressed files are kept per log.
+
+    Parameters:
+        filename (str): Path of the log file.
+        max_bytes (int, optional): Size that triggers a rollover (0 = no size limit). Defaults to Config.LOG_MAX_BYTES.
+        rotate_seconds (float, optional): Age that triggers a rollover (0 = no age limit). Defaults to Config.LOG_ROTATE_SECONDS.
+        backup_count (int, optional): Compressed files kept. Defaults to Config.LOG_BACKUP_COUNT.
+    """
+
+    def __init__(self, filename, max_bytes=None, rotate_seconds=None, backup_count=None):
+        super().__init__(
+            filename,
+            maxBytes=Config.LOG_MAX_BYTES if max_bytes is None else max_bytes,
+            backupCount=Config.LOG_BACKUP_COUNT if backup_count is None else backup_count,
+            encoding="utf-8",
+        )
+        self.rotate_seconds = Config.LOG_ROTATE_SECONDS if rotate_seconds is None else rotate_seconds
+        self.opened_at = time.time()
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source, dest):
+        """Gzips a rolled-over log file and removes the original."""
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+    def shouldRollover(self, record):
+        if self.rotate_seconds and time.time() - self.opened_at >= self.rotate_seconds:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.opened_at = time.time()
+
+def prune_logs(log_dir=Config.LOG_PATH, retention_days=None):
+    """
+    Deletes log files (current or rolled over) not modified for more than `retention_days`.
+
+    Parameters:
+        log_dir (str): Log directory.
+        retention_days (float, optional): Defaults to Config.LOG_RETENTION_DAYS (0 keeps everything).
+
+    Returns:
+        int: Number of deleted files.
+    """
+    retention_days = Config.LOG_RETENTION_DAYS if retention_days is None else retention_days
+    if not retention_days or not os.path.isdir(log_dir):
+        return 0
+    cutoff = time.time() - retention_days * 86400
+    deleted = 0
+    for name in os.listdir(log_dir):
+        path = os.path.join(log_dir, name)
+        if ".log" in name and os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError as e:
+                logging.error(f"Failed to delete old log {path}: {e}")
+    return deleted
 
 def setup_logging(log_dir=Config.LOG_PATH, log_prefix=Config.LOG_PREFIX):
     """
     Sets up logging with a timestamped log file in the specified directory.
     Includes the source file name in log messages for better traceability.
     Creates the directory if it doesn't exist and falls back to the current directory if there's an error.
-    
+    The file is rotated by size and age and compressed (see CompressingRotatingFileHandler), and logs
+    older than Config.LOG_RETENTION_DAYS are deleted. The process ID is part of the file name, so
+    processes started together (gunicorn workers, the job runner) never rotate each other's file.
+
     Parameters:
         log_dir (str): Directory to save the log file.
         log_prefix (str): Prefix for the log file name.
-    
+
     Returns:
         None
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"{log_prefix}_{timestamp}.log")
-    
+    log_file = os.path.join(log_dir, f"{log_prefix}_{timestamp}_{os.getpid()}.log")
+    level = getattr(logging, Config.LOG_LEVEL, logging.INFO)
+
     try:
         os.makedirs(log_dir, exist_ok=True)
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(filename)s - %(message)s'
-        )
+        logging.basicConfig(handlers=[CompressingRotatingFileHandler(log_file)], level=level, format=LOG_FORMAT)
         logging.info(f"Logging initialized to {log_file}")
+        deleted = prune_logs(log_dir)
+        if deleted:
+            logging.info(f"Deleted {deleted} log files older than {Config.LOG_RETENTION_DAYS} days")
     except (OSError, PermissionError) as e:
-        fallback_log_file = f"{log_prefix}_{timestamp}.log"
-        logging.basicConfig(
-            filename=fallback_log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(filename)s - %(message)s'
-        )
+        fallback_log_file = f"{log_prefix}_{timestamp}_{os.getpid()}.log"
+        logging.basicConfig(handlers=[CompressingRotatingFileHandler(fallback_log_file)], level=level, format=LOG_FORMAT)
         logging.error(f"Failed to save log to {log_file}: {e}")
         logging.info(f"Fallback logging initialized to {fallback_log_file}")
-        print(f"Error: Could not save log to {log_file}. Using {fallback_log_file} instead.")
\ No newline at end of file
+        print(f"Error: Could not save log to {log_file}. Using {fallback_log_file} instead.")
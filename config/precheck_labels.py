@@ -0,0 +1,17 @@
+# config/precheck_labels.py
+"""
+Labels of the 'PreCheck' column written by the Step 7 pre-check
+(backend/scripts/sales_navigator_scrape/email_precheck.py).
+
+They live in `config` because the stage loader (config/utils.py) needs the full list to load the
+column as a categorical, and `config` does not import the step scripts.
+"""
+
+PRECHECK_OK = "ok"
+PRECHECK_INVALID_SYNTAX = "invalid_syntax"
+PRECHECK_ROLE = "role"
+PRECHECK_DISPOSABLE = "disposable"
+PRECHECK_DUPLICATE = "duplicate"
+
+# Every value written to 'PreCheck' ("" before the pre-check ran)
+PRECHECK_LABELS = ["", PRECHECK_OK, PRECHECK_INVALID_SYNTAX, PRECHECK_ROLE, PRECHECK_DISPOSABLE, PRECHECK_DUPLICATE]
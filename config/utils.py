@@ -2,38 +2,439 @@
 import pandas as pd
 import os
 import logging
+from backend.config import Config
+from config.precheck_labels import PRECHECK_LABELS
 
-def load_csv(input_csv, output_csv, required_columns=None):
+# File extension used for each supported intermediate stage format.
+# "csv" is the export format; "parquet" (zstd) and "arrow" (IPC, memory-mapped reads) are faster to parse.
+STAGE_FILE_EXTENSIONS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+# Column holding the absolute row number in window checkpoints.
+WINDOW_ROW_COLUMN = "__row__"
+
+# Low-cardinality columns loaded as categoricals. Only columns whose written values are all listed here
+# belong in it: assigning a value missing from the categories raises a TypeError in the middle of a job.
+# The status columns ('Status', 'Email Status') also take cached and imported values, so they stay strings.
+CATEGORY_COLUMNS = {
+    "PreCheck": PRECHECK_LABELS, # Only written by email_precheck, with these labels
+    "Connection Degree": [],
+    "Industry": [],
+    "Is Premium": [],
+}
+
+# "Processed_*" flags loaded as real booleans
+BOOLEAN_COLUMNS = ["Processed_Name", "Processed_About_Website", "Email_Processed", "Processed_Icebreaker"]
+
+def _require_pyarrow(file_format):
+    """
+    Imports pyarrow, raising a clear error if it is missing for a columnar stage format.
+
+    Parameters:
+    -----------
+    file_format (str): The stage format that needs pyarrow.
+
+    Returns:
+    --------
+    module: The pyarrow module.
+    """
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError as e:
+        raise ImportError(f"pyarrow is required for the '{file_format}' stage file format. Install it or set STAGE_FILE_FORMAT=csv.") from e
+
+def stage_file_path(path, file_format):
+    """
+    Returns the path of a stage file in the given format, next to the given CSV path.
+    e.g. ('out/DomainAbout_x.csv', 'parquet') -> 'out/DomainAbout_x.parquet'
+
+    Parameters:
+    -----------
+    path (str): Path to the CSV (or any stage) file.
+    file_format (str): One of STAGE_FILE_EXTENSIONS.
+
+    Returns:
+    --------
+    str: Path with the extension for file_format.
+    """
+    if file_format not in STAGE_FILE_EXTENSIONS:
+        raise ValueError(f"Unknown stage file format '{file_format}'. Use one of: {', '.join(STAGE_FILE_EXTENSIONS)}")
+    base, _ = os.path.splitext(path)
+    return base + STAGE_FILE_EXTENSIONS[file_format]
+
+def resolve_stage_file(path, file_format=None):
+    """
+    Finds the most recently written version of a stage file (CSV, Parquet or Arrow) for the given path.
+    On equal modification times the configured stage format wins.
+
+    Parameters:
+    -----------
+    path (str): Path to the CSV file.
+    file_format (str, optional): Preferred stage format. Defaults to Config.STAGE_FILE_FORMAT.
+
+    Returns:
+    --------
+    str or None: Path of the newest existing version, or None if no version exists.
+    """
+    file_format = file_format or Config.STAGE_FILE_FORMAT
+    candidates = []
+    for fmt in STAGE_FILE_EXTENSIONS:
+        candidate = stage_file_path(path, fmt)
+        if os.path.exists(candidate):
+            candidates.append((os.path.getmtime(candidate), fmt == file_format, candidate))
+    if not candidates:
+        return None
+    return max(candidates)[2]
+
+def read_table(path):
+    """
+    Reads a stage file into a DataFrame, choosing the reader from the file extension.
+    CSV files are read with all columns as strings, Arrow IPC files are memory-mapped.
+
+    Parameters:
+    -----------
+    path (str): Path to a .csv, .parquet or .arrow file.
+
+    Returns:
+    --------
+    pd.DataFrame: The loaded data.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == STAGE_FILE_EXTENSIONS["parquet"]:
+        _require_pyarrow("parquet")
+        return pd.read_parquet(path, engine="pyarrow")
+    if extension == STAGE_FILE_EXTENSIONS["arrow"]:
+        pa = _require_pyarrow("arrow")
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas()
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+def apply_schema(df):
+    """
+    Converts a DataFrame loaded with all-string columns to a compact in-memory schema:
+    categoricals for CATEGORY_COLUMNS, booleans for BOOLEAN_COLUMNS and pyarrow-backed
+    strings for the remaining text columns (plain object strings if pyarrow is missing).
+    Missing values become "" like in CSVs read by `read_table`.
+
+    Parameters:
+    -----------
+    df (pd.DataFrame): Data to convert in place.
+
+    Returns:
+    --------
+    pd.DataFrame: The converted DataFrame.
+    """
+    for col, known_values in CATEGORY_COLUMNS.items():
+        if col in df.columns:
+            values = df[col].astype(object).fillna("").astype(str)
+            categories = known_values + [value for value in values.unique() if value not in known_values]
+            df[col] = pd.Categorical(values, categories=categories)
+
+    for col in BOOLEAN_COLUMNS:
+        if col in df.columns and df[col].dtype != bool:
+            df[col] = df[col].map({'True': True, 'False': False, True: True, False: False}).eq(True)
+
+    try:
+        import pyarrow  # noqa: F401
+        text_dtype = "string[pyarrow]"
+    except ImportError:
+        text_dtype = None
+    if text_dtype:
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].fillna("").astype(str).astype(text_dtype)
+    return df
+
+def dataframe_memory_mb(df):
+    """
+    Returns the in-memory size of a DataFrame in MB, including the contents of string columns.
+    """
+    return round(df.memory_usage(deep=True).sum() / 1_048_576, 2)
+
+def window_checkpoint_path(output_csv, offset, max_rows):
+    """
+    Returns the CSV path used for progress checkpoints of a windowed run.
+    e.g. ('out/Icebreaker_x.csv', 90000, 2000) -> 'out/Icebreaker_x.rows90000-92000.csv'
+
+    Parameters:
+    -----------
+    output_csv (str): Path of the stage's output CSV.
+    offset (int): First row of the window.
+    max_rows (int): Number of rows in the window.
+
+    Returns:
+    --------
+    str: Path of the window checkpoint CSV.
+    """
+    base, extension = os.path.splitext(output_csv)
+    return f"{base}.rows{offset}-{offset + max_rows}{extension or '.csv'}"
+
+def read_window(path, offset, max_rows, columns=None):
+    """
+    Reads only rows [offset, offset + max_rows) of a stage file, optionally limited to some columns.
+    The returned DataFrame keeps the absolute row numbers of the file as its index.
+
+    Parameters:
+    -----------
+    path (str): Path to a .csv, .parquet or .arrow file.
+    offset (int): First row to read.
+    max_rows (int): Maximum number of rows to read.
+    columns (list, optional): Columns to read. Columns missing from the file are ignored.
+
+    Returns:
+    --------
+    pd.DataFrame: The rows of the window.
+    """
+    wanted = set(columns) if columns else None
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == STAGE_FILE_EXTENSIONS["parquet"]:
+        _require_pyarrow("parquet")
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        read_columns = [name for name in parquet_file.schema_arrow.names if wanted is None or name in wanted]
+        # Only read the row groups that overlap the window
+        tables, first_row, group_start = [], None, 0
+        for group in range(parquet_file.num_row_groups):
+            group_rows = parquet_file.metadata.row_group(group).num_rows
+            if group_start + group_rows > offset and group_start < offset + max_rows:
+                tables.append(parquet_file.read_row_group(group, columns=read_columns))
+                first_row = group_start if first_row is None else first_row
+            group_start += group_rows
+        if not tables:
+            return pd.DataFrame(columns=read_columns)
+        pa = _require_pyarrow("parquet")
+        table = pa.concat_tables(tables).slice(offset - first_row, max_rows)
+    elif extension == STAGE_FILE_EXTENSIONS["arrow"]:
+        pa = _require_pyarrow("arrow")
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        table = table.slice(offset, max_rows)
+        if wanted is not None:
+            table = table.select([name for name in table.column_names if name in wanted])
+    else:
+        df = pd.read_csv(
+            path,
+            dtype=str,
+            keep_default_na=False,
+            skiprows=range(1, offset + 1),
+            nrows=max_rows,
+            usecols=(lambda name: name in wanted) if wanted is not None else None,
+        )
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        return df
+
+    df = table.to_pandas()
+    df.index = pd.RangeIndex(offset, offset + len(df))
+    return df
+
+def _merge_window_rows(chunk, df, start, end, columns):
+    """
+    Replaces the rows of `chunk` that fall inside the window [start, end) with the rows of `df`.
+    Window rows missing from `df` (deleted by the stage) are dropped.
+    """
+    in_window = (chunk.index >= start) & (chunk.index < end)
+    chunk = chunk.reindex(columns=columns, fill_value="")
+    if not in_window.any():
+        return chunk
+    updated_rows = df.index.intersection(chunk.index)
+    chunk = chunk.loc[~in_window | chunk.index.isin(updated_rows)].astype(object)
+    chunk.loc[updated_rows, df.columns] = df.loc[updated_rows, df.columns].astype(object)
+    return chunk
+
+def merge_window(df, output_csv, window, chunksize=10_000):
+    """
+    Writes the rows of a windowed run back into the full stage output.
+    The full file is streamed in chunks, so only one chunk plus the window is held in memory.
+    Columnar sources (Parquet/Arrow) are loaded in full, which is cheap for those formats.
+
+    Parameters:
+    -----------
+    df (pd.DataFrame): The window rows, indexed by their absolute row number.
+    output_csv (str): Path of the stage's output CSV.
+    window (dict): The window description set by `load_csv` in `df.attrs["window"]`.
+    chunksize (int): Number of rows streamed per chunk for CSV sources.
+
+    Returns:
+    --------
+    str: Path of the written output CSV.
+    """
+    start, end, source = window["offset"], window["offset"] + window["max_rows"], window["source"]
+
+    if os.path.splitext(source)[1].lower() != STAGE_FILE_EXTENSIONS["csv"] or Config.STAGE_FILE_FORMAT != "csv":
+        full_df = read_table(source)
+        columns = list(full_df.columns) + [col for col in df.columns if col not in full_df.columns]
+        export_csv(_merge_window_rows(full_df, df, start, end, columns), output_csv)
+        return output_csv
+
+    temp_path = f"{output_csv}.tmp"
+    columns = None
+    for chunk in pd.read_csv(source, dtype=str, keep_default_na=False, chunksize=chunksize):
+        first_chunk = columns is None
+        if first_chunk:
+            columns = list(chunk.columns) + [col for col in df.columns if col not in chunk.columns]
+        merged = _merge_window_rows(chunk, df, start, end, columns)
+        merged.to_csv(temp_path, mode="w" if first_chunk else "a", header=first_chunk, index=False)
+    if columns is None:
+        # Empty source file: the window is the whole output
+        df.to_csv(temp_path, index=False)
+    os.replace(temp_path, output_csv)
+    logging.info(f"Merged rows {start}-{end} into {output_csv}")
+    return output_csv
+
+def _to_arrow_table(df, pa):
+    """
+    Converts a DataFrame to a pyarrow Table, casting mixed-type object columns to strings if needed.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        object_columns = df.select_dtypes(include="object").columns
+        return pa.Table.from_pandas(df.astype({col: str for col in object_columns}), preserve_index=False)
+
+def save_stage_file(df, output_csv, file_format=None, window=None):
+    """
+    Saves a checkpoint of a stage's DataFrame in the configured stage format.
+    The file is written to a temporary path first and then moved into place,
+    so a crash mid-write never leaves a truncated checkpoint behind.
+    For windowed runs only the window rows are saved, to a separate window checkpoint CSV.
+
+    Parameters:
+    -----------
+    df (pd.DataFrame): Data to save.
+    output_csv (str): Path of the stage's output CSV; the extension is swapped for non-CSV formats.
+    file_format (str, optional): "csv", "parquet" or "arrow". Defaults to Config.STAGE_FILE_FORMAT.
+    window (dict, optional): The window description from `df.attrs["window"]` for windowed runs.
+
+    Returns:
+    --------
+    str: Path of the written file.
+    """
+    if window:
+        path = window_checkpoint_path(output_csv, window["offset"], window["max_rows"])
+        df.rename_axis(WINDOW_ROW_COLUMN).reset_index().to_csv(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+        return path
+
+    file_format = file_format or Config.STAGE_FILE_FORMAT
+    path = stage_file_path(output_csv, file_format)
+    temp_path = f"{path}.tmp"
+
+    if file_format == "parquet":
+        pa = _require_pyarrow(file_format)
+        import pyarrow.parquet as pq
+        pq.write_table(_to_arrow_table(df, pa), temp_path, compression="zstd")
+    elif file_format == "arrow":
+        pa = _require_pyarrow(file_format)
+        table = _to_arrow_table(df, pa)
+        with pa.OSFile(temp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        df.to_csv(temp_path, index=False)
+
+    os.replace(temp_path, path)
+    return path
+
+def export_csv(df, output_csv, window=None):
+    """
+    Writes the final CSV export of a stage. CSV stays the format shown in the UI and used between steps.
+    When a columnar stage format is configured, a matching checkpoint is written after the CSV
+    so the next stage can load the faster format.
+    For windowed runs the window rows are merged back into the full output and the window checkpoint is removed.
+
+    Parameters:
+    -----------
+    df (pd.DataFrame): Data to export.
+    output_csv (str): Path of the output CSV file.
+    window (dict, optional): The window description from `df.attrs["window"]` for windowed runs.
+
+    Returns:
+    --------
+    str: Path of the exported CSV.
+    """
+    if window:
+        merge_window(df, output_csv, window)
+        checkpoint = window_checkpoint_path(output_csv, window["offset"], window["max_rows"])
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        return output_csv
+
+    save_stage_file(df, output_csv, file_format="csv")
+    if Config.STAGE_FILE_FORMAT != "csv":
+        save_stage_file(df, output_csv)
+    logging.info(f"Exported CSV to {output_csv}")
+    return output_csv
+
+def load_csv(input_csv, output_csv, required_columns=None, offset=0, max_rows=None, columns=None, compact=True):
     """
     Loads a CSV file for processing, using the output CSV as input if it exists.
     Ensures the output directory exists and validates required columns.
+    Parquet/Arrow checkpoints written by `save_stage_file` are picked up automatically
+    when they are newer than the matching CSV.
+
+    When `max_rows` is given, only rows [offset, offset + max_rows) (and only `columns`, if given)
+    are read. The DataFrame keeps absolute row numbers as its index and carries the window
+    description in `df.attrs["window"]`; pass it as `window=` to `save_stage_file`/`export_csv`
+    so progress goes to a small window checkpoint and the final export is merged back into the full file.
 
     Parameters:
     -----------
     input_csv (str): Path to the input CSV file.
     output_csv (str): Path to save the updated CSV file.
     required_columns (list, optional): List of column names that must exist in the CSV.
+    offset (int, optional): First row of the window. Only used when max_rows is given.
+    max_rows (int, optional): Number of rows to load. If None, the whole file is loaded.
+    columns (list, optional): Columns to load in windowed mode. Defaults to all columns.
+    compact (bool, optional): If True, applies `apply_schema` to shrink the in-memory footprint.
 
     Returns:
     --------
     tuple: (pd.DataFrame, str) - The loaded DataFrame and the resolved input CSV path,
            or (None, None) if an error occurs.
     """
+    resolved_input_csv = input_csv
     try:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_csv), exist_ok=True)
 
         # Check if output file exists and use it as input if available
-        if os.path.exists(output_csv):
-            logging.info(f"Output file '{output_csv}' exists, using it as input")
-            resolved_input_csv = output_csv
+        resolved_output = resolve_stage_file(output_csv)
+        if resolved_output:
+            logging.info(f"Output file '{resolved_output}' exists, using it as input")
+            resolved_input_csv = resolved_output
         else:
             logging.info(f"No output file found, using input file '{input_csv}'")
-            resolved_input_csv = input_csv
+            resolved_input_csv = resolve_stage_file(input_csv) or input_csv
 
-        # Read the CSV file
-        logging.info(f"Reading CSV: {resolved_input_csv}")
-        df = pd.read_csv(resolved_input_csv, dtype=str, keep_default_na=False)
+        if max_rows is None:
+            # Read the file
+            logging.info(f"Reading CSV: {resolved_input_csv}")
+            df = read_table(resolved_input_csv)
+        else:
+            if offset < 0:
+                raise ValueError("Offset cannot be negative")
+            if columns and required_columns:
+                columns = list(columns) + [col for col in required_columns if col not in columns]
+            window = {"offset": offset, "max_rows": max_rows, "source": resolved_input_csv}
+            checkpoint = window_checkpoint_path(output_csv, offset, max_rows)
+            if os.path.exists(checkpoint) and os.path.getmtime(checkpoint) >= os.path.getmtime(resolved_input_csv):
+                # Resume an interrupted windowed run
+                logging.info(f"Window checkpoint '{checkpoint}' exists, using it as input")
+                df = pd.read_csv(checkpoint, dtype=str, keep_default_na=False)
+                df = df.set_index(df[WINDOW_ROW_COLUMN].astype(int).rename(None)).drop(columns=WINDOW_ROW_COLUMN)
+            else:
+                logging.info(f"Reading rows {offset}-{offset + max_rows} of {resolved_input_csv}")
+                df = read_window(resolved_input_csv, offset, max_rows, columns)
+            df.attrs["window"] = window
+
+        if compact:
+            df = apply_schema(df)
+        logging.info(f"Loaded {len(df)} rows, {dataframe_memory_mb(df)} MB in memory")
 
         # Validate required columns if provided
         if required_columns:
@@ -50,4 +451,4 @@ def load_csv(input_csv, output_csv, required_columns=None):
     except Exception as e:
         logging.error(f"Error loading CSV: {e}")
         print(f"Error loading CSV: {e}")
-        return None, None
\ No newline at end of file
+        return None, None
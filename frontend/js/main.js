@@ -1,4 +1,46 @@
 document.addEventListener("DOMContentLoaded", () => {
+    // Job progress: one event stream for all steps instead of a polling interval per step
+    const jobWatchers = {}; // step -> { jobId, handler }
+    const latestJobStates = {}; // "step:jobId" -> last state received
+    const jobEvents = new EventSource("/api/events");
+
+    jobEvents.addEventListener("job", (event) => {
+        try {
+            const state = JSON.parse(event.data);
+            latestJobStates[`${state.step}:${state.job_id}`] = state;
+            const watcher = jobWatchers[state.step];
+            if (watcher && watcher.jobId === state.job_id) {
+                watcher.handler(state);
+            }
+        } catch (error) {
+            console.error("Error handling job event:", error);
+        }
+    });
+
+    // Calls handler with every state change of a job until unwatchJob(step) is called
+    function watchJob(step, jobId, handler) {
+        jobWatchers[step] = { jobId, handler };
+        const known = latestJobStates[`${step}:${jobId}`];
+        if (known) {
+            handler(known);
+            return;
+        }
+        // Job not seen on the stream yet (e.g. finished before the page was loaded)
+        fetch(`/api/progress/${step}?job_id=${jobId}`)
+            .then((response) => response.json())
+            .then((result) => {
+                const watcher = jobWatchers[step];
+                if (!result.error && watcher && watcher.jobId === jobId && !latestJobStates[`${step}:${jobId}`]) {
+                    watcher.handler(result);
+                }
+            })
+            .catch((error) => console.error(`Error fetching progress for step ${step}:`, error));
+    }
+
+    function unwatchJob(step) {
+        delete jobWatchers[step];
+    }
+
     // Show Step 1 content by default
     document.getElementById("step1-content").classList.remove("hidden");
     checkStepAvailability();
@@ -65,7 +107,7 @@ document.addEventListener("DOMContentLoaded", () => {
         document.getElementById("step6-content").classList.add("hidden");
         document.getElementById("step7-content").classList.add("hidden");
         document.getElementById("step8-content").classList.add("hidden");
-        populateCsvDropdown("input_csv5", "updated_name");
+        populateCsvDropdown("input_csv5", "updated_name", 5);
         populateJobDropdown("job_select_step5", 5);
         checkRunningJobs(); // Check running jobs when navigating to Step 5
     });
@@ -80,7 +122,7 @@ document.addEventListener("DOMContentLoaded", () => {
         document.getElementById("step6-content").classList.remove("hidden");
         document.getElementById("step7-content").classList.add("hidden");
         document.getElementById("step8-content").classList.add("hidden");
-        populateCsvDropdown("input_csv6", "domain_about");
+        populateCsvDropdown("input_csv6", "domain_about", 6);
         populateJobDropdown("job_select_step6", 6);
         checkRunningJobs(); // Check running jobs when navigating to Step 6
     });
@@ -95,7 +137,7 @@ document.addEventListener("DOMContentLoaded", () => {
         document.getElementById("step6-content").classList.add("hidden");
         document.getElementById("step7-content").classList.remove("hidden");
         document.getElementById("step8-content").classList.add("hidden");
-        populateCsvDropdown("input_csv7", "emails");
+        populateCsvDropdown("input_csv7", "emails", 7);
         populateJobDropdown("job_select_step7", 7);
         checkRunningJobs();
     });
@@ -110,7 +152,7 @@ document.addEventListener("DOMContentLoaded", () => {
         document.getElementById("step6-content").classList.add("hidden");
         document.getElementById("step7-content").classList.add("hidden");
         document.getElementById("step8-content").classList.remove("hidden");
-        populateCsvDropdown("input_csv8", "verified");
+        populateCsvDropdown("input_csv8", "verified", 8);
         populateJobDropdown("job_select_step8", 8);
         checkRunningJobs();
     });
@@ -313,7 +355,6 @@ document.addEventListener("DOMContentLoaded", () => {
     //     }
     // });
 
-    let progressInterval5 = null;
     document.getElementById("run_step5").addEventListener("click", async () => {
         const inputCsv = document.getElementById("input_csv5").value;
         const maxRows = parseInt(document.getElementById("max_rows_step5").value);
@@ -369,43 +410,32 @@ document.addEventListener("DOMContentLoaded", () => {
             if (response.ok) {
                 statusDiv.textContent = result.message;
                 const jobId = result.job_id;
-                // Start polling for the new job
-                if (progressInterval5) {
-                    clearInterval(progressInterval5);
-                }
-                progressInterval5 = setInterval(async () => {
-                    try {
-                        const response = await fetch(`/api/progress/5?job_id=${jobId}`);
-                        const result = await response.json();
-                        if (result.progress) {
-                            statusDiv.textContent = result.progress;
-                        }
-                        // Update button states based on job status
-                        if (result.status === "running") {
-                            runButton.disabled = true;
-                            runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = false;
-                            stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                        } else if (result.status === "completed" || result.status === "stopped") {
-                            clearInterval(progressInterval5);
-                            progressInterval5 = null;
-                            statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
-                            runButton.disabled = false;
-                            runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = true;
-                            stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                            checkStepAvailability();
-                            populateJobDropdown("job_select_step5", 5);
-                        }
-                    } catch (error) {
-                        console.error("Progress polling error for Step 5:", error);
-                        statusDiv.textContent = `Error: ${error.message}`;
+                // Follow the new job through the progress event stream
+                watchJob(5, jobId, (result) => {
+                    if (result.progress) {
+                        statusDiv.textContent = result.progress;
+                    }
+                    // Update button states based on job status
+                    if (result.status === "running") {
+                        runButton.disabled = true;
+                        runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = false;
+                        stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+                    } else if (result.status === "completed" || result.status === "stopped") {
+                        unwatchJob(5);
+                        statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
+                        runButton.disabled = false;
+                        runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = true;
+                        stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                        checkStepAvailability();
+                        populateJobDropdown("job_select_step5", 5);
                     }
-                }, 5000);
+                });
                 // Refresh job dropdown
                 populateJobDropdown("job_select_step5", 5);
             } else {
@@ -441,10 +471,7 @@ document.addEventListener("DOMContentLoaded", () => {
             const result = await response.json();
             if (response.ok) {
                 statusDiv.textContent = result.message;
-                if (progressInterval5) {
-                    clearInterval(progressInterval5);
-                    progressInterval5 = null;
-                }
+                unwatchJob(5);
                 // Update button states
                 runButton.disabled = false;
                 runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -462,7 +489,6 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     });
 
-    let progressInterval6 = null;
     document.getElementById("run_step6").addEventListener("click", async () => {
         const inputCsv = document.getElementById("input_csv6").value;
         const maxRows = parseInt(document.getElementById("max_rows_step6").value);
@@ -520,43 +546,32 @@ document.addEventListener("DOMContentLoaded", () => {
             if (response.ok) {
                 statusDiv.textContent = result.message;
                 const jobId = result.job_id;
-                // Start polling for the new job
-                if (progressInterval6) {
-                    clearInterval(progressInterval6);
-                }
-                progressInterval6 = setInterval(async () => {
-                    try {
-                        const response = await fetch(`/api/progress/6?job_id=${jobId}`);
-                        const result = await response.json();
-                        if (result.progress) {
-                            statusDiv.textContent = result.progress;
-                        }
-                        // Update button states based on job status
-                        if (result.status === "running") {
-                            runButton.disabled = true;
-                            runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = false;
-                            stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                        } else if (result.status === "completed" || result.status === "stopped") {
-                            clearInterval(progressInterval6);
-                            progressInterval6 = null;
-                            statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
-                            runButton.disabled = false;
-                            runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = true;
-                            stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                            checkStepAvailability();
-                            populateJobDropdown("job_select_step6", 6);
-                        }
-                    } catch (error) {
-                        console.error("Progress polling error for Step 6:", error);
-                        statusDiv.textContent = `Error: ${error.message}`;
+                // Follow the new job through the progress event stream
+                watchJob(6, jobId, (result) => {
+                    if (result.progress) {
+                        statusDiv.textContent = result.progress;
+                    }
+                    // Update button states based on job status
+                    if (result.status === "running") {
+                        runButton.disabled = true;
+                        runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = false;
+                        stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+                    } else if (result.status === "completed" || result.status === "stopped") {
+                        unwatchJob(6);
+                        statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
+                        runButton.disabled = false;
+                        runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = true;
+                        stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                        checkStepAvailability();
+                        populateJobDropdown("job_select_step6", 6);
                     }
-                }, 5000);
+                });
                 // Refresh job dropdown
                 populateJobDropdown("job_select_step6", 6);
             } else {
@@ -592,10 +607,7 @@ document.addEventListener("DOMContentLoaded", () => {
             const result = await response.json();
             if (response.ok) {
                 statusDiv.textContent = result.message;
-                if (progressInterval6) {
-                    clearInterval(progressInterval6);
-                    progressInterval6 = null;
-                }
+                unwatchJob(6);
                 // Update button states
                 runButton.disabled = false;
                 runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -613,7 +625,6 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     });
 
-    let progressInterval7 = null;
     document.getElementById("run_step7").addEventListener("click", async () => {
         const inputCsv = document.getElementById("input_csv7").value;
         const maxRows = parseInt(document.getElementById("max_rows_step7").value);
@@ -671,43 +682,32 @@ document.addEventListener("DOMContentLoaded", () => {
             if (response.ok) {
                 statusDiv.textContent = result.message;
                 const jobId = result.job_id;
-                // Start polling for the new job
-                if (progressInterval7) {
-                    clearInterval(progressInterval7);
-                }
-                progressInterval7 = setInterval(async () => {
-                    try {
-                        const response = await fetch(`/api/progress/7?job_id=${jobId}`);
-                        const result = await response.json();
-                        if (result.progress) {
-                            statusDiv.textContent = result.progress;
-                        }
-                        // Update button states based on job status
-                        if (result.status === "running") {
-                            runButton.disabled = true;
-                            runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = false;
-                            stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                        } else if (result.status === "completed" || result.status === "stopped") {
-                            clearInterval(progressInterval7);
-                            progressInterval7 = null;
-                            statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
-                            runButton.disabled = false;
-                            runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = true;
-                            stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                            checkStepAvailability();
-                            populateJobDropdown("job_select_step7", 7);
-                        }
-                    } catch (error) {
-                        console.error("Progress polling error for Step 7:", error);
-                        statusDiv.textContent = `Error: ${error.message}`;
+                // Follow the new job through the progress event stream
+                watchJob(7, jobId, (result) => {
+                    if (result.progress) {
+                        statusDiv.textContent = result.progress;
                     }
-                }, 5000);
+                    // Update button states based on job status
+                    if (result.status === "running") {
+                        runButton.disabled = true;
+                        runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = false;
+                        stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+                    } else if (result.status === "completed" || result.status === "stopped") {
+                        unwatchJob(7);
+                        statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
+                        runButton.disabled = false;
+                        runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = true;
+                        stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                        checkStepAvailability();
+                        populateJobDropdown("job_select_step7", 7);
+                    }
+                });
                 // Refresh job dropdown
                 populateJobDropdown("job_select_step7", 7);
             } else {
@@ -743,10 +743,7 @@ document.addEventListener("DOMContentLoaded", () => {
             const result = await response.json();
             if (response.ok) {
                 statusDiv.textContent = result.message;
-                if (progressInterval7) {
-                    clearInterval(progressInterval7);
-                    progressInterval7 = null;
-                }
+                unwatchJob(7);
                 // Update button states
                 runButton.disabled = false;
                 runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -764,7 +761,6 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     });
 
-    let progressInterval8 = null;
     document.getElementById("run_step8").addEventListener("click", async () => {
         const inputCsv = document.getElementById("input_csv8").value;
         const maxRows = parseInt(document.getElementById("max_rows_step8").value);
@@ -822,41 +818,30 @@ document.addEventListener("DOMContentLoaded", () => {
             if (response.ok) {
                 statusDiv.textContent = result.message;
                 const jobId = result.job_id;
-                if (progressInterval8) {
-                    clearInterval(progressInterval8);
-                }
-                progressInterval8 = setInterval(async () => {
-                    try {
-                        const response = await fetch(`/api/progress/8?job_id=${jobId}`);
-                        const result = await response.json();
-                        if (result.progress) {
-                            statusDiv.textContent = result.progress;
-                        }
-                        if (result.status === "running") {
-                            runButton.disabled = true;
-                            runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = false;
-                            stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                        } else if (result.status === "completed" || result.status === "stopped") {
-                            clearInterval(progressInterval8);
-                            progressInterval8 = null;
-                            statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
-                            runButton.disabled = false;
-                            runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                            runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                            stopButton.disabled = true;
-                            stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                            stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                            checkStepAvailability();
-                            populateJobDropdown("job_select_step8", 8);
-                        }
-                    } catch (error) {
-                        console.error("Progress polling error for Step 8:", error);
-                        statusDiv.textContent = `Error: ${error.message}`;
+                watchJob(8, jobId, (result) => {
+                    if (result.progress) {
+                        statusDiv.textContent = result.progress;
+                    }
+                    if (result.status === "running") {
+                        runButton.disabled = true;
+                        runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = false;
+                        stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+                    } else if (result.status === "completed" || result.status === "stopped") {
+                        unwatchJob(8);
+                        statusDiv.textContent = `Job ${result.status} (${result.current_row}/${result.total_rows} rows processed)`;
+                        runButton.disabled = false;
+                        runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                        runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                        stopButton.disabled = true;
+                        stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                        stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                        checkStepAvailability();
+                        populateJobDropdown("job_select_step8", 8);
                     }
-                }, 5000);
+                });
                 populateJobDropdown("job_select_step8", 8);
             } else {
                 statusDiv.textContent = `Error: ${result.error}`;
@@ -891,10 +876,7 @@ document.addEventListener("DOMContentLoaded", () => {
             const result = await response.json();
             if (response.ok) {
                 statusDiv.textContent = result.message;
-                if (progressInterval8) {
-                    clearInterval(progressInterval8);
-                    progressInterval8 = null;
-                }
+                unwatchJob(8);
                 runButton.disabled = false;
                 runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
                 runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
@@ -918,10 +900,7 @@ document.addEventListener("DOMContentLoaded", () => {
         const stopButton = document.getElementById("stop_step5");
         if (!jobId) {
             statusDiv.textContent = "";
-            if (progressInterval5) {
-                clearInterval(progressInterval5);
-                progressInterval5 = null;
-            }
+            unwatchJob(5);
             runButton.disabled = false;
             runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
             runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
@@ -930,52 +909,36 @@ document.addEventListener("DOMContentLoaded", () => {
             stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
             return;
         }
-        if (progressInterval5) {
-            clearInterval(progressInterval5);
-        }
-        progressInterval5 = setInterval(async () => {
-            try {
-                const [progressResponse, jobsResponse] = await Promise.all([
-                    fetch(`/api/progress/5?job_id=${jobId}`),
-                    fetch(`/api/jobs/5`)
-                ]);
-                const progressResult = await progressResponse.json();
-                const jobsResult = await jobsResponse.json();
-                const job = jobsResult.jobs.find(j => j.job_id === jobId);
-                const jobStatus = job ? job.status : progressResult.status;
-
-                if (progressResult.progress && jobStatus === "running") {
-                    statusDiv.textContent = progressResult.progress;
-                } else {
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                }
+        watchJob(5, jobId, (progressResult) => {
+            const jobStatus = progressResult.status;
 
-                // Update button states based on job status
-                if (jobStatus === "running") {
-                    runButton.disabled = true;
-                    runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = false;
-                    stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                } else if (jobStatus === "completed" || jobStatus === "stopped") {
-                    clearInterval(progressInterval5);
-                    progressInterval5 = null;
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                    runButton.disabled = false;
-                    runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = true;
-                    stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                    checkStepAvailability();
-                    populateJobDropdown("job_select_step5", 5);
-                }
-            } catch (error) {
-                console.error("Progress polling error for Step 5:", error);
-                statusDiv.textContent = `Error: ${error.message}`;
+            if (progressResult.progress && jobStatus === "running") {
+                statusDiv.textContent = progressResult.progress;
+            } else {
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+            }
+
+            // Update button states based on job status
+            if (jobStatus === "running") {
+                runButton.disabled = true;
+                runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = false;
+                stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+            } else if (jobStatus === "completed" || jobStatus === "stopped") {
+                unwatchJob(5);
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+                runButton.disabled = false;
+                runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = true;
+                stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                checkStepAvailability();
+                populateJobDropdown("job_select_step5", 5);
             }
-        }, 5000);
+        });
     });
 
     // Job selection for Step 6
@@ -986,10 +949,7 @@ document.addEventListener("DOMContentLoaded", () => {
         const stopButton = document.getElementById("stop_step6");
         if (!jobId) {
             statusDiv.textContent = "";
-            if (progressInterval6) {
-                clearInterval(progressInterval6);
-                progressInterval6 = null;
-            }
+            unwatchJob(6);
             runButton.disabled = false;
             runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
             runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
@@ -998,52 +958,36 @@ document.addEventListener("DOMContentLoaded", () => {
             stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
             return;
         }
-        if (progressInterval6) {
-            clearInterval(progressInterval6);
-        }
-        progressInterval6 = setInterval(async () => {
-            try {
-                const [progressResponse, jobsResponse] = await Promise.all([
-                    fetch(`/api/progress/6?job_id=${jobId}`),
-                    fetch(`/api/jobs/6`)
-                ]);
-                const progressResult = await progressResponse.json();
-                const jobsResult = await jobsResponse.json();
-                const job = jobsResult.jobs.find(j => j.job_id === jobId);
-                const jobStatus = job ? job.status : progressResult.status;
-
-                if (progressResult.progress && jobStatus === "running") {
-                    statusDiv.textContent = progressResult.progress;
-                } else {
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                }
+        watchJob(6, jobId, (progressResult) => {
+            const jobStatus = progressResult.status;
 
-                // Update button states based on job status
-                if (jobStatus === "running") {
-                    runButton.disabled = true;
-                    runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = false;
-                    stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                } else if (jobStatus === "completed" || jobStatus === "stopped") {
-                    clearInterval(progressInterval6);
-                    progressInterval6 = null;
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                    runButton.disabled = false;
-                    runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = true;
-                    stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                    checkStepAvailability();
-                    populateJobDropdown("job_select_step6", 6);
-                }
-            } catch (error) {
-                console.error("Progress polling error for Step 6:", error);
-                statusDiv.textContent = `Error: ${error.message}`;
+            if (progressResult.progress && jobStatus === "running") {
+                statusDiv.textContent = progressResult.progress;
+            } else {
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+            }
+
+            // Update button states based on job status
+            if (jobStatus === "running") {
+                runButton.disabled = true;
+                runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = false;
+                stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+            } else if (jobStatus === "completed" || jobStatus === "stopped") {
+                unwatchJob(6);
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+                runButton.disabled = false;
+                runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = true;
+                stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                checkStepAvailability();
+                populateJobDropdown("job_select_step6", 6);
             }
-        }, 5000);
+        });
     });
 
     // Job selection for Step 7
@@ -1054,10 +998,7 @@ document.addEventListener("DOMContentLoaded", () => {
         const stopButton = document.getElementById("stop_step7");
         if (!jobId) {
             statusDiv.textContent = "";
-            if (progressInterval7) {
-                clearInterval(progressInterval7);
-                progressInterval7 = null;
-            }
+            unwatchJob(7);
             runButton.disabled = false;
             runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
             runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
@@ -1066,51 +1007,35 @@ document.addEventListener("DOMContentLoaded", () => {
             stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
             return;
         }
-        if (progressInterval7) {
-            clearInterval(progressInterval7);
-        }
-        progressInterval7 = setInterval(async () => {
-            try {
-                const [progressResponse, jobsResponse] = await Promise.all([
-                    fetch(`/api/progress/7?job_id=${jobId}`),
-                    fetch(`/api/jobs/7`)
-                ]);
-                const progressResult = await progressResponse.json();
-                const jobsResult = await jobsResponse.json();
-                const job = jobsResult.jobs.find(j => j.job_id === jobId);
-                const jobStatus = job ? job.status : progressResult.status;
-
-                if (progressResult.progress && jobStatus === "running") {
-                    statusDiv.textContent = progressResult.progress;
-                } else {
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                }
+        watchJob(7, jobId, (progressResult) => {
+            const jobStatus = progressResult.status;
 
-                if (jobStatus === "running") {
-                    runButton.disabled = true;
-                    runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = false;
-                    stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                } else if (jobStatus === "completed" || jobStatus === "stopped") {
-                    clearInterval(progressInterval7);
-                    progressInterval7 = null;
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                    runButton.disabled = false;
-                    runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = true;
-                    stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                    checkStepAvailability();
-                    populateJobDropdown("job_select_step7", 7);
-                }
-            } catch (error) {
-                console.error("Progress polling error for Step 7:", error);
-                statusDiv.textContent = `Error: ${error.message}`;
+            if (progressResult.progress && jobStatus === "running") {
+                statusDiv.textContent = progressResult.progress;
+            } else {
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+            }
+
+            if (jobStatus === "running") {
+                runButton.disabled = true;
+                runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = false;
+                stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+            } else if (jobStatus === "completed" || jobStatus === "stopped") {
+                unwatchJob(7);
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+                runButton.disabled = false;
+                runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = true;
+                stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                checkStepAvailability();
+                populateJobDropdown("job_select_step7", 7);
             }
-        }, 5000);
+        });
     });
 
     // Job selection for Step 8
@@ -1121,10 +1046,7 @@ document.addEventListener("DOMContentLoaded", () => {
         const stopButton = document.getElementById("stop_step8");
         if (!jobId) {
             statusDiv.textContent = "";
-            if (progressInterval8) {
-                clearInterval(progressInterval8);
-                progressInterval8 = null;
-            }
+            unwatchJob(8);
             runButton.disabled = false;
             runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
             runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
@@ -1133,64 +1055,55 @@ document.addEventListener("DOMContentLoaded", () => {
             stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
             return;
         }
-        if (progressInterval8) {
-            clearInterval(progressInterval8);
-        }
-        progressInterval8 = setInterval(async () => {
-            try {
-                const [progressResponse, jobsResponse] = await Promise.all([
-                    fetch(`/api/progress/8?job_id=${jobId}`),
-                    fetch(`/api/jobs/8`)
-                ]);
-                const progressResult = await progressResponse.json();
-                const jobsResult = await jobsResponse.json();
-                const job = jobsResult.jobs.find(j => j.job_id === jobId);
-                const jobStatus = job ? job.status : progressResult.status;
-
-                if (progressResult.progress && jobStatus === "running") {
-                    statusDiv.textContent = progressResult.progress;
-                } else {
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                }
+        watchJob(8, jobId, (progressResult) => {
+            const jobStatus = progressResult.status;
 
-                if (jobStatus === "running") {
-                    runButton.disabled = true;
-                    runButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = false;
-                    stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.add("bg-red-600", "hover:bg-red-700");
-                } else if (jobStatus === "completed" || jobStatus === "stopped") {
-                    clearInterval(progressInterval8);
-                    progressInterval8 = null;
-                    statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
-                    runButton.disabled = false;
-                    runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
-                    runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
-                    stopButton.disabled = true;
-                    stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
-                    stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
-                    checkStepAvailability();
-                    populateJobDropdown("job_select_step8", 8);
-                }
-            } catch (error) {
-                console.error("Progress polling error for Step 8:", error);
-                statusDiv.textContent = `Error: ${error.message}`;
+            if (progressResult.progress && jobStatus === "running") {
+                statusDiv.textContent = progressResult.progress;
+            } else {
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+            }
+
+            if (jobStatus === "running") {
+                runButton.disabled = true;
+                runButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.remove("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = false;
+                stopButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.add("bg-red-600", "hover:bg-red-700");
+            } else if (jobStatus === "completed" || jobStatus === "stopped") {
+                unwatchJob(8);
+                statusDiv.textContent = `Job ${jobStatus} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
+                runButton.disabled = false;
+                runButton.classList.remove("bg-gray-600", "cursor-not-allowed");
+                runButton.classList.add("bg-blue-600", "hover:bg-blue-700");
+                stopButton.disabled = true;
+                stopButton.classList.add("bg-gray-600", "cursor-not-allowed");
+                stopButton.classList.remove("bg-red-600", "hover:bg-red-700");
+                checkStepAvailability();
+                populateJobDropdown("job_select_step8", 8);
             }
-        }, 5000);
+        });
     });
 
-    async function populateCsvDropdown(selectId, folder) {
+    async function populateCsvDropdown(selectId, folder, step) {
         try {
-            const response = await fetch(`/api/files/${folder}`);
+            // Newest files first, with their row count and the rows the step has already processed
+            const response = await fetch(`/api/files/${folder}?sort=mtime&order=desc&per_page=1000`);
             const result = await response.json();
             const select = document.getElementById(selectId);
             select.innerHTML = '<option value="">Select a CSV file</option>';
-            if (result.files) {
-                result.files.forEach(file => {
+            if (result.items) {
+                result.items.forEach(item => {
                     const option = document.createElement("option");
-                    option.value = file;
-                    option.textContent = file;
+                    option.value = item.file;
+                    option.textContent = item.file;
+                    if (item.rows !== undefined) {
+                        const processed = step && item.processed ? item.processed[`step${step}`] : undefined;
+                        option.textContent += processed !== undefined
+                            ? ` (${item.rows} rows, ${processed} processed)`
+                            : ` (${item.rows} rows)`;
+                    }
                     select.appendChild(option);
                 });
             }
@@ -1221,7 +1134,7 @@ document.addEventListener("DOMContentLoaded", () => {
     async function checkStepAvailability() {
         try {
         // Check Step 2 availability
-            let response = await fetch("/api/files/csv");
+            let response = await fetch("/api/files/csv?per_page=1");
             let result = await response.json();
             if (result.files && result.files.length > 0) {
                 document.getElementById("step2").disabled = false;
@@ -1230,7 +1143,7 @@ document.addEventListener("DOMContentLoaded", () => {
             }
 
         // Check Step 3 availability
-            response = await fetch("/api/files/filtered_url");
+            response = await fetch("/api/files/filtered_url?per_page=1");
             result = await response.json();
             if (result.files && result.files.length > 0) {
                 document.getElementById("step3").disabled = false;
@@ -1254,7 +1167,7 @@ document.addEventListener("DOMContentLoaded", () => {
         //     document.getElementById("step5").classList.add("bg-blue-600", "hover:bg-blue-700");
         // }
         // Check Step 5 availability (skipping Step 4)
-            response = await fetch("/api/files/updated_name");
+            response = await fetch("/api/files/updated_name?per_page=1");
             result = await response.json();
             if (result.files && result.files.length > 0) {
                 document.getElementById("step5").disabled = false;
@@ -1263,7 +1176,7 @@ document.addEventListener("DOMContentLoaded", () => {
             }
 
         // Check Step 6 availability
-        response = await fetch("/api/files/domain_about");
+        response = await fetch("/api/files/domain_about?per_page=1");
         result = await response.json();
         if (result.files && result.files.length > 0) {
             document.getElementById("step6").disabled = false;
@@ -1272,7 +1185,7 @@ document.addEventListener("DOMContentLoaded", () => {
         }
 
         // Check Step 7 availability
-        response = await fetch("/api/files/emails");
+        response = await fetch("/api/files/emails?per_page=1");
         result = await response.json();
         if (result.files && result.files.length > 0) {
             document.getElementById("step7").disabled = false;
@@ -1281,7 +1194,7 @@ document.addEventListener("DOMContentLoaded", () => {
         }
 
         // Check Step 8 availability
-        response = await fetch("/api/files/verified");
+        response = await fetch("/api/files/verified?per_page=1");
         result = await response.json();
         if (result.files && result.files.length > 0) {
             document.getElementById("step8").disabled = false;
@@ -1295,9 +1208,13 @@ document.addEventListener("DOMContentLoaded", () => {
 
     async function checkRunningJobs() {
         try {
+            // One snapshot of the jobs of all steps
+            const response = await fetch("/api/status");
+            const status = await response.json();
+            const jobsOfStep = (step) => ({ jobs: (status.jobs || []).filter(job => job.step === step) });
+
         // Check Step 5 running jobs
-            let response = await fetch("/api/jobs/5");
-            let result = await response.json();
+            let result = jobsOfStep(5);
             const runButton5 = document.getElementById("run_step5");
             const stopButton5 = document.getElementById("stop_step5");
             const statusDiv5 = document.getElementById("status5");
@@ -1311,16 +1228,12 @@ document.addEventListener("DOMContentLoaded", () => {
                 const job = result.jobs.find(j => j.status === "running");
                 if (job) {
                     statusDiv5.textContent = `Running job ${job.job_id}...`;
-                    if (progressInterval5) clearInterval(progressInterval5);
-                    progressInterval5 = setInterval(async () => {
-                        const progressResponse = await fetch(`/api/progress/5?job_id=${job.job_id}`);
-                        const progressResult = await progressResponse.json();
+                    watchJob(5, job.job_id, (progressResult) => {
                         if (progressResult.progress) {
                             statusDiv5.textContent = progressResult.progress;
                         }
                         if (progressResult.status !== "running") {
-                            clearInterval(progressInterval5);
-                            progressInterval5 = null;
+                            unwatchJob(5);
                             statusDiv5.textContent = `Job ${progressResult.status} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
                             runButton5.disabled = false;
                             runButton5.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -1331,12 +1244,11 @@ document.addEventListener("DOMContentLoaded", () => {
                             checkStepAvailability();
                             populateJobDropdown("job_select_step5", 5);
                         }
-                    }, 5000);
+                    });
                 }
             }
 
-            response = await fetch("/api/jobs/6");
-            result = await response.json();
+            result = jobsOfStep(6);
             const runButton6 = document.getElementById("run_step6");
             const stopButton6 = document.getElementById("stop_step6");
             const statusDiv6 = document.getElementById("status6");
@@ -1350,16 +1262,12 @@ document.addEventListener("DOMContentLoaded", () => {
                 const job = result.jobs.find(j => j.status === "running");
                 if (job) {
                     statusDiv6.textContent = `Running job ${job.job_id}...`;
-                    if (progressInterval6) clearInterval(progressInterval6);
-                    progressInterval6 = setInterval(async () => {
-                        const progressResponse = await fetch(`/api/progress/6?job_id=${job.job_id}`);
-                        const progressResult = await progressResponse.json();
+                    watchJob(6, job.job_id, (progressResult) => {
                         if (progressResult.progress) {
                             statusDiv6.textContent = progressResult.progress;
                         }
                         if (progressResult.status !== "running") {
-                            clearInterval(progressInterval6);
-                            progressInterval6 = null;
+                            unwatchJob(6);
                             statusDiv6.textContent = `Job ${progressResult.status} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
                             runButton6.disabled = false;
                             runButton6.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -1370,12 +1278,11 @@ document.addEventListener("DOMContentLoaded", () => {
                             checkStepAvailability();
                             populateJobDropdown("job_select_step6", 6);
                         }
-                    }, 5000);
+                    });
                 }
             }
 
-            response = await fetch("/api/jobs/7");
-            result = await response.json();
+            result = jobsOfStep(7);
             const runButton7 = document.getElementById("run_step7");
             const stopButton7 = document.getElementById("stop_step7");
             const statusDiv7 = document.getElementById("status7");
@@ -1389,16 +1296,12 @@ document.addEventListener("DOMContentLoaded", () => {
                 const job = result.jobs.find(j => j.status === "running");
                 if (job) {
                     statusDiv7.textContent = `Running job ${job.job_id}...`;
-                    if (progressInterval7) clearInterval(progressInterval7);
-                    progressInterval7 = setInterval(async () => {
-                        const progressResponse = await fetch(`/api/progress/7?job_id=${job.job_id}`);
-                        const progressResult = await progressResponse.json();
+                    watchJob(7, job.job_id, (progressResult) => {
                         if (progressResult.progress) {
                             statusDiv7.textContent = progressResult.progress;
                         }
                         if (progressResult.status !== "running") {
-                            clearInterval(progressInterval7);
-                            progressInterval7 = null;
+                            unwatchJob(7);
                             statusDiv7.textContent = `Job ${progressResult.status} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
                             runButton7.disabled = false;
                             runButton7.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -1409,12 +1312,11 @@ document.addEventListener("DOMContentLoaded", () => {
                             checkStepAvailability();
                             populateJobDropdown("job_select_step7", 7);
                         }
-                    }, 5000);
+                    });
                 }
             }
 
-            response = await fetch("/api/jobs/8");
-            result = await response.json();
+            result = jobsOfStep(8);
             const runButton8 = document.getElementById("run_step8");
             const stopButton8 = document.getElementById("stop_step8");
             const statusDiv8 = document.getElementById("status8");
@@ -1428,16 +1330,12 @@ document.addEventListener("DOMContentLoaded", () => {
                 const job = result.jobs.find(j => j.status === "running");
                 if (job) {
                     statusDiv8.textContent = `Running job ${job.job_id}...`;
-                    if (progressInterval8) clearInterval(progressInterval8);
-                    progressInterval8 = setInterval(async () => {
-                        const progressResponse = await fetch(`/api/progress/8?job_id=${job.job_id}`);
-                        const progressResult = await progressResponse.json();
+                    watchJob(8, job.job_id, (progressResult) => {
                         if (progressResult.progress) {
                             statusDiv8.textContent = progressResult.progress;
                         }
                         if (progressResult.status !== "running") {
-                            clearInterval(progressInterval8);
-                            progressInterval8 = null;
+                            unwatchJob(8);
                             statusDiv8.textContent = `Job ${progressResult.status} (${progressResult.current_row}/${progressResult.total_rows} rows processed)`;
                             runButton8.disabled = false;
                             runButton8.classList.remove("bg-gray-600", "cursor-not-allowed");
@@ -1448,7 +1346,7 @@ document.addEventListener("DOMContentLoaded", () => {
                             checkStepAvailability();
                             populateJobDropdown("job_select_step8", 8);
                         }
-                    }, 5000);
+                    });
                 }
             }
         } catch (error) {
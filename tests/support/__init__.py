@@ -0,0 +1,4 @@
+"""
+Local fakes of the external services the scraping steps talk to, so the tests (and the benchmarks)
+run offline.
+"""
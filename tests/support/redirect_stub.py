@@ -0,0 +1,45 @@
+"""
+Local HTTP server that imitates LinkedIn's company redirects, for checking
+backend/scripts/sales_navigator_scrape/company_url_resolver.py offline.
+"""
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class _RedirectStubHandler(BaseHTTPRequestHandler):
+    """Answers with a redirect to routes[path], or 200 if the target is None, or 404 for unknown paths."""
+
+    routes = {}
+    delay = 0.0
+
+    def do_GET(self):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.path not in self.routes:
+            self.send_response(404)
+        elif self.routes[self.path] is None:
+            self.send_response(200)
+        else:
+            self.send_response(302)
+            self.send_header("Location", self.routes[self.path])
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+def start_redirect_stub(routes, delay=0.0):
+    """
+    Starts a local HTTP server that imitates LinkedIn's company redirects.
+
+    Parameters:
+        routes (dict): Maps a path to the Location it redirects to, or to None for a final 200 page.
+        delay (float): Seconds to wait before answering each request.
+
+    Returns:
+        tuple: (server, base_url). Call `server.shutdown()` when done.
+    """
+    handler = type("RedirectStubHandler", (_RedirectStubHandler,), {"routes": dict(routes), "delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
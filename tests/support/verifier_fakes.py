@@ -0,0 +1,86 @@
+"""
+Local stand-ins for the SMTP verifier backend of
+backend/scripts/sales_navigator_scrape/verify_emails.py.
+
+- `static_mx_resolver` replaces DNS: it maps domains to mail hosts from a dict.
+- `start_fake_smtp_server` answers the SMTP dialogue of `SmtpVerifier` on 127.0.0.1, accepting
+  only the given mailboxes (and every address of the given catch-all domains).
+
+The fake verifier API used by the tests and the Step 7 benchmark is in
+backend/scripts/benchmarks/fake_verifier_api.py.
+"""
+import socketserver
+import threading
+
+
+def static_mx_resolver(mx_hosts):
+    """
+    Returns an MX resolver that answers from a dict instead of DNS.
+
+    Parameters:
+        mx_hosts (dict): Maps a domain to its list of mail hosts. Unknown domains have no mail server.
+
+    Returns:
+        callable: domain -> list of hosts.
+    """
+    return lambda domain: list(mx_hosts.get(domain, []))
+
+
+class _FakeSmtpHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server: accepts RCPT TO for known mailboxes and catch-all domains, rejects the rest with 550."""
+
+    mailboxes = frozenset()
+    catch_all_domains = frozenset()
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 fake-smtp ESMTP ready")
+        for raw_line in self.rfile:
+            command = raw_line.decode(errors="replace").strip()
+            verb = command.split(" ", 1)[0].split(":", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-fake-smtp")
+                self.reply("250 8BITMIME")
+            elif verb in ("HELO", "MAIL", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[-1].strip().strip("<>").lower()
+                domain = address.rsplit("@", 1)[-1]
+                if address in self.mailboxes or domain in self.catch_all_domains:
+                    self.reply("250 Accepted")
+                else:
+                    self.reply("550 No such user")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class _FakeSmtpServer(socketserver.ThreadingTCPServer):
+    """TCP server with a listen backlog large enough for many concurrent probes."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def start_fake_smtp_server(mailboxes, catch_all_domains=()):
+    """
+    Starts a local SMTP server that imitates a mail exchanger.
+
+    Parameters:
+        mailboxes (iterable): Addresses that exist.
+        catch_all_domains (iterable): Domains that accept every address.
+
+    Returns:
+        tuple: (server, port). Call `server.shutdown()` when done.
+    """
+    handler = type("FakeSmtpHandler", (_FakeSmtpHandler,), {
+        "mailboxes": frozenset(address.lower() for address in mailboxes),
+        "catch_all_domains": frozenset(domain.lower() for domain in catch_all_domains),
+    })
+    server = _FakeSmtpServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
@@ -0,0 +1,65 @@
+"""
+Tests for the browser-free company URL resolver of Step 4.
+"""
+import time
+import pytest
+import requests
+from backend.scripts.sales_navigator_scrape.company_url_resolver import create_http_session, is_company_id_url, resolve_redirect
+from tests.support.redirect_stub import start_redirect_stub
+
+@pytest.fixture
+def redirect_stub():
+    """Starts redirect stub servers for a test and shuts them down afterwards."""
+    servers = []
+
+    def start(routes, delay=0.0):
+        server, base_url = start_redirect_stub(routes, delay=delay)
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+def test_follows_redirect_chain(redirect_stub):
+    base_url = redirect_stub({
+        "/company/12345": "/company/example-hotels",
+        "/company/example-hotels": "/company/example-hotels/",
+        "/company/example-hotels/": None,
+    })
+    final_url, needs_browser = resolve_redirect(f"{base_url}/company/12345", create_http_session())
+    assert final_url == f"{base_url}/company/example-hotels/"
+    assert needs_browser is False
+    assert not is_company_id_url(final_url)
+
+def test_page_without_redirect_is_still_an_id_url(redirect_stub):
+    base_url = redirect_stub({"/company/22222": None})
+    final_url, needs_browser = resolve_redirect(f"{base_url}/company/22222", create_http_session())
+    assert (final_url, needs_browser) == (f"{base_url}/company/22222", False)
+    assert is_company_id_url(final_url)
+
+def test_too_many_redirects_needs_browser(redirect_stub):
+    base_url = redirect_stub({f"/company/{i}": f"/company/{i + 1}" for i in range(10)} | {"/company/10": None})
+    final_url, needs_browser = resolve_redirect(f"{base_url}/company/0", create_http_session(), max_redirects=3)
+    assert needs_browser is True
+    assert final_url == f"{base_url}/company/4"
+
+@pytest.mark.parametrize("login_path", ["/authwall?trk=company", "/login", "/checkpoint/challenge"])
+def test_login_wall_falls_back_to_browser(redirect_stub, login_path):
+    base_url = redirect_stub({"/company/11111": login_path})
+    final_url, needs_browser = resolve_redirect(f"{base_url}/company/11111", create_http_session())
+    assert needs_browser is True
+    assert final_url == f"{base_url}/company/11111" # The login page itself is never requested
+
+def test_error_status_needs_browser(redirect_stub):
+    base_url = redirect_stub({"/company/33333": "/missing"})
+    final_url, needs_browser = resolve_redirect(f"{base_url}/company/33333", create_http_session())
+    assert (final_url, needs_browser) == (f"{base_url}/missing", True)
+
+def test_timeout_needs_browser(redirect_stub):
+    base_url = redirect_stub({"/company/44444": None}, delay=2.0)
+    started = time.perf_counter()
+    final_url, needs_browser = resolve_redirect(f"{base_url}/company/44444", requests.Session(), timeout=0.2)
+    assert (final_url, needs_browser) == (f"{base_url}/company/44444", True)
+    assert time.perf_counter() - started < 2.0
@@ -0,0 +1,52 @@
+"""
+Tests for the job records of config/job_functions.py, which the web workers and the job runner
+update from several processes at once.
+"""
+import json
+import multiprocessing
+import os
+from backend.config import Config
+from config.job_functions import create_job, update_job_status, record_job_metrics, read_jobs, find_job, jobs_file_path
+
+def _record_jobs(temp_path, worker, count):
+    """Creates `count` jobs and updates each of them, like a job runner process does."""
+    Config.TEMP_PATH = temp_path
+    for index in range(count):
+        job_id = f"{worker}-{index}"
+        create_job("step7", job_id, input_csv="input.csv")
+        record_job_metrics("step7", job_id, rows_loaded=index)
+        update_job_status("step7", job_id, "completed")
+
+def test_records_survive_concurrent_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TEMP_PATH", str(tmp_path))
+    workers, count = 4, 25
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_record_jobs, args=(str(tmp_path), worker, count)) for worker in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+    with open(jobs_file_path("step7")) as f:
+        jobs = json.load(f)
+    assert len(jobs) == workers * count
+    assert {job["job_id"] for job in jobs} == {f"{worker}-{index}" for worker in range(workers) for index in range(count)}
+    assert all(job["status"] == "completed" and "rows_loaded" in job["metrics"] for job in jobs)
+    assert not os.path.exists(f"{jobs_file_path('step7')}.tmp")
+
+def test_read_jobs_and_find_job(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TEMP_PATH", str(tmp_path))
+    assert read_jobs("step5") == []
+    create_job("step5", "job-1", input_csv="input.csv")
+    update_job_status("step5", "job-1", "stopped")
+    assert [job["status"] for job in read_jobs("step5")] == ["stopped"]
+    assert find_job("job-1", [5, 6]) == (5, read_jobs("step5")[0])
+    assert find_job("job-2", [5, 6]) == (None, None)
+
+def test_unreadable_jobs_file_reads_as_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TEMP_PATH", str(tmp_path))
+    with open(jobs_file_path("step6"), "w") as f:
+        f.write('[{"job_id": "job-1", "sta')
+    assert read_jobs("step6") == []
+    assert find_job("job-1", [6]) == (None, None)
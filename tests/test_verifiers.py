@@ -0,0 +1,98 @@
+"""
+Tests for the Step 7 verifier backends, run against local fakes of a mail server and a verifier API.
+"""
+import pytest
+from backend.scripts.sales_navigator_scrape.verify_emails import (
+    ApiVerifier, SmtpVerifier, get_verifier,
+    STATUS_VALID, STATUS_INVALID, STATUS_CATCH_ALL, STATUS_NO_RESULT, STATUS_SEARCH_LIMIT,
+)
+from backend.scripts.benchmarks.fake_verifier_api import start_fake_verifier_api
+from tests.support.verifier_fakes import start_fake_smtp_server, static_mx_resolver
+
+@pytest.fixture
+def smtp_verifier():
+    """SmtpVerifier talking to a fake mail server that knows one mailbox and one catch-all domain."""
+    server, port = start_fake_smtp_server({"anna@example.com"}, catch_all_domains={"catchall.test"})
+    resolver = static_mx_resolver({"example.com": ["127.0.0.1"], "catchall.test": ["127.0.0.1"]})
+    yield SmtpVerifier(mx_resolver=resolver, port=port, timeout=5, rate_limit=0)
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def fake_api():
+    """Starts fake verifier APIs for a test and shuts them down afterwards."""
+    servers = []
+
+    def start(results, **kwargs):
+        server, url = start_fake_verifier_api(results, **kwargs)
+        servers.append(server)
+        return url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+def test_smtp_valid_mailbox(smtp_verifier):
+    assert smtp_verifier.verify("anna@example.com") == STATUS_VALID
+
+def test_smtp_unknown_mailbox_is_invalid(smtp_verifier):
+    assert smtp_verifier.verify("nobody@example.com") == STATUS_INVALID
+
+def test_smtp_catch_all_domain(smtp_verifier):
+    assert smtp_verifier.verify("anyone@catchall.test") == STATUS_CATCH_ALL
+
+def test_smtp_domain_without_mail_server_is_invalid(smtp_verifier):
+    assert smtp_verifier.verify("x@no-mail.test") == STATUS_INVALID
+
+def test_smtp_verify_many(smtp_verifier):
+    results = smtp_verifier.verify_many(["anna@example.com", "nobody@example.com", "anyone@catchall.test", "x@no-mail.test"])
+    assert results == {
+        "anna@example.com": STATUS_VALID,
+        "nobody@example.com": STATUS_INVALID,
+        "anyone@catchall.test": STATUS_CATCH_ALL,
+        "x@no-mail.test": STATUS_INVALID,
+    }
+
+def test_api_result_mapping(fake_api):
+    url = fake_api({
+        "valid@example.com": "valid",
+        "gone@example.com": "invalid",
+        "temp@example.com": "disposable",
+        "any@catchall.test": "catchall",
+        "all@acceptall.test": "accept_all",
+        "who@example.com": "unknown",
+        "odd@example.com": "something_new",
+    })
+    verifier = ApiVerifier(api_url=url, api_key="test", rate_limit=0)
+    assert verifier.verify_many(["valid@example.com", "gone@example.com", "temp@example.com", "any@catchall.test",
+                                 "all@acceptall.test", "who@example.com", "odd@example.com"]) == {
+        "valid@example.com": STATUS_VALID,
+        "gone@example.com": STATUS_INVALID,
+        "temp@example.com": STATUS_INVALID,
+        "any@catchall.test": STATUS_CATCH_ALL,
+        "all@acceptall.test": STATUS_CATCH_ALL,
+        "who@example.com": STATUS_NO_RESULT,
+        "odd@example.com": STATUS_NO_RESULT,
+    }
+
+def test_api_blocking_verify(fake_api):
+    verifier = ApiVerifier(api_url=fake_api({"valid@example.com": "valid"}), api_key="test", rate_limit=0)
+    verifier.open()
+    try:
+        assert verifier.verify("valid@example.com") == STATUS_VALID
+    finally:
+        verifier.close()
+
+def test_api_throttle_is_search_limit(fake_api):
+    verifier = ApiVerifier(api_url=fake_api({"valid@example.com": "valid"}, throttle_after=1), api_key="test", rate_limit=0)
+    assert verifier.verify("valid@example.com") == STATUS_VALID
+    assert verifier.verify("valid@example.com") == STATUS_SEARCH_LIMIT
+
+def test_get_verifier_by_name():
+    assert isinstance(get_verifier("smtp"), SmtpVerifier)
+    assert isinstance(get_verifier("api", api_url="http://127.0.0.1/check", api_key="test"), ApiVerifier)
+
+def test_get_verifier_unknown_name():
+    with pytest.raises(ValueError, match="Unknown verifier backend 'carrier-pigeon'"):
+        get_verifier("carrier-pigeon")